@@ -3,21 +3,287 @@ This module represents the main entry point for the flask application. It contai
 to endpoints of the web app. Included at the very bottom is also a function that takes in a string parameter representing an 
 SQL query that executes it to retrieve data. This query is based on user-input from the terminal and is currently commented out.
 '''
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session
-
-#This will be used to convert data to a Pandas Data Frame.
-import pandas as pd
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session, abort
+from flask import get_flashed_messages as flask_flashed_messages
+from flask import Response, stream_with_context, make_response
 
 #These functions are imported to ensure modularity and abstraction.
 from functions.crud_functions import *
 
+#This holds the configuration values of the app.
+from functions import settings
+
+#This converts a whole page of entries to ready-to-render values at once.
+from functions.formatting import format_rows
+
+#These compress the responses and serve the fingerprinted, precompressed static assets.
+from functions import compression
+from functions import assets
+
+#This queues new entries when 'INGEST_MODE' is 'queue'.
+from functions.ingest import get_ingest_queue, ingest_stats, IngestQueueFull
+
+#This keeps the 'sales' table in memory when 'HOT_DATASET_ENABLED' is 1.
+from functions.hot_dataset import load_hot_dataset, hot_dataset_stats
+
+#This caches the encoded bodies of the JSON endpoints.
+from functions.query_cache import cached_call, tracked_call
+
+#This builds Arrow and Parquet versions of query results.
+from functions import columnar
+
 #This will be used to format dates to ensure consistency within the database.
-from datetime import datetime
+from datetime import date, datetime
+
+#These are used to write the CSV export.
+import csv
+import io
+
+#This is used to build decorators for the routes.
+import functools
 
+#These are used to time requests and to write the sampled request logs.
+import time
+import random
+import logging
+
+#This collects the performance metrics exposed at '/metrics'.
+from functions import metrics
+
+#These signals are sent by Flask around every template render.
+from flask import g, before_render_template, template_rendered
+
+#This builds the JSON provider chosen in 'settings.py' (orjson or Flask's own encoder).
+from functions.json_encoding import create_json_provider
+
+#This is used to make a session key when none is configured.
+import secrets
+
+#These keep the compiled templates on disk between starts.
+import os
+from jinja2 import FileSystemBytecodeCache
+
+#This holds the identity and the counters of the worker process handling the requests (see 'serve.py').
+from functions import workers
 
 #This represents an instance of a Flask web application.
 app = Flask(__name__)
-app.secret_key = "MyVerySecretKey"
+app.json = create_json_provider(app)
+
+#The compiled templates are kept in 'TEMPLATE_CACHE_DIR', so a new process loads them instead of compiling them again.
+#Jinja checks the source of every template against its cached copy, so an edited template is compiled again.
+if settings.TEMPLATE_CACHE_DIR:
+    template_cache_dir = os.path.join(app.root_path, settings.TEMPLATE_CACHE_DIR)
+    os.makedirs(template_cache_dir, exist_ok = True)
+    app.jinja_options = {**app.jinja_options, 'bytecode_cache': FileSystemBytecodeCache(template_cache_dir)}
+
+#The session cookie is signed with 'SECRET_KEY'. Without it, a random key is made when the app is loaded. The workers of
+#'serve.py' are forked after the app is loaded, so they all share the same key either way.
+app.secret_key = settings.SECRET_KEY or secrets.token_hex(32)
+
+#Log messages are written as 'key=value' pairs so they can be searched and parsed by log tools. The process id tells the
+#workers of 'serve.py' apart.
+logging.basicConfig(level = settings.LOG_LEVEL,
+                    format = '%(asctime)s level=%(levelname)s pid=%(process)d logger=%(name)s %(message)s')
+logger = logging.getLogger('app')
+
+#This is the cookie holding the time until which a user's reads go to the primary database, after their own write. It is kept
+#out of the session: reading the session makes Flask add 'Vary: Cookie' to the response, which keeps shared caches (a CDN or
+#a proxy) from storing the pages, so plain reads never touch it.
+PRIMARY_UNTIL_COOKIE = 'primary_until'
+
+#This function returns the time saved in the cookie above. The cookie isn't signed, so it can't pin the reads to the primary
+#for longer than 'READ_YOUR_WRITES_SECONDS' from now.
+def primary_until():
+    try:
+        until = float(request.cookies.get(PRIMARY_UNTIL_COOKIE, 0))
+    except ValueError:
+        return None
+    return min(until, time.time() + settings.READ_YOUR_WRITES_SECONDS)
+
+#This starts the timer and the database totals of every request. Right after a user's own write, their reads go to the
+#primary database instead of a replica.
+@app.before_request
+def start_timer():
+    g.request_started = time.perf_counter()
+    metrics.start_request()
+    pin_reads_until(primary_until())
+
+#This records the duration of every request, with the time it spent in MySQL and the number of rows it fetched.
+#Only a sample of the requests is logged (set by 'LOG_SAMPLE_RATE'), but slow requests are always logged.
+@app.after_request
+def record_request(response):
+    if written_until() is not None:
+        response.set_cookie(PRIMARY_UNTIL_COOKIE, '%.3f' % written_until(), max_age = int(settings.READ_YOUR_WRITES_SECONDS) + 1,
+                            httponly = True, samesite = 'Lax')
+
+    started = g.pop('request_started', None)
+    if started is None:
+        return response
+    workers.count_request()
+    duration = time.perf_counter() - started
+    endpoint = request.endpoint or 'none'
+    totals = metrics.request_totals()
+
+    metrics.request_duration.observe(duration, request.method, endpoint, response.status_code)
+    metrics.request_db_duration.observe(totals['db_seconds'], endpoint)
+    metrics.request_db_rows.observe(totals['rows'], endpoint)
+
+    if duration >= settings.LOG_SLOW_REQUEST or random.random() < settings.LOG_SAMPLE_RATE:
+        logger.info('event=request method=%s path="%s" endpoint=%s status=%s duration_ms=%.1f db_ms=%.1f queries=%d rows=%d',
+                    request.method, request.full_path.rstrip('?'), endpoint, response.status_code, duration * 1000,
+                    totals['db_seconds'] * 1000, totals['queries'], totals['rows'])
+    return response
+
+#This compresses the response if the client accepts it (see 'functions/compression.py'). It is registered after
+#'record_request()', so it runs before it and the compression is part of the recorded duration.
+@app.after_request
+def compress(response):
+    return compression.compress_response(response, request.accept_encodings)
+
+#The templates link to the static assets with 'asset_url()', which gives their fingerprinted copy if the assets were built
+#with 'python -m functions.assets --build'. Those copies are sent precompressed, with far-future cache headers.
+asset_manifest = assets.Manifest.load(app.static_folder)
+
+@app.template_global()
+def asset_url(filename):
+    return url_for('static', filename = asset_manifest.path(filename))
+
+def static_file(filename):
+    return assets.send_asset(app, asset_manifest, filename)
+
+app.view_functions['static'] = static_file
+
+#The pages show the flashed messages, which are kept in the session. A browser without a session cookie has none, so the
+#session isn't read (see 'PRIMARY_UNTIL_COOKIE' above) and the page stays cacheable.
+@app.template_global()
+def get_flashed_messages(with_categories = False, category_filter = ()):
+    if app.config['SESSION_COOKIE_NAME'] not in request.cookies:
+        return []
+    return flask_flashed_messages(with_categories, category_filter)
+
+#These record how long each template takes to render.
+@before_render_template.connect_via(app)
+def start_template_timer(sender, template, context, **extra):
+    g.template_started = time.perf_counter()
+
+@template_rendered.connect_via(app)
+def record_template(sender, template, context, **extra):
+    started = g.pop('template_started', None)
+    if started is not None:
+        metrics.template_duration.observe(time.perf_counter() - started, template.name or 'none')
+
+#The state of the connection pool and the query cache are read when the metrics are rendered.
+metrics.registry.register(metrics.CallbackGauge('db_pool', 'State of the database connection pool.', 'stat', pool_stats))
+metrics.registry.register(metrics.CallbackGauge('query_cache', 'State of the query cache.', 'stat', query_cache.stats))
+metrics.registry.register(metrics.CallbackGauge('ingest_queue', 'State of the ingestion queue.', 'stat', ingest_stats))
+metrics.registry.register(metrics.CallbackGauge('hot_dataset', 'Size and state of the in-memory sales table.', 'stat',
+                                                hot_dataset_stats))
+metrics.registry.register(metrics.CallbackGauge('worker', 'Identity and counters of this worker process.', 'stat',
+                                                workers.worker_stats))
+
+#This decorator adds an ETag, a Last-Modified header and a Cache-Control header to the responses of a JSON endpoint.
+#The ETag is built from the version of the 'sales' table (which goes up on every write) and the requested URL, so if the
+#client already has the current version of the page, it is answered with '304 Not Modified' before MySQL is touched.
+#Every parameter of the data endpoints is in the URL, so the same URL always gives the same data for a given version.
+def conditional():
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+
+            #The version is read before the data, so a write happening in between can only make the ETag older, never newer.
+            etag = sales_version.etag(request.full_path)
+            last_modified = sales_version.last_modified
+
+            #The client may have a compressed copy of the page, whose ETag ends with its encoding (ie. '-gzip').
+            matched = None
+            if request.if_none_match:
+                matched = compression.matching_etag(request.if_none_match, etag)
+                not_modified = matched is not None
+            else:
+                not_modified = request.if_modified_since is not None and request.if_modified_since >= last_modified
+
+            if not_modified:
+                response = app.response_class(status = 304)
+            else:
+                response, skipped = tracked_call(lambda: make_response(view(*args, **kwargs)))
+                if response.status_code != 200:
+                    return response
+
+                #Data read from a replica that may not have the latest writes yet (see 'QueryCache.skip_store()') might be
+                #older than the version in the ETag, so it is sent without any validator and the client doesn't keep it.
+                if skipped:
+                    response.headers['Cache-Control'] = 'no-store'
+                    return response
+
+            response.set_etag(matched or etag)
+            response.last_modified = last_modified
+            response.headers['Cache-Control'] = settings.CACHE_CONTROL
+            return response
+        return wrapper
+    return decorator
+
+#This decorator keeps the encoded body of a JSON endpoint's responses in the query cache, under the requested URL, so asking
+#for the same page again sends the same bytes without reading the database or encoding the page again. The bodies of
+#'filtered' endpoints are only removed by writes within their date range, the others by every write.
+def cached_body(filtered = False):
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if not settings.QUERY_CACHE_ENABLED:
+                return view(*args, **kwargs)
+
+            date_range = None
+            if filtered:
+                start_date, end_date = date_range_args()
+                if start_date is not None:
+                    date_range = (start_date, end_date)
+
+            #Only successful JSON responses are stored (not redirects or errors).
+            response = None
+            def render():
+                nonlocal response
+                response = make_response(view(*args, **kwargs))
+                if response.status_code == 200 and response.mimetype == app.json.mimetype:
+                    return response.get_data()
+                return None
+
+            body = cached_call(('body', request.full_path), render, date_range, cache_none = False)
+            if response is None:
+                response = app.response_class(body, mimetype = app.json.mimetype)
+            return response
+        return wrapper
+    return decorator
+
+#This helper function reads the optional 'start_date' and 'end_date' parameters from the URL.
+#Both dates have to be given as YYYY-MM-DD, or neither of them, and the start date can't be after the end date.
+#Otherwise a 400 error is returned.
+def date_range_args():
+    start_date = request.args.get('start_date')
+    end_date = request.args.get('end_date')
+    if (start_date is None) != (end_date is None):
+        abort(400)
+    if start_date is None:
+        return None, None
+    try:
+        start_date, end_date = date.fromisoformat(start_date), date.fromisoformat(end_date)
+    except ValueError:
+        abort(400)
+    if start_date > end_date:
+        abort(400)
+    return start_date, end_date
+
+#This helper function keeps old links working. The date range used to be stored in the session instead of the URL, so if a
+#filtered page is opened without dates, it redirects to the same page with the session dates added to the URL.
+#If there are no dates in the session either, a 400 error is returned.
+def session_redirect(endpoint):
+    start_date = session.get('start_date')
+    end_date = session.get('end_date')
+    if not start_date or not end_date:
+        abort(400)
+    params = request.args.to_dict()
+    params.update(start_date = start_date, end_date = end_date)
+    return redirect(url_for(endpoint, **params))
 
 #Below are the routes/decorators used to register a view function for a given URL rule.
 
@@ -25,34 +291,26 @@ app.secret_key = "MyVerySecretKey"
 @app.route("/")
 def home():
 
-    #This variable represents every single entry in the 'sales' table.
-    all_sales = all_entries()
-
     #---------------------
     '''
     These variables will help implement pagination to avoid slowing down the web app when
-    attempting to display all entries from the database.
+    attempting to display all entries from the database. Only the entries on the current page
+    are fetched from the database, together with a count of all entries.
 
     '''
     #---------------------
 
     #This gets the current page, if no value provided the default is 1.
-    page = request.args.get('page', 1, type = int)
+    page = max(request.args.get('page', 1, type = int), 1)
 
     #This represents the number of entries shown per page.
     per_page = 25 
 
-    #This represents the starting index for entries being displayed.
-    start = (page - 1) * per_page 
-
-    #Similarly, this is the ending index for entries being displayed.
-    end = start + per_page
+    #This represents the entries displayed within a page, with their values already formatted for the template.
+    items_on_page = format_rows(entries_page(page, per_page))
 
     #This variable represents the minimum number of pages needed to display all of the entries.
-    total_pages = (len(all_sales) + per_page - 1) // per_page
-
-    #This represents the entries displayed within a page.
-    items_on_page = all_sales[start:end]
+    total_pages = (count_entries() + per_page - 1) // per_page
 
     #Render 'hmtl' template with given parameters to keep track of current pages.
     return render_template('home.html', items_on_page = items_on_page, 
@@ -68,40 +326,142 @@ def select_by_date():
         start_date = request.form['start_date']
         end_date = request.form['end_date']
 
-        #Store start_date and end_date in session for later use.
-        session['start_date'] = start_date
-        session['end_date'] = end_date
+        #If the dates are missing or in the wrong order, you will be given a flash message and redirected to the home page.
+        try:
+            if parse_input_date(start_date) > parse_input_date(end_date):
+                flash('The start date must be before the end date!')
+                return redirect(url_for('home'))
+        except ValueError:
+            flash('Please select a valid start date and end date!')
+            return redirect(url_for('home'))
 
-        #Redirect with given date parameters.
+        #Redirect with given date parameters. The dates are carried in the URL (not in the session), so the filtered
+        #pages can be bookmarked, shared and cached like any other page.
         return redirect(url_for('select_by_date', start_date=start_date, end_date=end_date))
     
     #If you are wanting to retrieve data, this will be a 'GET' method.
     elif request.method == 'GET':
 
-        #Retrieve start_date and end_date from session.
-        start_date = session.get('start_date')
-        end_date = session.get('end_date')
+        #Retrieve start_date and end_date from the URL. Old links without dates are redirected using the session.
+        if 'start_date' not in request.args and 'end_date' not in request.args:
+            if not session.get('start_date'):
+                flash('Please select a start date and end date!')
+                return redirect(url_for('home'))
+            return session_redirect('select_by_date')
+        start_date, end_date = date_range_args()
 
-        #This represents the filtered data.
-        selected_entries = entries_by_date(start_date, end_date)
+        #This represents the number of entries within the filtered data.
+        total_entries = count_entries_by_date(start_date, end_date)
 
         #If there is no data between the selected dates, you will be given a flash message
         #and redirected to the home page.
-        if len(selected_entries) == 0:
+        if total_entries == 0:
             flash('There is no data between these dates!')
             return redirect(url_for('home'))
 
-        #For pagination purposes.
+        #For pagination purposes. Only the current page is fetched from the database.
         per_page = 25
-        total_pages = (len(selected_entries) + per_page - 1) // per_page
-        page = request.args.get('page', 1, type=int)
-        start = (page - 1) * per_page
-        end = min(start + per_page, len(selected_entries))
-        items_on_page = selected_entries[start:end]
+        total_pages = (total_entries + per_page - 1) // per_page
+        page = max(request.args.get('page', 1, type=int), 1)
+        items_on_page = format_rows(entries_by_date_page(start_date, end_date, page, per_page))
 
-        #Render template with current information.
+        #Render template with current information. The dates are needed to build the links to the other pages.
         return render_template('filtered_data.html', items_on_page=items_on_page,
-                               total_pages=total_pages, page=page)
+                               total_pages=total_pages, page=page,
+                               start_date=start_date.isoformat(), end_date=end_date.isoformat())
+
+#These are the parameters of a search, as sent by the search form.
+SEARCH_PARAMS = ('store_code', 'id', 'min_total', 'max_total', 'start_date', 'end_date')
+
+#This helper function reads the filters of a search from the URL. Empty fields are left out, since the search form sends
+#every field. If a filter isn't valid, a ValueError is raised with a message for the user.
+def search_args():
+    values = {name: request.args.get(name, '').strip() for name in SEARCH_PARAMS}
+    if len(values['store_code']) > 32:
+        raise ValueError("The store code can't be longer than 32 characters!")
+    filters = {'store_code': values['store_code'] or None}
+
+    try:
+        filters['id'] = int(values['id']) if values['id'] else None
+    except ValueError:
+        raise ValueError("The ID must be a whole number!")
+
+    try:
+        filters['min_total'] = parse_total_sale(values['min_total']) if values['min_total'] else None
+        filters['max_total'] = parse_total_sale(values['max_total']) if values['max_total'] else None
+    except ArithmeticError:
+        raise ValueError("The amounts must be numbers!")
+    if filters['min_total'] is not None and filters['max_total'] is not None and filters['min_total'] > filters['max_total']:
+        raise ValueError("The minimum amount must not be more than the maximum amount!")
+
+    filters['start_date'] = parse_input_date(values['start_date']) if values['start_date'] else None
+    filters['end_date'] = parse_input_date(values['end_date']) if values['end_date'] else None
+    if filters['start_date'] is not None and filters['end_date'] is not None and filters['start_date'] > filters['end_date']:
+        raise ValueError("The start date must be before the end date!")
+    return filters
+
+#This helper function retrieves one page of search results, with the number of results (see 'count_search()') and the links
+#to the previous and next pages. If the 'after' cursor in the URL isn't valid, a 400 error is returned.
+def search_page(filters, page, per_page):
+    try:
+        items_on_page = search_entries(page = page, per_page = per_page, after = request.args.get('after'), **filters)
+    except ValueError:
+        abort(400)
+    total, more = count_search(limit = settings.SEARCH_COUNT_LIMIT, **filters)
+
+    #One result more than 'per_page' is read when there is a next page.
+    has_next = len(items_on_page) > per_page
+    items_on_page = items_on_page[:per_page]
+    next_cursor = search_cursor(items_on_page[-1], search_order(**filters)) if has_next else None
+    params = {name: request.args[name] for name in SEARCH_PARAMS if request.args.get(name, '').strip()}
+    links = page_links(request.endpoint, page, page + 1 if has_next else page, next_cursor, **params)
+    return items_on_page, total, more, links
+
+#This route will search the entries by store code prefix, ID, amount and date (every filter is optional).
+#The results are listed by store, date or amount depending on the filters given (see 'search_order()').
+#Example: /search?store_code=TX&min_total=500&start_date=2023-02-01&end_date=2023-02-28
+@app.route("/search", methods = ['GET'])
+def search():
+    try:
+        filters = search_args()
+    except ValueError as error:
+        flash(str(error))
+        return redirect(url_for('home'))
+
+    #For pagination. The 'Next' link starts right after the last result of this page.
+    per_page = 25
+    page = max(request.args.get('page', 1, type=int), 1)
+    items_on_page, total, more, links = search_page(filters, page, per_page)
+    total_pages = max((total + per_page - 1) // per_page, 1) if total is not None else None
+
+    #The search form is filled in with the current filters.
+    return render_template('search.html', items_on_page = format_rows(items_on_page), page = page,
+                           total = total, more = more, total_pages = total_pages, links = links,
+                           search = {name: request.args.get(name, '') for name in SEARCH_PARAMS})
+
+#This route will return search results as a JSON dictionary. It takes the same parameters as '/search', and 'per_page'.
+@app.route("/as_jsondict_search", methods = ['GET'])
+@conditional()
+@cached_body()
+def as_jsondict_search():
+    try:
+        filters = search_args()
+    except ValueError:
+        abort(400)
+
+    page = max(request.args.get('page', 1, type=int), 1)
+    items_on_page, total, more, links = search_page(filters, page, page_size())
+
+    #'total results' is exact unless 'more results' is true, in which case there are more than that. It is null for searches
+    #that can't be counted quickly (amounts together with a store code or dates).
+    return jsonify({
+        'data': items_on_page,
+        'order': search_order(**filters),
+        'total results': total,
+        'more results': more,
+        'current page': page,
+        'links': links
+    })
 
 #This route will allow the addition of a new entry or row to the MySQL database.
 @app.route("/add_entry", methods = ['POST'])
@@ -111,6 +471,22 @@ def add():
     total_sale = request.form['total_sale']
     transaction_date = request.form['transaction_date']
 
+    #In queue mode, the entry is only checked and queued here. It is written to the database a moment later, together with
+    #the other entries queued around the same time. If the queue is full, the client is asked to try again later.
+    if settings.INGEST_MODE == 'queue':
+        try:
+            get_ingest_queue().submit({'id': id, 'store_code': store_code, 'total_sale': total_sale,
+                                       'transaction_date': transaction_date})
+        except ValueError as error:
+            flash(str(error))
+            return redirect(url_for('home'))
+        except IngestQueueFull:
+            response = make_response('Too many entries are waiting to be written, please try again.', 503)
+            response.headers['Retry-After'] = '1'
+            return response
+        flash('Your Entry Has Been Received And Will Appear In The Database Shortly!')
+        return redirect(url_for('home'))
+
     #This variable essentially represents whether or not an entry was added successfully.
     add_result = add_entry(id, store_code, total_sale, transaction_date)
 
@@ -124,6 +500,15 @@ def add():
         flash('Your Entry Cannot Be Added To The Database At This Time...')
         return redirect(url_for('home'))
     
+#This route returns a single entry as JSON. It is used to fill in the edit modal when it is opened.
+@app.route("/entry/<int:id>", methods = ['GET'])
+@conditional()
+def entry(id):
+    selected_entry = entry_by_id(id)
+    if selected_entry is None:
+        abort(404)
+    return jsonify(format_rows([selected_entry])[0])
+
 #This route will allow an entry to be edited and updated within the database.
 @app.route("/edit_entry", methods = ['GET', 'POST'])
 def edit():
@@ -156,6 +541,131 @@ def delete(id):
             flash('Your Entry Cannot Deleted At This Time...')
             return redirect(url_for('home'))
 
+#This route will stream the whole 'sales' table (or the entries between 'start_date' and 'end_date') as NDJSON or CSV.
+#The rows are read from MySQL and sent to the client in chunks, so memory use stays the same no matter how big the table is.
+#Example: /export?format=csv&start_date=2023-02-01&end_date=2023-02-28
+@app.route("/export", methods = ['GET'])
+def export():
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in ('ndjson', 'csv'):
+        abort(400)
+
+    start_date, end_date = date_range_args()
+    chunks = stream_entries(start_date, end_date, settings.EXPORT_CHUNK_SIZE)
+
+    #This generator turns each chunk of rows into a single piece of text.
+    def generate():
+        if export_format == 'csv':
+            yield 'id,store_code,total_sale,transaction_date\r\n'
+        for rows in chunks:
+            if export_format == 'csv':
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerows((row['id'], row['store_code'], row['total_sale'], row['transaction_date'].isoformat())
+                                 for row in rows)
+                yield buffer.getvalue()
+            else:
+                yield ''.join(app.json.dumps(row) + '\n' for row in rows)
+
+    mimetype = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+    response = Response(stream_with_context(generate()), mimetype = mimetype)
+    response.headers['Content-Disposition'] = 'attachment; filename=sales.' + export_format
+    return response
+
+'''
+These represent routes for adding, editing and deleting many entries with a single request. The rows can be sent either as
+JSON (a list of objects, or an object with an "entries" list) or as CSV with a header line. Each route answers with one
+result per row, in the same order, so you can see which rows were written and why the others were not.
+
+Example: curl -X POST -H "Content-Type: text/csv" --data-binary @sales.csv http://localhost:5000/bulk/add_entries
+'''
+
+#This helper function reads the rows sent to one of the bulk routes. It returns None if the body can't be understood.
+def bulk_payload():
+    if request.mimetype == 'text/csv':
+        text = request.get_data(as_text = True)
+        return list(csv.DictReader(io.StringIO(text)))
+
+    payload = request.get_json(silent = True)
+    if isinstance(payload, dict):
+        payload = payload.get('entries')
+    if isinstance(payload, list):
+        return payload
+    return None
+
+#This helper function builds the response of the bulk routes.
+def bulk_response(results):
+    succeeded = sum(1 for result in results if result['status'] == 'ok')
+    return jsonify({
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded,
+        'results': results
+    })
+
+#This helper function reads the rows of a bulk request and checks their number, stopping the request if they aren't valid.
+def bulk_rows():
+    rows = bulk_payload()
+    if rows is None:
+        abort(400)
+    if len(rows) > settings.BULK_MAX_ROWS:
+        abort(413)
+    return rows
+
+#This route will add many entries at once.
+@app.route("/bulk/add_entries", methods = ['POST'])
+def bulk_add():
+    return bulk_response(add_entries(bulk_rows()))
+
+#This route will edit many entries at once.
+@app.route("/bulk/edit_entries", methods = ['POST'])
+def bulk_edit():
+    return bulk_response(edit_entries(bulk_rows()))
+
+#This route will delete many entries at once. Each row can be just an id, or an object or CSV line with an 'id'.
+@app.route("/bulk/delete_entries", methods = ['POST'])
+def bulk_delete():
+    return bulk_response(delete_entries(bulk_rows()))
+
+#This route will return the number, total and average of the sales, grouped by store and/or by day, week or month.
+#The totals are computed by MySQL, so only the results are sent instead of the whole table.
+#Example: /aggregate?by=store,month&start_date=2023-01-01&end_date=2023-03-31
+@app.route("/aggregate", methods = ['GET'])
+@conditional()
+def aggregate():
+    group_by = [name for name in request.args.get('by', '').split(',') if name]
+
+    #Only 'store' and a single period are allowed.
+    periods = [name for name in group_by if name in PERIODS]
+    if len(periods) > 1 or any(name != 'store' and name not in PERIODS for name in group_by):
+        abort(400)
+
+    start_date, end_date = date_range_args()
+    totals = sales_totals('store' in group_by, periods[0] if periods else None, start_date, end_date)
+
+    return jsonify({
+        'group_by': group_by,
+        'start_date': start_date,
+        'end_date': end_date,
+        'data': totals
+    })
+
+#This route returns the hit, miss and eviction counters of the query cache and the state of the connection pools.
+@app.route("/stats", methods = ['GET'])
+def stats():
+    return jsonify({
+        'query_cache': query_cache.stats(),
+        'connection_pool': pool_stats(),
+        'replicas': replica_stats(),
+        'ingest_queue': ingest_stats(),
+        'hot_dataset': hot_dataset_stats(),
+        'worker': workers.worker_stats()
+    })
+
+#This route returns every performance metric in the Prometheus text format.
+@app.route("/metrics", methods = ['GET'])
+def prometheus_metrics():
+    return Response(metrics.registry.render(), mimetype = 'text/plain; version=0.0.4')
+
 #--------------------------------------------------------------------------------
 '''
 
@@ -173,8 +683,8 @@ HATEOAS enables users to interact with a server using only provided links within
 
 *Basically, it means that APIs can make links to associated resources along the returned data. 
 By embedding links for navigating to previous and next pages within the JSON response, you maintain the stateless principle
-followed by RESTful API's. Granted, I did import 'session' which goes against the stateless principle, but it was only to 
-facilitate pagination for the 'table' data structure which greatly facilitates data manipulation.
+followed by RESTful API's. The date range is also carried in the URL (as 'start_date' and 'end_date'), so every page can be
+bookmarked and cached. The 'session' is only read to redirect old links that don't have the dates in their URL.
 
 '''
 #--------------------------------------------------------------------------------
@@ -199,26 +709,42 @@ def get_data_type():
     #If default option is kept, redirect to 'home'.
     return redirect(url_for('home'))
 
+#This helper function creates the links to the previous and next pages for the JSON endpoints.
+#The 'next' link carries a cursor (the position of the last entry on this page) so that the next page is fetched
+#with a keyset query, which costs the same no matter how deep into the data you are.
+#Any extra parameters (like the date range), and the page size if one was asked for, are added to both links.
+def page_links(endpoint, page, total_pages, next_cursor, **params):
+    if 'per_page' in request.args:
+        params['per_page'] = page_size()
+    links = {}
+    if page > 1:
+        links['prev'] = url_for(endpoint, page=page-1, **params)
+    if page < total_pages and next_cursor is not None:
+        links['next'] = url_for(endpoint, page=page+1, after=next_cursor, **params)
+    return links
+
+#This helper function returns the number of entries per page of a JSON or Arrow page. It is 50 unless the 'per_page'
+#parameter asks for another size (ie. for exports), up to 'BULK_MAX_ROWS'.
+def page_size():
+    return min(max(request.args.get('per_page', 50, type=int), 1), settings.BULK_MAX_ROWS)
+
 #This route will allow data to be represented as a JSON dictionary if no date parameters are given.
 @app.route("/as_jsondict", methods=['GET'])
+@conditional()
+@cached_body()
 def as_jsondict():
 
-    #Retrieve all entries from database.
-    all_data = all_entries()
+    #For pagination. If an 'after' cursor is given, the page starts right after that 'id'.
+    page = max(request.args.get('page', 1, type=int), 1)
+    after_id = request.args.get('after', type=int)
+    per_page = page_size()
 
-    #For pagination.
-    page = request.args.get('page', 1, type=int)
-    per_page = 50
-    start = (page - 1) * per_page 
-    end = start + per_page
-    items_on_page = all_data[start:end]
-    total_pages = (len(all_data) + per_page - 1) // per_page
+    #Retrieve only the entries on this page from the database.
+    items_on_page = entries_page(page, per_page, after_id)
+    total_pages = (count_entries() + per_page - 1) // per_page
 
-    links = {}
-    if page > 1:
-        links['prev'] = url_for('as_jsondict', page=page-1)
-    if page < total_pages:
-        links['next'] = url_for('as_jsondict', page=page+1)
+    next_cursor = items_on_page[-1]['id'] if items_on_page else None
+    links = page_links('as_jsondict', page, total_pages, next_cursor)
 
     #This will return a JSON dict containing each of our entries (as JSON dicts) as well as other information about the page.
     response = {
@@ -233,27 +759,22 @@ def as_jsondict():
     
 #This route will allow data to be represented as a list if no date parameters are given.
 @app.route("/as_list", methods = ['GET'])
+@conditional()
+@cached_body()
 def as_list():
 
-    #Retrieve all entries from database.
-    all_data = all_entries()
-
     #For pagination.
-    page = request.args.get('page', 1, type=int)
-    per_page = 50
-    start = (page - 1) * per_page 
-    end = start + per_page
-    items_on_page = all_data[start:end]
+    page = max(request.args.get('page', 1, type=int), 1)
+    after_id = request.args.get('after', type=int)
+    per_page = page_size()
 
-    #This line converts the data to lists.
-    items_on_page = [list(entry.values()) for entry in items_on_page]
-    total_pages = (len(all_data) + per_page - 1) // per_page
+    #Retrieve only the entries on this page from the database, as (id, store_code, total_sale, transaction_date) tuples
+    #which are written as lists.
+    items_on_page = entries_page_tuples(page, per_page, after_id)
+    total_pages = (count_entries() + per_page - 1) // per_page
 
-    links = {}
-    if page > 1:
-        links['prev'] = url_for('as_list', page=page-1)
-    if page < total_pages:
-        links['next'] = url_for('as_list', page=page+1)
+    next_cursor = items_on_page[-1][0] if items_on_page else None
+    links = page_links('as_list', page, total_pages, next_cursor)
 
     #This makes a dictionary with our data and other information.
     response = {
@@ -267,29 +788,33 @@ def as_list():
     return jsonify(response)
     
 
+#Pandas takes about half a second to import and only the two DataFrame routes use it, so it is imported the first time one
+#of them is called instead of when the app starts ('PRELOAD_PANDAS' imports it in 'create_app()' instead).
+def load_pandas():
+    import pandas
+    return pandas
+
 #This route will allow data to be represented as a Pandas dataframe if no date parameters are given.
 @app.route("/as_pandasdf", methods = ['GET'])
+@conditional()
+@cached_body()
 def as_pandasdf():
 
-    #Retrieve all entries from database.
-    all_data = pd.DataFrame(all_entries())
-
     #For pagination.
-    page = request.args.get('page', 1, type=int)
-    per_page = 50
+    page = max(request.args.get('page', 1, type=int), 1)
+    after_id = request.args.get('after', type=int)
+    per_page = page_size()
     start = (page - 1) * per_page
-    end = start + per_page
 
-    #Iloc is integer-location based indexing for selection by position. 
-    #I am using it here to slice the DataFrame and get all rows within the specified range.
-    items_on_page = all_data.iloc[start:end]
-    total_pages = (len(all_data) + per_page - 1) // per_page
+    #Retrieve only the entries on this page from the database. The index keeps the position of each entry
+    #within the whole table, just like slicing the full DataFrame with 'iloc' did.
+    page_entries = entries_page(page, per_page, after_id)
+    pd = load_pandas()
+    items_on_page = pd.DataFrame(page_entries, index=range(start, start + len(page_entries)))
+    total_pages = (count_entries() + per_page - 1) // per_page
 
-    links = {}
-    if page > 1:
-        links['prev'] = url_for('as_pandasdf', page=page-1)
-    if page < total_pages:
-        links['next'] = url_for('as_pandasdf', page=page+1)
+    next_cursor = page_entries[-1]['id'] if page_entries else None
+    links = page_links('as_pandasdf', page, total_pages, next_cursor)
 
     
     #--------------------
@@ -313,6 +838,38 @@ def as_pandasdf():
     #This will return a JSON dict containing our data as well as other information about the page like links.
     return jsonify(response)
 
+#This route will return data in a columnar binary format that pandas and Arrow can load without parsing:
+#'format=arrow' (the default) gives an Arrow IPC stream and 'format=parquet' gives a Parquet file.
+#If 'start_date' and 'end_date' are given, every entry within that range is returned. Otherwise one page is returned,
+#using 'page', 'per_page' and the optional 'after' cursor like the JSON endpoints (the next cursor is in the 'X-Next-After' header).
+#Example (in Python): pd.read_parquet(io.BytesIO(requests.get(url + '/as_arrow?format=parquet').content))
+@app.route("/as_arrow", methods = ['GET'])
+@conditional()
+def as_arrow():
+    if not columnar.available():
+        abort(501)
+
+    table_format = request.args.get('format', 'arrow')
+    if table_format not in columnar.MIMETYPES:
+        abort(400)
+
+    next_cursor = None
+    start_date, end_date = date_range_args()
+    if start_date is not None:
+        rows = entries_by_date_tuples(start_date, end_date)
+    else:
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = page_size()
+        rows = entries_page_tuples(page, per_page, request.args.get('after', type=int))
+        if len(rows) == per_page:
+            next_cursor = rows[-1][0]
+
+    response = Response(columnar.encode_table(columnar.sales_table(rows), table_format),
+                        mimetype = columnar.MIMETYPES[table_format])
+    if next_cursor is not None:
+        response.headers['X-Next-After'] = str(next_cursor)
+    return response
+
 '''
 These represent routes for when date parameters are given (gdp = given date parameters).
 '''
@@ -320,47 +877,56 @@ These represent routes for when date parameters are given (gdp = given date para
 @app.route("/get_data_type_gdp", methods = ['POST'])
 def get_data_type_gdp():
 
-    #Get selected data type.
+    #Get selected data type, and the date range of the page the form was sent from.
     data_type = request.form['data_type']
+    dates = {}
+    if request.form.get('start_date') and request.form.get('end_date'):
+        dates = {'start_date': request.form['start_date'], 'end_date': request.form['end_date']}
 
     #Redirect based on chosen data type.
     if data_type == 'json_dict':
-        return redirect(url_for('as_jsondict_gdp'))
+        return redirect(url_for('as_jsondict_gdp', **dates))
 
     if data_type == 'list':
-        return redirect(url_for('as_list_gdp'))
+        return redirect(url_for('as_list_gdp', **dates))
 
     if data_type == 'pandasdf':
-        return redirect(url_for('as_pandasdf_gdp'))
+        return redirect(url_for('as_pandasdf_gdp', **dates))
     
     #If default option is kept, redirect to 'select_by_date' page where you can see filtered data.
-    return redirect(url_for('select_by_date'))
+    return redirect(url_for('select_by_date', **dates))
+
 
+#This helper function retrieves one page of filtered data with 'read' ('entries_by_date_page()' by default).
+#If the 'after' cursor in the URL isn't valid, a 400 error is returned.
+def filtered_page(start_date, end_date, page, per_page, read = entries_by_date_page):
+    try:
+        return read(start_date, end_date, page, per_page, request.args.get('after'))
+    except ValueError:
+        abort(400)
 
 #This route will allow data to be represented as a JSON dictionary if given date parameters.
 @app.route("/as_jsondict_gdp", methods = ['POST','GET'])
+@conditional()
+@cached_body(filtered = True)
 def as_jsondict_gdp():
 
-    #Retrieve start_date and end_date from session.
-    start_date = session.get('start_date')
-    end_date = session.get('end_date')
+    #Retrieve start_date and end_date from the URL. Old links without dates are redirected using the session.
+    start_date, end_date = date_range_args()
+    if start_date is None:
+        return session_redirect('as_jsondict_gdp')
 
-    # Retrieve data based on the specified date range
-    filtered_data = entries_by_date(start_date, end_date)
+    #For pagination. If an 'after' cursor is given, the page starts right after that entry.
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = page_size()
 
-    #For pagination.
-    page = request.args.get('page', 1, type=int)
-    per_page = 50
-    start = (page - 1) * per_page 
-    end = start + per_page
-    items_on_page = filtered_data[start:end]
-    total_pages = (len(filtered_data) + per_page - 1) // per_page
+    # Retrieve only the entries on this page within the specified date range
+    items_on_page = filtered_page(start_date, end_date, page, per_page)
+    total_pages = (count_entries_by_date(start_date, end_date) + per_page - 1) // per_page
 
-    links = {}
-    if page > 1:
-        links['prev'] = url_for('as_jsondict_gdp', page=page-1)
-    if page < total_pages:
-        links['next'] = url_for('as_jsondict_gdp', page=page+1)
+    next_cursor = date_cursor(items_on_page[-1]) if items_on_page else None
+    links = page_links('as_jsondict_gdp', page, total_pages, next_cursor,
+                       start_date=start_date.isoformat(), end_date=end_date.isoformat())
 
     #This will return a JSON dict containing each of our entries (as JSON dicts) as well as other information about the page.
     response = {
@@ -375,31 +941,26 @@ def as_jsondict_gdp():
 
 #This route will allow data to be represented as a list if given date parameters..
 @app.route("/as_list_gdp", methods = ['GET'])
+@conditional()
+@cached_body(filtered = True)
 def as_list_gdp():
 
-    #Retrieve start_date and end_date from session.
-    start_date = session.get('start_date')
-    end_date = session.get('end_date')
-
-    # Retrieve data based on the specified date range
-    filtered_data = entries_by_date(start_date, end_date)
+    #Retrieve start_date and end_date from the URL. Old links without dates are redirected using the session.
+    start_date, end_date = date_range_args()
+    if start_date is None:
+        return session_redirect('as_list_gdp')
 
     #For pagination.
-    page = request.args.get('page', 1, type=int)
-    per_page = 50
-    start = (page - 1) * per_page 
-    end = start + per_page
-    items_on_page = filtered_data[start:end]
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = page_size()
 
-    #This line converts the data to lists.
-    items_on_page = [list(entry.values()) for entry in items_on_page]
-    total_pages = (len(filtered_data) + per_page - 1) // per_page
+    # Retrieve only the entries on this page within the specified date range, as tuples which are written as lists.
+    items_on_page = filtered_page(start_date, end_date, page, per_page, entries_by_date_page_tuples)
+    total_pages = (count_entries_by_date(start_date, end_date) + per_page - 1) // per_page
 
-    links = {}
-    if page > 1:
-        links['prev'] = url_for('as_list_gdp', page=page-1)
-    if page < total_pages:
-        links['next'] = url_for('as_list_gdp', page=page+1)
+    next_cursor = date_cursor(items_on_page[-1]) if items_on_page else None
+    links = page_links('as_list_gdp', page, total_pages, next_cursor,
+                       start_date=start_date.isoformat(), end_date=end_date.isoformat())
 
     #This makes a dictionary with our data and other information.
     response = {
@@ -414,31 +975,30 @@ def as_list_gdp():
 
 #This route will allow data to be represented as a Pandas dataframe if given date parameters..
 @app.route("/as_pandasdf_gdp", methods = ['GET'])
+@conditional()
+@cached_body(filtered = True)
 def as_pandasdf_gdp():
 
-    #Retrieve start_date and end_date from session.
-    start_date = session.get('start_date')
-    end_date = session.get('end_date')
-
-    #Retrieve all entries from database.
-    filtered_data = pd.DataFrame(entries_by_date(start_date, end_date))
+    #Retrieve start_date and end_date from the URL. Old links without dates are redirected using the session.
+    start_date, end_date = date_range_args()
+    if start_date is None:
+        return session_redirect('as_pandasdf_gdp')
 
     #For pagination.
-    page = request.args.get('page', 1, type=int)
-    per_page = 50
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = page_size()
     start = (page - 1) * per_page
-    end = start + per_page
 
-    #Iloc is integer-location based indexing for selection by position. 
-    #I am using it here to slice the DataFrame and get all rows within the specified range.
-    items_on_page = filtered_data.iloc[start:end]
-    total_pages = (len(filtered_data) + per_page - 1) // per_page
+    #Retrieve only the entries on this page within the specified date range. The index keeps the position of each
+    #entry within the whole filtered data.
+    page_entries = filtered_page(start_date, end_date, page, per_page)
+    pd = load_pandas()
+    items_on_page = pd.DataFrame(page_entries, index=range(start, start + len(page_entries)))
+    total_pages = (count_entries_by_date(start_date, end_date) + per_page - 1) // per_page
 
-    links = {}
-    if page > 1:
-        links['prev'] = url_for('as_pandasdf_gdp', page=page-1)
-    if page < total_pages:
-        links['next'] = url_for('as_pandasdf_gdp', page=page+1)
+    next_cursor = date_cursor(page_entries[-1]) if page_entries else None
+    links = page_links('as_pandasdf_gdp', page, total_pages, next_cursor,
+                       start_date=start_date.isoformat(), end_date=end_date.isoformat())
 
     #This makes a dictionary with our data and other information.
     response = {
@@ -452,36 +1012,30 @@ def as_pandasdf_gdp():
     return jsonify(response)
 
 
-'''
-These are Jinja2 filters for parsing through 'html' dates.
-
-'''
-
-#This is a custom Jinja2 filter designed to parse and format the 'total_sale' values in order to maintain consistency.
-@app.template_filter('parse_total_sale')
-def parse_total_sale(total_sale):
-    
-    # Remove non-numeric characters from the string
-    total_sale = ''.join(c for c in total_sale if c.isdigit() or c == '.')
-
-    # Convert the cleaned-up string to a floating-point number
-    total_sale = float(total_sale)
-
-    return total_sale
-
-#This is a custom Jinja2 filter designed to parse and format the 'transaction_date' values in order to maintain consistency.
-@app.template_filter('format_date')
-def format_date(date_str):
-
-    # Convert the date string to a datetime object
-    transaction_date = datetime.strptime(date_str, "%m/%d/%Y")
-    # Format the datetime object as a string in "yyyy-mm-dd" format
-    transaction_date = transaction_date.strftime("%Y-%m-%d")
-    return transaction_date
-
-#This will run the app.
+#This function returns the app, ready to serve. It is the entry point used by 'serve.py' and by WSGI servers
+#(ie. 'gunicorn "app:create_app()"'). The templates are compiled here (or loaded from 'TEMPLATE_CACHE_DIR') rather than on
+#their first request, so the worker processes forked afterwards share them in memory instead of each compiling them.
+def create_app():
+    if not settings.SECRET_KEY:
+        logger.warning("event=secret_key status=random message=\"Set SECRET_KEY so sessions survive a restart\"")
+    started = time.perf_counter()
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+
+    #The routes are compiled into a matcher on the first request otherwise.
+    app.url_map.update()
+    if settings.PRELOAD_PANDAS:
+        load_pandas()
+
+    #The 'sales' table is loaded into memory before the workers of 'serve.py' are forked, so they share it.
+    load_hot_dataset()
+    logger.info("event=warm_up templates=%d duration_ms=%.1f", len(app.jinja_env.list_templates()),
+                (time.perf_counter() - started) * 1000)
+    return app
+
+#This will run the app with the development server. Use 'serve.py' to run it with several worker processes.
 if __name__ == "__main__":
-    app.run()
+    create_app().run()
 
 # #This function takes in a SQL query and executes it to retrieve data.
 # def execute_query(sql_query):
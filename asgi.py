@@ -0,0 +1,39 @@
+'''
+This module is the ASGI entry point of the app. The 'APP_MODE' setting decides which app is served:
+
+    - 'sync' (the default): the Flask app from 'app.py', wrapped so it can run on an ASGI server.
+    - 'async': the Quart app from 'async_app.py', whose data endpoints use an asyncio connection pool. The routes it
+      doesn't have (the HTML pages, the exports, the bulk and search routes...) are served by the Flask app, so switching
+      the mode changes how the data endpoints are served, not what the app offers.
+
+Run it with any ASGI server, for example:
+
+    APP_MODE=async hypercorn asgi:app --bind 0.0.0.0:5000
+
+Both modes need the packages of 'requirements-async.txt' (pip install -r requirements-async.txt): 'asgiref' adapts the
+Flask app to ASGI, and the async mode also needs Quart and aiomysql.
+'''
+from functions import settings
+
+#This adapter runs the WSGI Flask app on an ASGI server, using a thread per request like the WSGI servers do.
+try:
+    from asgiref.wsgi import WsgiToAsgi
+except ImportError:
+    raise ImportError("Serving the app on an ASGI server needs the 'asgiref' package: pip install -r requirements-async.txt "
+                      "(or run it with 'python serve.py').") from None
+
+from app import app as flask_app
+sync_app = WsgiToAsgi(flask_app)
+
+if settings.APP_MODE == 'async':
+    from async_app import app as async_app, handles
+
+    #The requests for a route of the async app go to it, and every other request goes to the Flask app. The lifespan
+    #events (which open and close the asyncio connection pool) go to the async app.
+    async def app(scope, receive, send):
+        if scope['type'] == 'http' and not handles(scope['path'], scope['method']):
+            await sync_app(scope, receive, send)
+        else:
+            await async_app(scope, receive, send)
+else:
+    app = sync_app
@@ -0,0 +1,202 @@
+'''
+This module represents the async mode of the app. It serves the busiest endpoints of 'app.py' (the JSON pages, single
+entries and the add/edit/delete routes), with the same responses, but as coroutines running on an ASGI server, so a single
+worker process can keep many MySQL queries in flight at once instead of being limited to one query per thread.
+
+It uses Quart, which has the same API as Flask, and the aiomysql-backed functions of 'functions/async_crud.py'.
+Every other route (the HTML pages, the exports, the aggregates, the bulk and search routes...) is still served by the Flask
+app of 'app.py', which 'asgi.py' runs next to this one (see 'handles()'). Select the mode with the 'APP_MODE' setting and
+run 'asgi.py', for example:
+
+    pip install -r requirements-async.txt
+    APP_MODE=async hypercorn asgi:app --bind 0.0.0.0:5000
+'''
+from quart import Quart, request, jsonify, url_for, abort, flash, redirect
+from werkzeug.exceptions import NotFound, MethodNotAllowed
+from werkzeug.routing import RequestRedirect
+
+#This is Quart's JSON encoder, which is extended below so that dates are sent in ISO format like in 'app.py'.
+from quart.json.provider import DefaultJSONProvider
+
+#These coroutines mirror the functions of 'crud_functions.py'.
+from functions import async_crud
+
+#This converts entries to ready-to-render values, exactly like in 'app.py'.
+from functions.formatting import format_rows
+from functions.crud_functions import date_cursor
+
+#The other routes are served by the Flask app, which shares its session (and so its flashed messages) with this one.
+from app import app as sync_app
+
+from datetime import date
+
+
+#This JSON provider writes dates as YYYY-MM-DD instead of the default HTTP date format.
+class SalesJSONProvider(DefaultJSONProvider):
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, date):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+
+#This represents an instance of the async web application. The static assets are served by the Flask app. Both apps sign
+#the session with the same key, so a message flashed here is shown by the page the user is redirected to.
+app = Quart(__name__, static_folder = None)
+app.json = SalesJSONProvider(app)
+app.secret_key = sync_app.secret_key
+
+#This function tells whether a request is served by this app. The other requests go to the Flask app (see 'asgi.py').
+def handles(path, method):
+    try:
+        app.url_map.bind('').match(path, method = method)
+    except (NotFound, MethodNotAllowed):
+        return False
+    except RequestRedirect:
+        pass
+    return True
+
+#This helper function redirects to the home page, served by the Flask app, like the add/edit/delete routes of 'app.py' do.
+def redirect_home():
+    return redirect(request.root_path + '/')
+
+#The connection pool is created once the event loop of the server is running, and closed when the server stops.
+@app.before_serving
+async def open_pool():
+    await async_crud.create_pool()
+
+@app.after_serving
+async def close_pool():
+    await async_crud.close_pool()
+
+#This helper function creates the links to the previous and next pages. The 'next' link carries a keyset cursor.
+def page_links(endpoint, page, total_pages, next_cursor, **params):
+    links = {}
+    if page > 1:
+        links['prev'] = url_for(endpoint, page=page-1, **params)
+    if page < total_pages and next_cursor is not None:
+        links['next'] = url_for(endpoint, page=page+1, after=next_cursor, **params)
+    return links
+
+#This helper function reads the 'start_date' and 'end_date' parameters, returning a 400 error if they aren't valid dates.
+def date_range_args():
+    try:
+        return date.fromisoformat(request.args['start_date']), date.fromisoformat(request.args['end_date'])
+    except (KeyError, ValueError):
+        abort(400)
+
+#This route will allow data to be represented as a JSON dictionary.
+@app.route("/as_jsondict", methods = ['GET'])
+async def as_jsondict():
+    page = max(request.args.get('page', 1, type=int), 1)
+    after_id = request.args.get('after', type=int)
+    per_page = 50
+
+    items_on_page = await async_crud.entries_page(page, per_page, after_id)
+    total_pages = (await async_crud.count_entries() + per_page - 1) // per_page
+
+    next_cursor = items_on_page[-1]['id'] if items_on_page else None
+    return jsonify({
+        'data': items_on_page,
+        'total pages': total_pages,
+        'current page': page,
+        'links': page_links('as_jsondict', page, total_pages, next_cursor)
+    })
+
+#This route will allow data to be represented as a list.
+@app.route("/as_list", methods = ['GET'])
+async def as_list():
+    page = max(request.args.get('page', 1, type=int), 1)
+    after_id = request.args.get('after', type=int)
+    per_page = 50
+
+    items_on_page = await async_crud.entries_page(page, per_page, after_id)
+    total_pages = (await async_crud.count_entries() + per_page - 1) // per_page
+
+    next_cursor = items_on_page[-1]['id'] if items_on_page else None
+    return jsonify({
+        'data': [list(entry.values()) for entry in items_on_page],
+        'total pages': total_pages,
+        'current page': page,
+        'links': page_links('as_list', page, total_pages, next_cursor)
+    })
+
+#This route will allow filtered data to be represented as a JSON dictionary. The dates are given in the URL.
+#Example: /as_jsondict_gdp?start_date=2023-02-01&end_date=2023-02-28
+@app.route("/as_jsondict_gdp", methods = ['GET'])
+async def as_jsondict_gdp():
+    start_date, end_date = date_range_args()
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = 50
+
+    try:
+        items_on_page = await async_crud.entries_by_date_page(start_date, end_date, page, per_page, request.args.get('after'))
+    except ValueError:
+        abort(400)
+    total_pages = (await async_crud.count_entries_by_date(start_date, end_date) + per_page - 1) // per_page
+
+    next_cursor = date_cursor(items_on_page[-1]) if items_on_page else None
+    return jsonify({
+        'data': items_on_page,
+        'total pages': total_pages,
+        'current page': page,
+        'links': page_links('as_jsondict_gdp', page, total_pages, next_cursor,
+                            start_date=start_date.isoformat(), end_date=end_date.isoformat())
+    })
+
+#This route returns a single entry as JSON.
+@app.route("/entry/<int:id>", methods = ['GET'])
+async def entry(id):
+    selected_entry = await async_crud.entry_by_id(id)
+    if selected_entry is None:
+        abort(404)
+    return jsonify(format_rows([selected_entry])[0])
+
+#This route will add a new entry. Like in 'app.py', it redirects to the home page with a message.
+@app.route("/add_entry", methods = ['POST'])
+async def add():
+    form = await request.form
+    try:
+        result = await async_crud.add_entry(form['id'], form['store_code'], form['total_sale'], form['transaction_date'])
+    except (KeyError, ArithmeticError):
+        abort(400)
+    except ValueError as error:
+        await flash(str(error))
+        return redirect_home()
+    if result == 1:
+        await flash('Your Entry Has Been Added To The Database!')
+    else:
+        await flash('That ID is already contained within the database!')
+        await flash('Your Entry Cannot Be Added To The Database At This Time...')
+    return redirect_home()
+
+#This route will edit an entry. Like in 'app.py', it redirects to the home page with a message.
+@app.route("/edit_entry", methods = ['POST'])
+async def edit():
+    form = await request.form
+    try:
+        result = await async_crud.edit_entry(form['id'], form['store_code'], form['total_sale'], form['transaction_date'])
+    except (KeyError, ArithmeticError):
+        abort(400)
+    except ValueError as error:
+        await flash(str(error))
+        return redirect_home()
+    if result:
+        await flash('Your Entry Was Updated!')
+    else:
+        await flash('Your Entry Cannot Updated At This Time...')
+    return redirect_home()
+
+#This route will delete an entry. Like in 'app.py', it redirects to the home page with a message.
+@app.route("/delete_entry/<id>/", methods = ['GET'])
+async def delete(id):
+    if await async_crud.delete_entry(id):
+        await flash('Your Entry Was Deleted!')
+    else:
+        await flash('Your Entry Cannot Deleted At This Time...')
+    return redirect_home()
+
+#This route returns the state of the asyncio connection pool.
+@app.route("/stats", methods = ['GET'])
+async def stats():
+    return jsonify({'connection_pool': async_crud.pool_stats()})
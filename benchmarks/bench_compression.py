@@ -0,0 +1,84 @@
+'''
+
+This benchmark measures what compression saves on a running server: for every page, it compares the bytes sent and the
+time-to-first-byte (the time until the status line and headers arrive) and total time of the uncompressed response with those
+of the gzip (and brotli, if the server has it) responses.
+
+By default it measures the home page, the static assets it links to, a filtered page and a large JSON page. Build the static
+assets first so that their precompressed copies are measured:
+
+    python -m functions.assets --build
+    python app.py &
+    python -m benchmarks.bench_compression http://127.0.0.1:5000 --requests 20
+
+'''
+#These are used to read the options, send the requests and find the assets.
+import argparse
+import http.client
+import re
+import statistics
+import time
+from urllib.parse import urlsplit
+
+#These are the pages measured by default. The static assets linked from the home page are added to them.
+PATHS = ['/', '/select_between_dates?start_date=2023-02-01&end_date=2023-02-28', '/as_list?per_page=1000']
+
+#These are the 'Accept-Encoding' headers compared.
+ENCODINGS = ['identity', 'gzip', 'br']
+
+#This function sends one GET request and returns the response headers, the number of bytes of the body as sent (still
+#compressed), the time-to-first-byte and the total time.
+def fetch(connection, path, encoding):
+    started = time.perf_counter()
+    connection.request('GET', path, headers = {'Accept-Encoding': encoding})
+    response = connection.getresponse()
+    first_byte = time.perf_counter() - started
+    body = response.read()
+    return response, len(body), first_byte, time.perf_counter() - started
+
+#This function returns the static assets linked from the home page.
+def asset_paths(connection):
+    connection.request('GET', '/', headers = {'Accept-Encoding': 'identity'})
+    html = connection.getresponse().read().decode('utf-8', 'replace')
+    return sorted(set(re.findall(r'(?:href|src)="(/static/[^"]+)"', html)))
+
+#This function measures one page with one encoding and returns the bytes sent with the median times.
+def measure(connection, path, encoding, requests):
+    results = [fetch(connection, path, encoding) for _ in range(requests)]
+    response = results[-1][0]
+    return {
+        'encoding': response.getheader('Content-Encoding') or 'identity',
+        'bytes': results[-1][1],
+        'ttfb_ms': statistics.median(result[2] for result in results) * 1000,
+        'total_ms': statistics.median(result[3] for result in results) * 1000,
+    }
+
+#This function measures every page with every encoding and prints the results.
+def main():
+    parser = argparse.ArgumentParser(description = "Measure the bytes and time saved by compressed responses.")
+    parser.add_argument('url', help = "base URL of the server (ie. http://127.0.0.1:5000)")
+    parser.add_argument('--paths', nargs = '+', default = PATHS)
+    parser.add_argument('--requests', type = int, default = 20, help = "requests per page and encoding")
+    args = parser.parse_args()
+
+    parts = urlsplit(args.url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port or 80)
+    paths = args.paths + asset_paths(connection)
+
+    for path in paths:
+        print(path)
+        baseline = None
+        for encoding in ENCODINGS:
+            result = measure(connection, parts.path.rstrip('/') + path, encoding, args.requests)
+
+            #A server without brotli answers 'br' with an uncompressed response, which is the same as the baseline.
+            if encoding != 'identity' and result['encoding'] == 'identity':
+                continue
+            baseline = baseline or result
+            print("    %-9s %10d bytes (%5.1f%%)   ttfb %8.2f ms   total %8.2f ms"
+                  % (result['encoding'], result['bytes'], result['bytes'] * 100 / max(baseline['bytes'], 1),
+                     result['ttfb_ms'], result['total_ms']))
+    connection.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+'''
+
+This benchmark measures the size and render time of the 'home' page before and after the edit modals were made lazy.
+
+    - Before: 'benchmarks/legacy_templates' holds the old 'home.html' and 'modals.html', which rendered a full edit modal
+      (plus the other modals) for every row on the page, using the old Jinja filters on the old TEXT values.
+    - After: the current templates render one edit modal per page, filled in from '/entry/<id>' when it is opened.
+
+No database is needed, the rows are generated in memory. Run it from the project directory with:
+
+    python -m benchmarks.bench_edit_modal --rows 25 100 500
+
+'''
+#These are used to read the options, build sample data, time the code and find the old templates.
+import argparse
+import os
+import timeit
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+#This is used to load the old templates next to the current ones.
+from jinja2 import ChoiceLoader, FileSystemLoader
+from flask import render_template
+
+#This is the app whose templates are measured.
+from app import app
+from functions.formatting import format_rows
+
+LEGACY_TEMPLATES = os.path.join(os.path.dirname(__file__), 'legacy_templates')
+
+#These are copies of the old Jinja filters, which the old templates need.
+def old_parse_total_sale(total_sale):
+    return float(''.join(c for c in total_sale if c.isdigit() or c == '.'))
+
+def old_format_date(date_str):
+    return datetime.strptime(date_str, "%m/%d/%Y").strftime("%Y-%m-%d")
+
+#This function builds 'count' entries, both in the old TEXT layout and in the typed layout.
+def sample_rows(count):
+    old_rows, new_rows = [], []
+    for id in range(1, count + 1):
+        total_sale = Decimal(id * 137 % 200000) / 100
+        transaction_date = date(2023, 1, 1) + timedelta(days = id % 90)
+        old_rows.append({'id': id, 'store_code': 'TX001', 'total_sale': '${:,.2f} '.format(total_sale),
+                         'transaction_date': '%d/%d/%d' % (transaction_date.month, transaction_date.day, transaction_date.year)})
+        new_rows.append({'id': id, 'store_code': 'TX001', 'total_sale': total_sale, 'transaction_date': transaction_date})
+    return old_rows, new_rows
+
+#This function runs the benchmark and prints the results.
+def main():
+    parser = argparse.ArgumentParser(description = "Compare the 'home' page with one edit modal per row and one per page.")
+    parser.add_argument('--rows', type = int, nargs = '+', default = [25, 100, 500], help = "rows per page to try")
+    parser.add_argument('--repeat', type = int, default = 5)
+    parser.add_argument('--number', type = int, default = 20)
+    args = parser.parse_args()
+
+    #The old templates are looked up first, so 'home.html' and 'modals.html' resolve to the old versions
+    #while 'base.html' and 'header.html' are shared.
+    legacy_env = app.jinja_env.overlay(loader = ChoiceLoader([FileSystemLoader(LEGACY_TEMPLATES), app.jinja_loader]))
+    legacy_env.filters['parse_total_sale'] = old_parse_total_sale
+    legacy_env.filters['format_date'] = old_format_date
+
+    with app.test_request_context('/'):
+        for count in args.rows:
+            old_rows, new_rows = sample_rows(count)
+            legacy_template = legacy_env.get_template('home.html')
+
+            def before():
+                return legacy_template.render(items_on_page = old_rows, total_pages = 10, page = 1)
+
+            def after():
+                return render_template('home.html', items_on_page = format_rows(new_rows), total_pages = 10, page = 1)
+
+            before_bytes = len(before().encode())
+            after_bytes = len(after().encode())
+            before_time = min(timeit.repeat(before, repeat = args.repeat, number = args.number)) / args.number * 1000
+            after_time = min(timeit.repeat(after, repeat = args.repeat, number = args.number)) / args.number * 1000
+
+            print("%4d rows   before: %8d bytes %7.2f ms   after: %8d bytes %7.2f ms   (%.1fx smaller, %.1fx faster)"
+                  % (count, before_bytes, before_time, after_bytes, after_time,
+                     before_bytes / after_bytes, before_time / after_time))
+
+if __name__ == "__main__":
+    main()
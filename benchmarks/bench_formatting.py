@@ -0,0 +1,99 @@
+'''
+
+This benchmark measures the cost per row of formatting the 'sales' values, before and after the formatting layer in
+'functions/formatting.py' was introduced.
+
+    - Before: every rendered row ran the old 'parse_total_sale' and 'format_date' Jinja filters, which cleaned the
+      '$1,117.77 ' text character by character and parsed and re-printed the '3/25/2023' date with strptime/strftime.
+      Every write also went through the old 'format_transaction_date()' and 'format_total_sale()' string juggling.
+    - After: a whole page is formatted at once by 'format_rows()' with memoized date conversions, and writes use the
+      precompiled parsers.
+
+Run it from the project directory with:
+
+    python -m benchmarks.bench_formatting --rows 25
+
+'''
+#These are used to read the options, build sample data and time the code.
+import argparse
+import random
+import timeit
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+#This is the formatting layer being measured.
+from functions.formatting import format_rows, parse_input_date, parse_total_sale
+
+#These are copies of the old Jinja filters from 'app.py', kept here so both versions can be compared.
+def old_parse_total_sale(total_sale):
+    total_sale = ''.join(c for c in total_sale if c.isdigit() or c == '.')
+    return float(total_sale)
+
+def old_format_date(date_str):
+    transaction_date = datetime.strptime(date_str, "%m/%d/%Y")
+    return transaction_date.strftime("%Y-%m-%d")
+
+#These are copies of the old write helpers from 'crud_functions.py'.
+def old_format_transaction_date(transaction_date):
+    transaction_date_obj = datetime.strptime(transaction_date, '%Y-%m-%d')
+    transaction_date_formatted = transaction_date_obj.strftime('%m/%d/%Y')
+    return '/'.join(str(int(x)) for x in transaction_date_formatted.split('/'))
+
+def old_format_total_sale(total_sale):
+    return '$' + str('{:,.2f}'.format(float(total_sale)))
+
+#This function builds 'count' random entries, both in the old TEXT layout and in the typed layout.
+def sample_rows(count):
+    random.seed(1)
+    old_rows, new_rows = [], []
+    for id in range(1, count + 1):
+        total_sale = Decimal(random.randint(100, 200000)) / 100
+        transaction_date = date(2023, 1, 1) + timedelta(days = random.randint(0, 90))
+        old_rows.append({'id': id, 'store_code': 'TX001', 'total_sale': '${:,.2f} '.format(total_sale),
+                         'transaction_date': '%d/%d/%d' % (transaction_date.month, transaction_date.day, transaction_date.year)})
+        new_rows.append({'id': id, 'store_code': 'TX001', 'total_sale': total_sale, 'transaction_date': transaction_date})
+    return old_rows, new_rows
+
+#This function runs 'function' 'repeat' times and returns the best time per row in microseconds.
+def per_row(function, rows, repeat, number):
+    best = min(timeit.repeat(function, repeat = repeat, number = number))
+    return best / number / rows * 1e6
+
+#This function runs the benchmark and prints the results.
+def main():
+    parser = argparse.ArgumentParser(description = "Compare the per-row cost of the old and new formatting code.")
+    parser.add_argument('--rows', type = int, default = 25, help = "number of rows per page")
+    parser.add_argument('--repeat', type = int, default = 5)
+    parser.add_argument('--number', type = int, default = 2000)
+    args = parser.parse_args()
+
+    old_rows, new_rows = sample_rows(args.rows)
+    form_values = [(row['transaction_date'].isoformat(), str(row['total_sale'])) for row in new_rows]
+
+    def old_read():
+        for row in old_rows:
+            old_parse_total_sale(row['total_sale'])
+            old_format_date(row['transaction_date'])
+
+    def new_read():
+        format_rows(new_rows)
+
+    def old_write():
+        for transaction_date, total_sale in form_values:
+            old_format_transaction_date(transaction_date)
+            old_format_total_sale(total_sale)
+
+    def new_write():
+        for transaction_date, total_sale in form_values:
+            parse_input_date(transaction_date)
+            parse_total_sale(total_sale)
+
+    print("Rows per page: %d" % args.rows)
+    for name, before, after in (('read (page formatting)', old_read, new_read), ('write (form parsing)', old_write, new_write)):
+        before_time = per_row(before, args.rows, args.repeat, args.number)
+        after_time = per_row(after, args.rows, args.repeat, args.number)
+        print("%-24s before: %7.2f us/row   after: %7.2f us/row   speedup: %.1fx"
+              % (name, before_time, after_time, before_time / after_time))
+
+if __name__ == "__main__":
+    main()
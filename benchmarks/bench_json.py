@@ -0,0 +1,95 @@
+'''
+
+This benchmark measures how fast a page of the list format ('/as_list') is turned into a JSON response, in bytes of JSON per
+second, for every step of the faster JSON path:
+
+    - Before: the rows were read as dictionaries, rebuilt as lists with 'list(entry.values())' and encoded by Flask's own
+      encoder.
+    - Tuples: the rows are read as tuples and written as lists without being rebuilt.
+    - orjson: the tuples are encoded by the orjson provider from 'functions/json_encoding.py' (needs 'pip install orjson').
+    - Cached: the encoded body is already in the query cache, so only the response object is built.
+
+No database is needed, the rows come from 'benchmarks/generate_data.py'. Run it from the project directory with:
+
+    python -m benchmarks.bench_json --rows 50 5000
+
+'''
+#These are used to read the options and time the code.
+import argparse
+import timeit
+
+#This is used to build the responses.
+from flask import Flask
+
+#These are the JSON providers being measured.
+from functions import json_encoding
+
+#This builds sample rows that look like the real ones.
+from benchmarks.generate_data import generate_rows
+
+#These are the columns of the rows, in the order the tuple cursors return them.
+COLUMNS = ('id', 'store_code', 'total_sale', 'transaction_date')
+
+#This function returns the page sent by '/as_list' for the given rows.
+def page(items_on_page):
+    return {
+        'data': items_on_page,
+        'total pages': 20,
+        'current page': 1,
+        'links': {'next': '/as_list?page=2&after=%d' % len(items_on_page)}
+    }
+
+#This function runs 'function' 'repeat' times and returns the best time per call in seconds.
+def best_time(function, repeat, number):
+    return min(timeit.repeat(function, repeat = repeat, number = number)) / number
+
+#This function runs the benchmark for one page size and prints the results.
+def run(rows, repeat, number):
+    tuples = list(generate_rows(rows))
+    dictionaries = [dict(zip(COLUMNS, row)) for row in tuples]
+
+    default_app = Flask(__name__)
+    default_app.json = json_encoding.create_json_provider(default_app, 'default')
+    orjson_app = Flask(__name__)
+    orjson_app.json = json_encoding.create_json_provider(orjson_app, 'orjson')
+    body = orjson_app.json.response(page(tuples)).get_data()
+
+    def before():
+        default_app.json.response(page([list(entry.values()) for entry in dictionaries])).get_data()
+
+    def with_tuples():
+        default_app.json.response(page(tuples)).get_data()
+
+    def with_orjson():
+        orjson_app.json.response(page(tuples)).get_data()
+
+    def cached():
+        orjson_app.response_class(body, mimetype = orjson_app.json.mimetype).get_data()
+
+    paths = [('before', before), ('tuples', with_tuples)]
+    if json_encoding.orjson is not None:
+        paths += [('orjson', with_orjson)]
+    paths += [('cached body', cached)]
+
+    print("Rows per page: %d (%d bytes of JSON)" % (rows, len(body)))
+    baseline = None
+    for name, function in paths:
+        seconds = best_time(function, repeat, number)
+        baseline = baseline or seconds
+        print("    %-12s %9.1f us/page   %8.1f MB/s   speedup: %.1fx"
+              % (name, seconds * 1e6, len(body) / seconds / 1e6, baseline / seconds))
+
+#This function reads the options and runs the benchmark for every page size.
+def main():
+    parser = argparse.ArgumentParser(description = "Compare the throughput of the JSON paths of the list format.")
+    parser.add_argument('--rows', type = int, nargs = '+', default = [50, 5000], help = "number of rows per page")
+    parser.add_argument('--repeat', type = int, default = 5)
+    parser.add_argument('--seconds', type = float, default = 0.5, help = "rough time spent on each measurement")
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        #Smaller pages are encoded more times, so every page size takes about the same time.
+        run(rows, args.repeat, max(int(args.seconds * 2e5 / rows), 1))
+
+if __name__ == "__main__":
+    main()
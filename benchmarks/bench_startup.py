@@ -0,0 +1,101 @@
+'''
+
+This benchmark measures how long a new process of the app takes to be ready: the time to import 'app.py', the time taken
+by 'create_app()' (compiling or loading the templates), and the time-to-first-response of a few pages, the first one of
+which pays for everything still loaded on demand (like pandas on '/as_pandasdf').
+
+Every run starts a new Python process, so nothing is already imported or compiled. These setups are compared:
+
+    - eager: pandas is imported when the app starts and the templates are compiled on every start (like before).
+    - lazy-cold: pandas is imported on first use, and the template cache is empty (the first start after a deploy).
+    - lazy-warm: pandas is imported on first use, and the templates are loaded from the cache written by an earlier start.
+
+The pages are read from the database configured in 'settings.py'. Run it from the project directory with:
+
+    DB_BACKEND=sqlite python -m benchmarks.bench_startup --runs 5
+
+'''
+#These are used to read the options, start the processes and time them.
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+#These are the pages requested by every process, in order.
+PATHS = ['/', '/select_between_dates?start_date=2023-02-01&end_date=2023-02-28', '/as_jsondict', '/as_pandasdf']
+
+#These are the setups compared, as the environment variables they set.
+SETUPS = {
+    'eager': {'PRELOAD_PANDAS': '1', 'TEMPLATE_CACHE_DIR': ''},
+    'lazy-cold': {'PRELOAD_PANDAS': '0'},
+    'lazy-warm': {'PRELOAD_PANDAS': '0'},
+}
+
+#This function runs in the process being measured. It loads the app, requests the pages and prints the times as JSON.
+def child(paths):
+    started = time.perf_counter()
+    import app
+    imported = time.perf_counter()
+    flask_app = app.create_app()
+    created = time.perf_counter()
+
+    client = flask_app.test_client()
+    times = {'import_ms': (imported - started) * 1000, 'create_app_ms': (created - imported) * 1000}
+    for path in paths:
+        request_started = time.perf_counter()
+        response = client.get(path)
+        if response.status_code != 200:
+            raise SystemExit("%s returned %d" % (path, response.status_code))
+        times[path] = (time.perf_counter() - request_started) * 1000
+    times['ready_ms'] = (time.perf_counter() - started) * 1000
+    print(json.dumps(times))
+
+#This function starts one process with the given environment variables and returns its times.
+def measure(environment, paths):
+    command = [sys.executable, '-m', 'benchmarks.bench_startup', '--child', '--paths'] + paths
+    output = subprocess.run(command, env = dict(os.environ, **environment), check = True, capture_output = True,
+                            text = True).stdout
+    return json.loads(output.splitlines()[-1])
+
+#This function measures every setup and prints the median of every time.
+def main():
+    parser = argparse.ArgumentParser(description = "Measure the import time and time-to-first-response of the app.")
+    parser.add_argument('--runs', type = int, default = 5, help = "processes started per setup")
+    parser.add_argument('--paths', nargs = '+', default = PATHS)
+    parser.add_argument('--child', action = 'store_true', help = argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.paths)
+        return
+
+    cache_dir = tempfile.mkdtemp(prefix = 'jinja_cache_')
+    try:
+        for name, environment in SETUPS.items():
+            environment = dict(environment)
+            if name != 'eager':
+                environment['TEMPLATE_CACHE_DIR'] = cache_dir
+
+            #The cold setup starts every process with an empty cache. The warm one fills it with a process not measured.
+            if name == 'lazy-warm':
+                measure(environment, args.paths)
+            results = []
+            for _ in range(args.runs):
+                if name == 'lazy-cold':
+                    shutil.rmtree(cache_dir, ignore_errors = True)
+                results.append(measure(environment, args.paths))
+
+            print(name)
+            for key in results[0]:
+                label = key if key.endswith('_ms') else 'first ' + key
+                print("    %-70s %8.1f ms" % (label, statistics.median(result[key] for result in results)))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors = True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+'''
+
+This script generates a synthetic 'sales' table of any size (from a few thousand to tens of millions of rows), so the app can
+be measured with much more data than the small dump in 'connection/SQL_Database/store_data.sql'.
+
+The rows look like the real ones: store codes made of a state and a store number (ie. 'TX001'), amounts between $5 and
+$1,500 and dates spread over a date range. The same seed always gives the same rows, so results can be compared between runs.
+
+The table can be written to a SQL file in the same layout as 'store_data.sql' (then loaded with the mysql client), or loaded
+straight into the database configured in 'functions/settings.py' (MySQL, or SQLite with DB_BACKEND=sqlite):
+
+    python -m benchmarks.generate_data --rows 1000000 --output sales_1m.sql
+    mysql -u root -p store_data < sales_1m.sql
+
+    python -m benchmarks.generate_data --rows 1000000 --load
+
+'''
+#These are used to read the options, generate the rows and write them out.
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+#These are the states used to build store codes.
+STATES = ('AZ', 'CA', 'CO', 'FL', 'GA', 'IA', 'ID', 'IL', 'NC', 'NY', 'OH', 'PA', 'TN', 'TX', 'WA')
+
+#This is the number of rows written by each INSERT statement.
+BATCH_SIZE = 1000
+
+#This is the table created before the rows are written. It is the same as the one in 'store_data.sql'.
+CREATE_TABLE = '''CREATE TABLE `sales` (
+  `id` int NOT NULL,
+  `store_code` varchar(32) NOT NULL,
+  `total_sale` decimal(12,2) NOT NULL,
+  `transaction_date` date NOT NULL,
+  PRIMARY KEY (`id`),
+  KEY `idx_sales_store_date` (`store_code`,`transaction_date`,`id`),
+  KEY `idx_sales_transaction_date` (`transaction_date`,`id`),
+  KEY `idx_sales_total_sale` (`total_sale`,`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci'''
+
+#This builds the daily summary of the table once its rows are loaded (see 'functions/daily_summary.py').
+SUMMARY_SQL = '''DROP TABLE IF EXISTS `sales_daily_summary`;
+CREATE TABLE `sales_daily_summary` (
+  `transaction_date` date NOT NULL,
+  `store_code` varchar(32) NOT NULL,
+  `sale_count` int NOT NULL,
+  `total_sales` decimal(14,2) NOT NULL,
+  `min_sale` decimal(12,2) NOT NULL,
+  `max_sale` decimal(12,2) NOT NULL,
+  PRIMARY KEY (`transaction_date`,`store_code`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+INSERT INTO `sales_daily_summary` SELECT transaction_date, store_code, COUNT(*), SUM(total_sale), MIN(total_sale), MAX(total_sale)
+FROM `sales` GROUP BY transaction_date, store_code;
+'''
+
+#This function returns 'count' store codes, always the same ones for a given seed.
+def store_codes(count, seed = 0):
+    rng = random.Random(seed)
+    codes = set()
+    while len(codes) < count:
+        codes.add('%s%03d' % (rng.choice(STATES), rng.randint(1, 120)))
+    return sorted(codes)
+
+#This generator yields 'rows' entries as (id, store_code, total_sale, transaction_date) tuples, with ids starting at 1.
+#Busy stores get more sales than quiet ones, and amounts cluster around a few hundred dollars like the real data.
+def generate_rows(rows, stores = 50, start_date = date(2023, 1, 1), end_date = date(2023, 12, 31), seed = 0):
+    rng = random.Random(seed)
+    codes = store_codes(stores, seed)
+    weights = [rng.uniform(0.2, 1.0) for _ in codes]
+    days = (end_date - start_date).days + 1
+
+    for id in range(1, rows + 1):
+        store_code = rng.choices(codes, weights)[0]
+        total_sale = Decimal(min(max(rng.lognormvariate(6.0, 0.6), 5.0), 1500.0)).quantize(Decimal('0.01'))
+        transaction_date = start_date + timedelta(days = rng.randrange(days))
+        yield (id, store_code, total_sale, transaction_date)
+
+#This generator groups rows into lists of 'size' rows.
+def batches(rows, size = BATCH_SIZE):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+#This function writes the rows to a SQL file that replaces the 'sales' table when loaded.
+def write_sql(path, rows):
+    with open(path, 'w') as file:
+        file.write("DROP TABLE IF EXISTS `sales`;\n%s;\n\n" % CREATE_TABLE)
+        file.write("LOCK TABLES `sales` WRITE;\n/*!40000 ALTER TABLE `sales` DISABLE KEYS */;\n")
+        for batch in batches(rows):
+            values = ','.join("(%d,'%s',%s,'%s')" % (id, store_code, total_sale, transaction_date.isoformat())
+                              for id, store_code, total_sale, transaction_date in batch)
+            file.write("INSERT INTO `sales` VALUES %s;\n" % values)
+        file.write("/*!40000 ALTER TABLE `sales` ENABLE KEYS */;\nUNLOCK TABLES;\n\n")
+        file.write(SUMMARY_SQL)
+
+#This function replaces the 'sales' table of the configured database (MySQL or SQLite, see 'DB_BACKEND') with the rows.
+def load(rows):
+    from functions.SQL_Connection import get_backend
+    from functions.daily_summary import rebuild
+
+    backend = get_backend()
+    sql_cxn = backend.connect()
+    cur = sql_cxn.cursor()
+    try:
+        cur.execute("DROP TABLE IF EXISTS sales")
+        backend.create_schema(sql_cxn)
+        loaded = 0
+        for batch in batches(rows):
+            sql_cxn.start_transaction()
+            cur.executemany("INSERT INTO sales (id, store_code, total_sale, transaction_date) VALUES (%s, %s, %s, %s)", batch)
+            sql_cxn.commit()
+            loaded += len(batch)
+            if loaded % (BATCH_SIZE * 100) == 0:
+                print("Loaded %s rows" % loaded)
+        rebuild(sql_cxn)
+    finally:
+        cur.close()
+        sql_cxn.close()
+
+#This will run the generator from the command line.
+def main():
+    parser = argparse.ArgumentParser(description = "Generate a synthetic 'sales' table.")
+    parser.add_argument('--rows', type = int, default = 10000)
+    parser.add_argument('--stores', type = int, default = 50)
+    parser.add_argument('--start-date', type = date.fromisoformat, default = date(2023, 1, 1))
+    parser.add_argument('--end-date', type = date.fromisoformat, default = date(2023, 12, 31))
+    parser.add_argument('--seed', type = int, default = 0)
+    target = parser.add_mutually_exclusive_group(required = True)
+    target.add_argument('--output', help = "write the table to this SQL file")
+    target.add_argument('--load', action = 'store_true', help = "replace the 'sales' table of the configured database")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    rows = generate_rows(args.rows, args.stores, args.start_date, args.end_date, args.seed)
+    if args.load:
+        load(rows)
+    else:
+        write_sql(args.output, rows)
+    print("Generated %s rows in %.1f seconds" % (args.rows, time.perf_counter() - started))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+'''
+
+This load test measures how the throughput of a running server changes with the number of concurrent clients. It is used
+to compare the sync mode (a fixed number of worker threads, each blocked during its MySQL queries) with the async mode
+(coroutines sharing an asyncio connection pool), for example:
+
+    python app.py                                                  # sync mode, one thread per request
+    APP_MODE=async hypercorn asgi:app --bind 127.0.0.1:5001        # async mode
+
+    python -m benchmarks.load_concurrency http://127.0.0.1:5000/as_jsondict --concurrency 1 8 32 128
+    python -m benchmarks.load_concurrency http://127.0.0.1:5001/as_jsondict --concurrency 1 8 32 128
+
+Each client sends plain HTTP/1.1 GET requests over its own keep-alive connection for the given number of seconds.
+If the async mode scales past the sync mode's thread count, its requests per second keep rising with concurrency
+while the sync mode levels off.
+
+'''
+#These are used to read the options, run the clients and compute the results.
+import argparse
+import asyncio
+import statistics
+import time
+from urllib.parse import urlsplit
+
+#This coroutine sends a request on an open connection and reads the whole response. 'body' is sent as a form.
+#It returns the status code and whether the server is keeping the connection open.
+async def send(reader, writer, host, method, path, body = b''):
+    headers = "%s %s HTTP/1.1\r\nHost: %s\r\nConnection: keep-alive\r\n" % (method, path, host)
+    if body:
+        headers += "Content-Type: application/x-www-form-urlencoded\r\nContent-Length: %d\r\n" % len(body)
+    writer.write(headers.encode() + b"\r\n" + body)
+    await writer.drain()
+
+    status_line = await reader.readline()
+    length = None
+    chunked = False
+    keep_alive = status_line.startswith(b'HTTP/1.1')
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+        elif name.lower() == 'transfer-encoding' and 'chunked' in value.lower():
+            chunked = True
+        elif name.lower() == 'connection':
+            keep_alive = value.strip().lower() == 'keep-alive'
+
+    if chunked:
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    elif length is not None:
+        await reader.readexactly(length)
+    else:
+        await reader.read()
+        keep_alive = False
+    return int(status_line.split()[1]), keep_alive
+
+#This coroutine sends a GET request on an open connection.
+async def get(reader, writer, host, path):
+    return await send(reader, writer, host, 'GET', path)
+
+#This coroutine is a single client. It sends requests until 'deadline' and records the latency of each one.
+async def client(url, deadline, latencies, errors):
+    parts = urlsplit(url)
+    path = parts.path + ('?' + parts.query if parts.query else '')
+    writer = None
+    try:
+        while time.monotonic() < deadline:
+            started = time.monotonic()
+
+            #Servers that don't support keep-alive (like the Flask development server) need a new connection every time.
+            if writer is None:
+                reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+            status, keep_alive = await get(reader, writer, parts.netloc, path)
+            if not keep_alive:
+                writer.close()
+                writer = None
+
+            if status >= 400:
+                errors.append(status)
+            latencies.append(time.monotonic() - started)
+    finally:
+        if writer is not None:
+            writer.close()
+
+#This coroutine runs 'concurrency' clients for 'duration' seconds and returns the results.
+async def run(url, concurrency, duration):
+    latencies, errors = [], []
+    started = time.monotonic()
+    await asyncio.gather(*(client(url, started + duration, latencies, errors) for _ in range(concurrency)))
+    elapsed = time.monotonic() - started
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'rps': len(latencies) / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000 if latencies else 0,
+        'p99_ms': latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0,
+    }
+
+#This function runs the load test for every concurrency level and prints the results.
+def main():
+    parser = argparse.ArgumentParser(description = "Measure throughput of a running server at several concurrency levels.")
+    parser.add_argument('url')
+    parser.add_argument('--concurrency', type = int, nargs = '+', default = [1, 8, 32, 128])
+    parser.add_argument('--duration', type = float, default = 10, help = "seconds per concurrency level")
+    args = parser.parse_args()
+
+    for concurrency in args.concurrency:
+        result = asyncio.run(run(args.url, concurrency, args.duration))
+        print("concurrency %4d   %8.1f req/s   p50 %8.2f ms   p99 %8.2f ms   %d requests, %d errors"
+              % (concurrency, result['rps'], result['p50_ms'], result['p99_ms'], result['requests'], result['errors']))
+
+if __name__ == "__main__":
+    main()
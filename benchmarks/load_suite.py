@@ -0,0 +1,255 @@
+'''
+
+This load test drives the main pages of a running server with concurrent clients and reports, for every scenario, the
+p50/p95/p99 latency, the throughput and the memory used by the server. Results can be saved as a baseline and later runs
+compared against it, so a change in 'app.py' or 'crud_functions.py' that makes the app slower is caught.
+
+Start by loading a synthetic table of the size you want to test (see 'benchmarks/generate_data.py'), then start the server
+and run the suite with the same row count and date range:
+
+    python -m benchmarks.generate_data --rows 1000000 --load
+    python app.py &
+
+    python -m benchmarks.load_suite http://127.0.0.1:5000 --rows 1000000 --pid $! --save before
+    ...change the code, restart the server...
+    python -m benchmarks.load_suite http://127.0.0.1:5000 --rows 1000000 --pid $! --compare before
+
+The 'crud' scenario adds, edits and deletes its own entries (with ids far above the generated ones), so it leaves the table
+as it found it. Baselines are stored as JSON files in 'benchmarks/baselines/'.
+
+'''
+#These are used to read the options, run the clients, and save and compare the results.
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+from urllib.parse import urlsplit, urlencode
+
+#This sends the HTTP requests.
+from benchmarks.load_concurrency import send
+
+#Baselines are saved in this folder.
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines')
+
+#The 'crud' scenario uses ids starting from here, and every client gets its own range of ids.
+CRUD_ID_START = 1500000000
+CRUD_IDS_PER_CLIENT = 1000000
+
+#This class holds what the scenarios need to know about the data being served.
+class Dataset:
+
+    def __init__(self, rows, start_date, end_date, per_page = 25):
+        self.rows = rows
+        self.start_date = start_date
+        self.end_date = end_date
+        self.pages = max((rows + per_page - 1) // per_page, 1)
+
+    #This returns a page number. Most users only look at the first few pages, so the first 100 are used.
+    def page(self, rng):
+        return rng.randint(1, min(self.pages, 100))
+
+    #This returns a week-long date range within the data.
+    def week(self, rng):
+        days = max((self.end_date - self.start_date).days - 6, 0)
+        start_date = self.start_date + timedelta(days = rng.randint(0, days))
+        return {'start_date': start_date.isoformat(), 'end_date': (start_date + timedelta(days = 6)).isoformat()}
+
+#Each scenario is a function that returns the (method, path, form body) of the n-th request of a client.
+def home(data, rng, client, n):
+    return 'GET', '/?' + urlencode({'page': data.page(rng)}), b''
+
+def select_by_date(data, rng, client, n):
+    return 'GET', '/select_between_dates?' + urlencode(data.week(rng)), b''
+
+def as_jsondict(data, rng, client, n):
+    return 'GET', '/as_jsondict?' + urlencode({'page': data.page(rng)}), b''
+
+def as_list(data, rng, client, n):
+    return 'GET', '/as_list?' + urlencode({'page': data.page(rng)}), b''
+
+def as_pandasdf(data, rng, client, n):
+    return 'GET', '/as_pandasdf?' + urlencode({'page': data.page(rng)}), b''
+
+def as_jsondict_gdp(data, rng, client, n):
+    return 'GET', '/as_jsondict_gdp?' + urlencode(data.week(rng)), b''
+
+def entry(data, rng, client, n):
+    return 'GET', '/entry/%d' % rng.randint(1, data.rows), b''
+
+#Every client adds an entry, edits it and then deletes it, over and over.
+def crud(data, rng, client, n):
+    id = CRUD_ID_START + client * CRUD_IDS_PER_CLIENT + n // 3
+    if n % 3 == 2:
+        return 'GET', '/delete_entry/%d/' % id, b''
+    form = {'id': id, 'store_code': 'BENCH', 'total_sale': '%.2f' % rng.uniform(5, 1500),
+            'transaction_date': data.week(rng)['start_date']}
+    return 'POST', '/add_entry' if n % 3 == 0 else '/edit_entry', urlencode(form).encode()
+
+SCENARIOS = {scenario.__name__: scenario for scenario in
+             (home, select_by_date, as_jsondict, as_list, as_pandasdf, as_jsondict_gdp, entry, crud)}
+
+#This function returns the value below which 'fraction' of the sorted values fall (nearest rank).
+def percentile(values, fraction):
+    if not values:
+        return 0
+    return values[min(max(int(len(values) * fraction + 0.5) - 1, 0), len(values) - 1)]
+
+#This function returns the current and peak memory (in MB) of the process 'pid', read from /proc (Linux only).
+def memory_mb(pid):
+    memory = {}
+    try:
+        with open('/proc/%d/status' % pid) as file:
+            for line in file:
+                name, _, value = line.partition(':')
+                if name in ('VmRSS', 'VmHWM'):
+                    memory[name] = int(value.split()[0]) / 1024
+    except OSError:
+        return None, None
+    return memory.get('VmRSS'), memory.get('VmHWM')
+
+#This coroutine is a single client. It sends the requests of the scenario until 'deadline' and records their latencies.
+async def client(base_url, scenario, data, index, seed, deadline, latencies, errors):
+    parts = urlsplit(base_url)
+    rng = random.Random(seed * 100003 + index)
+    writer = None
+    n = 0
+    try:
+        while time.monotonic() < deadline:
+            method, path, body = scenario(data, rng, index, n)
+            n += 1
+            started = time.monotonic()
+            try:
+                if writer is None:
+                    reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+                status, keep_alive = await send(reader, writer, parts.netloc, method, parts.path.rstrip('/') + path, body)
+            except (OSError, asyncio.IncompleteReadError, ValueError, IndexError):
+                status, keep_alive = 0, False
+            if not keep_alive and writer is not None:
+                writer.close()
+                writer = None
+
+            if status == 0 or status >= 400:
+                errors.append(status)
+            latencies.append(time.monotonic() - started)
+    finally:
+        if writer is not None:
+            writer.close()
+
+#This coroutine runs 'concurrency' clients of a scenario for 'duration' seconds and returns their latencies and errors.
+async def run_clients(base_url, scenario, data, concurrency, duration, seed):
+    latencies, errors = [], []
+    deadline = time.monotonic() + duration
+    await asyncio.gather(*(client(base_url, scenario, data, index, seed, deadline, latencies, errors)
+                           for index in range(concurrency)))
+    return latencies, errors
+
+#This function measures a scenario at one concurrency level, after a warm-up whose results are thrown away.
+def measure(base_url, name, data, concurrency, duration, warmup, seed, pid):
+    if warmup:
+        asyncio.run(run_clients(base_url, SCENARIOS[name], data, concurrency, warmup, seed + 1))
+
+    started = time.monotonic()
+    latencies, errors = asyncio.run(run_clients(base_url, SCENARIOS[name], data, concurrency, duration, seed))
+    elapsed = time.monotonic() - started
+    latencies.sort()
+    rss_mb, peak_rss_mb = memory_mb(pid) if pid else (None, None)
+
+    return {
+        'scenario': name,
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'rps': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'max_ms': latencies[-1] * 1000 if latencies else 0,
+        'rss_mb': rss_mb,
+        'peak_rss_mb': peak_rss_mb,
+    }
+
+#This function prints a result as one line.
+def print_result(result):
+    memory = '  rss %7.1f MB' % result['rss_mb'] if result['rss_mb'] is not None else ''
+    print("%-16s c=%-4d %9.1f req/s   p50 %8.2f ms   p95 %8.2f ms   p99 %8.2f ms   %6d requests %4d errors%s"
+          % (result['scenario'], result['concurrency'], result['rps'], result['p50_ms'], result['p95_ms'],
+             result['p99_ms'], result['requests'], result['errors'], memory))
+
+#This function returns the commit the code was at, to be stored with a baseline.
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr = subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+#This function compares results with a baseline and returns the list of regressions found.
+#A result regresses if its p95 latency went up, or its throughput went down, by more than 'tolerance' (ie. 0.2 for 20%).
+def compare(results, baseline, tolerance):
+    previous = {(result['scenario'], result['concurrency']): result for result in baseline['results']}
+    regressions = []
+    for result in results:
+        old = previous.get((result['scenario'], result['concurrency']))
+        if old is None:
+            continue
+        if old['p95_ms'] and result['p95_ms'] > old['p95_ms'] * (1 + tolerance):
+            regressions.append("%s c=%d: p95 went from %.2f ms to %.2f ms"
+                               % (result['scenario'], result['concurrency'], old['p95_ms'], result['p95_ms']))
+        if old['rps'] and result['rps'] < old['rps'] * (1 - tolerance):
+            regressions.append("%s c=%d: throughput went from %.1f req/s to %.1f req/s"
+                               % (result['scenario'], result['concurrency'], old['rps'], result['rps']))
+        if result['errors'] > old['errors']:
+            regressions.append("%s c=%d: errors went from %d to %d"
+                               % (result['scenario'], result['concurrency'], old['errors'], result['errors']))
+    return regressions
+
+#This function runs every selected scenario at every concurrency level, then saves or compares the results.
+def main():
+    parser = argparse.ArgumentParser(description = "Measure latency, throughput and memory of a running server.")
+    parser.add_argument('url', help = "base URL of the server (ie. http://127.0.0.1:5000)")
+    parser.add_argument('--scenarios', nargs = '+', choices = sorted(SCENARIOS), default = list(SCENARIOS))
+    parser.add_argument('--concurrency', type = int, nargs = '+', default = [1, 8, 32])
+    parser.add_argument('--duration', type = float, default = 10, help = "seconds measured per scenario and concurrency")
+    parser.add_argument('--warmup', type = float, default = 2, help = "seconds of warm-up before each measurement")
+    parser.add_argument('--rows', type = int, default = 10000, help = "number of rows in the generated table")
+    parser.add_argument('--start-date', type = date.fromisoformat, default = date(2023, 1, 1))
+    parser.add_argument('--end-date', type = date.fromisoformat, default = date(2023, 12, 31))
+    parser.add_argument('--seed', type = int, default = 0)
+    parser.add_argument('--pid', type = int, help = "process id of the server, to report its memory")
+    parser.add_argument('--save', metavar = 'NAME', help = "save the results as a baseline")
+    parser.add_argument('--compare', metavar = 'NAME', help = "compare the results with a saved baseline")
+    parser.add_argument('--tolerance', type = float, default = 0.2, help = "allowed slowdown before a result is a regression")
+    args = parser.parse_args()
+
+    data = Dataset(args.rows, args.start_date, args.end_date)
+    results = []
+    for name in args.scenarios:
+        for concurrency in args.concurrency:
+            result = measure(args.url, name, data, concurrency, args.duration, args.warmup, args.seed, args.pid)
+            print_result(result)
+            results.append(result)
+
+    if args.save:
+        os.makedirs(BASELINE_DIR, exist_ok = True)
+        path = os.path.join(BASELINE_DIR, args.save + '.json')
+        with open(path, 'w') as file:
+            json.dump({'commit': git_commit(), 'rows': args.rows, 'duration': args.duration, 'results': results},
+                      file, indent = 2)
+        print("Saved baseline to %s" % path)
+
+    if args.compare:
+        with open(os.path.join(BASELINE_DIR, args.compare + '.json')) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print("REGRESSION: " + regression)
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline '%s' (commit %s)." % (args.compare, baseline.get('commit')))
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,477 @@
 '''
 
 This module contains a function that allows connection to a MySQL database. It will return a message if the connection was successful
-or unsuccessful. You will need to change the password in order to be able to connect to your MySQL Workbench.
+or unsuccessful. You will need to change the password in 'settings.py' in order to be able to connect to your MySQL Workbench.
+
+The CRUD functions don't call it directly: they go through the storage backend chosen in 'settings.py' (see 'storage.py'),
+which is either MySQL through this function or an embedded SQLite database.
+
+It also contains a connection pool. Opening a new connection means a new TCP handshake and login on every request, so instead the
+CRUD functions borrow an already open connection from the pool through 'pooled_connection()' and hand it back when they are done.
+
+The connections handed out by 'pooled_connection()' time every statement they run (see 'functions/metrics.py').
 
 '''
 
 #Library to connect to MySQL Database
 import mysql.connector
 
+#These are used to keep the pool safe when several requests use it at the same time, to measure waiting times and to
+#drop the connections inherited by forked processes.
+import os
+import threading
+import time
+import logging
+import itertools
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+
+#This holds the connection parameters and the pool configuration.
+from functions import settings
+
+#This records the time taken by each statement.
+from functions import metrics
+
+#These are the storage backends (MySQL or SQLite).
+from functions.storage import create_backend
+
+#Results read from a replica that may be behind are kept out of the query cache.
+from functions.query_cache import query_cache
+
+#Messages about the connections are sent to this logger instead of being printed.
+logger = logging.getLogger(__name__)
+
 #This function will be called from other modules in order to connect to SQL Database.
-def dbConnection():
+#'host' and 'port' can be given to connect to another server with the same credentials (ie. a read replica).
+def dbConnection(host = None, port = None):
+    host = host or settings.DB_HOST
     my_db = mysql.connector.connect(
-        host = 'localhost',
-        user = 'root',
-        password = '',
-        database = 'store_data'
+        host = host,
+        port = port or 3306,
+        user = settings.DB_USER,
+        password = settings.DB_PASSWORD,
+        database = settings.DB_NAME
     )
 
-    #This will return a message based on the status of the connection.
+    #This will log a message based on the status of the connection. Connections are reused by the pool, so this only
+    #happens when a new one is opened, not on every request.
     if my_db:
-        print("Connection to SQL Database was successful!")
+        logger.info("event=db_connect status=ok host=%s database=%s", host, settings.DB_NAME)
         return my_db
     else:
-        print("Connection to SQL Database was unsuccessful")
+        logger.error("event=db_connect status=failed host=%s database=%s", host, settings.DB_NAME)
+
+#This exception is raised when no connection became free before the pool timeout ran out.
+class PoolTimeoutError(Exception):
+    pass
+
+#This class represents a bounded, thread-safe pool of database connections.
+class ConnectionPool:
+
+    def __init__(self, connect, size = 5, timeout = 10, max_idle = 300, ping_after = 5):
+
+        #This is the function used to open a brand new connection.
+        self.connect = connect
+        self.size = size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.ping_after = ping_after
+
+        #Idle connections are stored as (connection, time it was returned) pairs. The most recently used one is handed out first.
+        self.idle = deque()
+
+        #This is the number of connections currently open, whether idle or borrowed.
+        self.open_count = 0
+
+        #The condition is used both as a lock and to wake up requests that are waiting for a connection.
+        self.condition = threading.Condition()
+
+        #These counters are exposed through 'stats()'.
+        self.created = 0
+        self.closed = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.failed_health_checks = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    #This will borrow a connection from the pool, opening a new one if the pool is not full yet.
+    def get(self):
+        started = time.monotonic()
+        waited = False
+
+        with self.condition:
+            while True:
+                self._evict_idle()
+
+                #Reuse an idle connection if there is one.
+                if self.idle:
+                    cxn, returned_at = self.idle.pop()
+                    break
+
+                #Otherwise open a new one if we are still below the size limit. The slot is reserved before connecting so that
+                #other threads can't go over the limit while we wait for MySQL.
+                if self.open_count < self.size:
+                    self.open_count += 1
+                    cxn, returned_at = None, None
+                    break
+
+                #The pool is full, so wait until someone returns a connection.
+                waited = True
+                remaining = self.timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    self.timeouts += 1
+                    raise PoolTimeoutError("No database connection became available within %s seconds" % self.timeout)
+                self.condition.wait(remaining)
+
+            self.checkouts += 1
+            if waited:
+                self.waits += 1
+            wait_time = time.monotonic() - started
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+
+        #Connecting and pinging happen outside the lock so other threads aren't blocked by network round trips.
+        if cxn is None:
+            return self._open()
+
+        #Health check: a connection that sat idle for a while may have been dropped by the server, so ping it first.
+        if time.monotonic() - returned_at >= self.ping_after and not self._is_healthy(cxn):
+            with self.condition:
+                self.failed_health_checks += 1
+            self._discard(cxn, release_slot = False)
+            return self._open()
+
+        return cxn
+
+    #This will give a connection back to the pool so it can be reused.
+    def put(self, cxn, discard = False):
+        if discard:
+            self._discard(cxn)
+            return
+
+        with self.condition:
+            self.idle.append((cxn, time.monotonic()))
+            self.condition.notify()
+
+    #This will close every idle connection. Borrowed connections are closed when they are returned.
+    def close_all(self):
+        with self.condition:
+            idle = list(self.idle)
+            self.idle.clear()
+        for cxn, returned_at in idle:
+            self._discard(cxn)
+
+    #This returns the number of connections currently borrowed.
+    def in_use(self):
+        with self.condition:
+            return self.open_count - len(self.idle)
+
+    #This returns the current state of the pool and its wait metrics as a dictionary.
+    def stats(self):
+        with self.condition:
+            return {
+                'size': self.size,
+                'open': self.open_count,
+                'idle': len(self.idle),
+                'in_use': self.open_count - len(self.idle),
+                'created': self.created,
+                'closed': self.closed,
+                'checkouts': self.checkouts,
+                'waits': self.waits,
+                'timeouts': self.timeouts,
+                'failed_health_checks': self.failed_health_checks,
+                'total_wait_seconds': self.total_wait_time,
+                'max_wait_seconds': self.max_wait_time,
+            }
+
+    #This opens a new connection for a slot that has already been reserved.
+    def _open(self):
+        try:
+            cxn = self.connect()
+
+            #Autocommit keeps a reused connection from holding on to an old read snapshot between requests.
+            #Functions that need several statements in one transaction start one explicitly.
+            cxn.autocommit = True
+        except Exception:
+            with self.condition:
+                self.open_count -= 1
+                self.condition.notify()
+            raise
+
+        with self.condition:
+            self.created += 1
+        return cxn
+
+    #This closes a connection and frees its slot in the pool.
+    def _discard(self, cxn, release_slot = True):
+        try:
+            cxn.close()
+        except Exception:
+            pass
+
+        with self.condition:
+            self.closed += 1
+            if release_slot:
+                self.open_count -= 1
+                self.condition.notify()
+
+    #This closes connections that have been idle for too long. It must be called while holding the lock.
+    def _evict_idle(self):
+        now = time.monotonic()
+
+        #The oldest connections are at the left end of the deque.
+        while self.idle and now - self.idle[0][1] > self.max_idle:
+            cxn, returned_at = self.idle.popleft()
+            self.open_count -= 1
+            self.closed += 1
+            try:
+                cxn.close()
+            except Exception:
+                pass
 
+    #This checks that the server is still reachable through the given connection.
+    def _is_healthy(self, cxn):
+        try:
+            cxn.ping(reconnect = False)
+            return True
+        except Exception:
+            return False
+
+#This class wraps a cursor and measures every statement it runs. The time of a statement covers its execution and every
+#fetch of its rows, and is recorded when the next statement starts or when the cursor is closed.
+class TimedCursor:
+
+    def __init__(self, cursor, function):
+        self.cursor = cursor
+        self.function = function
+        self.seconds = 0.0
+        self.rows = 0
+        self.pending = False
+
+    def execute(self, *args, **kwargs):
+        return self._timed(self.cursor.execute, args, kwargs, new_statement = True)
+
+    def executemany(self, *args, **kwargs):
+        return self._timed(self.cursor.executemany, args, kwargs, new_statement = True)
+
+    def fetchone(self):
+        return self._timed(self.cursor.fetchone, (), {})
+
+    def fetchmany(self, *args, **kwargs):
+        return self._timed(self.cursor.fetchmany, args, kwargs)
+
+    def fetchall(self):
+        return self._timed(self.cursor.fetchall, (), {})
+
+    def close(self):
+        self.flush()
+        return self.cursor.close()
+
+    #Everything else (ie. 'rowcount') comes straight from the wrapped cursor.
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+    #This records the statement that is being measured, if there is one.
+    def flush(self):
+        if self.pending:
+            metrics.record_query(self.function, self.seconds, self.rows)
+            self.seconds = 0.0
+            self.rows = 0
+            self.pending = False
+
+    #This runs a method of the wrapped cursor and adds its time (and the rows it returned) to the current statement.
+    def _timed(self, method, args, kwargs, new_statement = False):
+        if new_statement:
+            self.flush()
+        started = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        finally:
+            self.seconds += time.perf_counter() - started
+            self.pending = True
+        if isinstance(result, list):
+            self.rows += len(result)
+        elif result is not None and method == self.cursor.fetchone:
+            self.rows += 1
+        return result
+
+#This class wraps a pooled connection so that its cursors are timed. Statements are labelled with 'function', the name of
+#the CRUD function that borrowed the connection.
+class TimedConnection:
+
+    def __init__(self, cxn, function):
+        self.cxn = cxn
+        self.function = function
+        self.cursors = []
+
+    def cursor(self, *args, **kwargs):
+        cur = TimedCursor(self.cxn.cursor(*args, **kwargs), self.function)
+        self.cursors.append(cur)
+        return cur
+
+    #Everything else (ie. 'commit()' or 'start_transaction()') comes straight from the wrapped connection.
+    def __getattr__(self, name):
+        return getattr(self.cxn, name)
+
+    #This records the statements of cursors that were never closed.
+    def flush(self):
+        for cur in self.cursors:
+            cur.flush()
+
+#These are the storage backend, the pool of the primary database and the pools of the read replicas shared by the whole
+#process. They are created the first time they are needed.
+_backend = None
+_pool = None
+_replica_pools = None
+_pool_lock = threading.Lock()
+
+#This is used to take turns between replicas.
+_next_replica = itertools.count()
+
+#This is the wall-clock time until which the reads of the current request must go to the primary (see 'pin_reads_until()'),
+#and whether the current request has written anything.
+_primary_until = contextvars.ContextVar('primary_until', default = 0.0)
+_wrote = contextvars.ContextVar('wrote', default = False)
+
+#This is the last time this process wrote to the primary. Replicas may not have that write yet for a little while.
+_last_write = 0.0
+
+#A worker process forked from this one (see 'start_worker()' in 'workers.py') must not use the connections of its parent,
+#since both would be talking over the same sockets. The child forgets the backend and the pools and opens its own connections
+#when it needs them. The old pools are kept (and never used) so the child doesn't close the parent's connections when they
+#are garbage collected.
+_inherited = []
+
+def reset_after_fork():
+    global _backend, _pool, _replica_pools, _pool_lock, _last_write
+    _inherited.append((_backend, _pool, _replica_pools))
+    _backend = None
+    _pool = None
+    _replica_pools = None
+    _pool_lock = threading.Lock()
+    _last_write = 0.0
+
+#This function returns the storage backend chosen with the 'DB_BACKEND' setting, creating it if needed.
+def get_backend():
+    global _backend
+    if _backend is None:
+        with _pool_lock:
+            if _backend is None:
+                _backend = create_backend(dbConnection)
+    return _backend
+
+#This function creates a pool with the configured limits around a function that opens connections.
+def create_pool(connect, size):
+    return ConnectionPool(connect,
+                          size = size,
+                          timeout = settings.DB_POOL_TIMEOUT,
+                          max_idle = settings.DB_POOL_MAX_IDLE,
+                          ping_after = settings.DB_POOL_PING_AFTER)
+
+#This function returns the shared connection pool of the primary database, creating it if needed.
+def get_pool():
+    global _pool
+    if _pool is None:
+        backend = get_backend()
+        with _pool_lock:
+            if _pool is None:
+                _pool = create_pool(backend.connect, backend.pool_size(settings.DB_POOL_SIZE))
+    return _pool
+
+#This function returns the pools of the read replicas listed in 'DB_REPLICAS' (an empty list if there are none).
+def get_replica_pools():
+    global _replica_pools
+    if _replica_pools is None:
+        backend = get_backend()
+        with _pool_lock:
+            if _replica_pools is None:
+                _replica_pools = [create_pool(backend.replica(dsn), settings.DB_POOL_SIZE) for dsn in settings.DB_REPLICAS]
+    return _replica_pools
+
+#This function returns the statistics of the shared pool.
+def pool_stats():
+    return get_pool().stats()
+
+#This function returns the statistics of every replica pool, in the order of 'DB_REPLICAS'.
+def replica_stats():
+    return [dict(pool.stats(), dsn = dsn) for dsn, pool in zip(settings.DB_REPLICAS, get_replica_pools())]
+
+#This function makes the reads of the current request go to the primary until the given time (from 'time.time()').
+#It is called at the start of a request with the time saved after the user's last write, so users see their own writes
+#even if the replicas are a little behind.
+def pin_reads_until(until):
+    _primary_until.set(until or 0.0)
+    _wrote.set(False)
+
+#This function returns the time until which the reads of the current request go to the primary, or None if the current
+#request hasn't written anything.
+def written_until():
+    return _primary_until.get() if _wrote.get() else None
+
+#This function records a write to the primary made by the current request.
+def record_write():
+    global _last_write
+    now = time.time()
+    _last_write = now
+    _primary_until.set(now + settings.READ_YOUR_WRITES_SECONDS)
+    _wrote.set(True)
+
+#This function picks the replica pool for a read, or returns None if the read must go to the primary.
+def choose_replica():
+    replicas = get_replica_pools()
+    if not replicas or time.time() < _primary_until.get():
+        return None
+    if settings.DB_REPLICA_POLICY == 'least_connections':
+        return min(replicas, key = lambda pool: pool.in_use())
+    return replicas[next(_next_replica) % len(replicas)]
+
+#This context manager borrows a connection from the pool and always gives it back, even if an exception is raised.
+#If something went wrong, the connection is rolled back first and thrown away if it can't be rolled back.
+#The statements run through the connection are recorded under 'function', the name of the function using it.
+#If 'read_only' is True, the connection may come from a read replica. Otherwise it comes from the primary, and the
+#connection is counted as a write for the read-your-writes window, unless 'count_write' is False (ie. for reads that must
+#see the primary).
+@contextmanager
+def pooled_connection(function, read_only = False, count_write = True):
+    pool = choose_replica() if read_only else None
+    started = time.perf_counter()
+    sql_cxn = None
+    if pool is not None:
+        #If the replica can't be reached, the read goes to the primary instead.
+        try:
+            sql_cxn = pool.get()
+        except Exception as error:
+            logger.warning("event=replica_unavailable error=%s", error)
+            metrics.replica_fallbacks.inc()
+    if sql_cxn is None:
+        pool = get_pool()
+        sql_cxn = pool.get()
+    metrics.pool_wait_duration.observe(time.perf_counter() - started)
+
+    if read_only:
+        target = 'primary' if pool is _pool else 'replica'
+        metrics.routed_reads.inc(target)
+
+        #A replica may not have this process's latest writes yet, so what it returns is not cached for a while.
+        if target == 'replica' and time.time() < _last_write + settings.READ_YOUR_WRITES_SECONDS:
+            query_cache.skip_store()
+    elif count_write:
+        record_write()
+
+    timed_cxn = TimedConnection(sql_cxn, function)
+    try:
+        yield timed_cxn
+    except BaseException:
+        timed_cxn.flush()
+        try:
+            sql_cxn.rollback()
+            pool.put(sql_cxn)
+        except Exception:
+            pool.put(sql_cxn, discard = True)
+        raise
+    else:
+        timed_cxn.flush()
+        pool.put(sql_cxn)
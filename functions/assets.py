@@ -0,0 +1,115 @@
+'''
+
+This module builds and serves the static assets used by the templates (the Bootstrap CSS and JavaScript files).
+
+The build makes a copy of every asset in 'static/dist', with a fingerprint of its content in the file name
+(ie. 'dist/css/bootstrap.min.3f2a1b9c04d5.css'), together with a gzip copy (and a brotli copy if the 'brotli' package is
+installed) compressed with the highest level. A manifest maps every asset to its copy. Run it whenever an asset changes:
+
+    python -m functions.assets --build
+
+The templates link to the assets with 'asset_url()', which gives the fingerprinted copy if the assets were built, or the
+original file otherwise. Since the name of a copy changes whenever its content does, browsers may keep it for a year
+('STATIC_MAX_AGE') without ever asking for it again, and the precompressed copy the browser accepts is sent as it is.
+
+'''
+#These are used to read and write the files and to fingerprint them.
+import os
+import json
+import hashlib
+import argparse
+import mimetypes
+
+#This is used to send the files.
+from flask import request, send_from_directory
+
+#This holds the cache settings and compresses the copies.
+from functions import settings
+from functions import compression
+
+#This is the folder of the static files, next to the 'functions' folder.
+STATIC_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+
+#These are the assets used by the templates, relative to the static folder.
+ASSETS = ('css/bootstrap.min.css', 'js/bootstrap.min.js')
+
+#The copies and the manifest are written in this folder of the static folder.
+BUILD_DIR = 'dist'
+MANIFEST = 'manifest.json'
+
+#This function returns the fingerprint of a file's content.
+def fingerprint(data):
+    return hashlib.sha256(data).hexdigest()[:12]
+
+#This function builds the fingerprinted and precompressed copies of the assets, writes the manifest and returns it.
+def build(static_folder = STATIC_FOLDER, assets = ASSETS):
+    manifest = {}
+    for filename in assets:
+        with open(os.path.join(static_folder, filename), 'rb') as file:
+            data = file.read()
+
+        root, extension = os.path.splitext(filename)
+        built = '%s/%s.%s%s' % (BUILD_DIR, root, fingerprint(data), extension)
+        path = os.path.join(static_folder, built)
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        with open(path, 'wb') as file:
+            file.write(data)
+
+        for encoding in compression.supported():
+            with open(path + compression.EXTENSIONS[encoding], 'wb') as file:
+                file.write(compression.compress(data, encoding, best = True))
+
+        manifest[filename] = {'path': built, 'encodings': list(compression.supported())}
+
+    with open(os.path.join(static_folder, BUILD_DIR, MANIFEST), 'w') as file:
+        json.dump(manifest, file, indent = 2)
+    return manifest
+
+#This class holds the manifest written by 'build()'. It is empty if the assets were never built.
+class Manifest:
+
+    def __init__(self, entries):
+        self.entries = entries
+
+        #This maps every fingerprinted copy to the encodings it was precompressed with.
+        self.built = {entry['path']: entry['encodings'] for entry in entries.values()}
+
+    #This function reads the manifest of the given static folder.
+    @classmethod
+    def load(cls, static_folder = STATIC_FOLDER):
+        try:
+            with open(os.path.join(static_folder, BUILD_DIR, MANIFEST)) as file:
+                return cls(json.load(file))
+        except FileNotFoundError:
+            return cls({})
+
+    #This function returns the file to link to for an asset: its fingerprinted copy if there is one.
+    def path(self, filename):
+        entry = self.entries.get(filename)
+        return entry['path'] if entry else filename
+
+#This function sends a static file. Fingerprinted copies are sent precompressed (if the client accepts one of their
+#encodings) with far-future cache headers. Any other file is sent by Flask as usual.
+def send_asset(app, manifest, filename):
+    if filename not in manifest.built:
+        return app.send_static_file(filename)
+
+    encoding = compression.choose_encoding(request.accept_encodings, manifest.built[filename])
+    sent = filename + compression.EXTENSIONS[encoding] if encoding else filename
+    response = send_from_directory(app.static_folder, sent, mimetype = mimetypes.guess_type(filename)[0],
+                                   max_age = settings.STATIC_MAX_AGE)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+#This will build the assets from the command line.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Build fingerprinted and precompressed copies of the static assets.")
+    parser.add_argument('--build', action = 'store_true', required = True)
+    args = parser.parse_args()
+
+    for filename, entry in build().items():
+        print("%s -> %s (%s)" % (filename, entry['path'], ', '.join(entry['encodings'])))
@@ -0,0 +1,168 @@
+'''
+
+This module mirrors the CRUD functions of 'crud_functions.py' for the async mode of the app ('async_app.py').
+Instead of blocking a worker thread on every MySQL round trip, these functions are coroutines that use an asyncio
+connection pool (aiomysql), so a single process can wait on many queries at the same time.
+
+The pool must be created with 'create_pool()' from inside the running event loop, and closed with 'close_pool()'.
+
+'''
+#This is the asyncio MySQL driver. It is only needed in async mode (pip install -r requirements-async.txt).
+import aiomysql
+import asyncio
+
+#This is the error raised by aiomysql when a row can't be written.
+from pymysql.err import IntegrityError
+
+#This holds the connection parameters and the pool configuration.
+from functions import settings
+
+#These convert the values given by forms and the pagination cursors, exactly like the sync CRUD functions do. The writes are
+#reported to 'sales_changed()' like the sync ones.
+from functions.formatting import parse_input_date, parse_total_sale
+from functions.crud_functions import parse_date_cursor, sales_changed, DUPLICATE_KEY_ERROR
+
+#This gives the statements that keep the daily summary up to date on every write.
+from functions.daily_summary import refresh_statements
+
+#This is the pool shared by every request. It belongs to the event loop it was created in.
+_pool = None
+
+#This coroutine creates the shared pool.
+async def create_pool():
+    global _pool
+    _pool = await aiomysql.create_pool(
+        host = settings.DB_HOST,
+        user = settings.DB_USER,
+        password = settings.DB_PASSWORD,
+        db = settings.DB_NAME,
+        minsize = settings.ASYNC_POOL_MIN_SIZE,
+        maxsize = settings.ASYNC_POOL_MAX_SIZE,
+        autocommit = True,
+
+        #Connections that have been idle for longer than this are replaced instead of being reused.
+        pool_recycle = int(settings.DB_POOL_MAX_IDLE)
+    )
+
+#This coroutine closes every connection of the shared pool.
+async def close_pool():
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        await _pool.wait_closed()
+        _pool = None
+
+#This function returns the statistics of the shared pool.
+def pool_stats():
+    if _pool is None:
+        return {}
+    return {'size': _pool.size, 'idle': _pool.freesize, 'in_use': _pool.size - _pool.freesize,
+            'min_size': _pool.minsize, 'max_size': _pool.maxsize}
+
+#This helper coroutine runs a read query and returns all of its rows as dictionaries.
+async def fetch_all(query, values = ()):
+    async with _pool.acquire() as sql_cxn:
+        async with sql_cxn.cursor(aiomysql.DictCursor) as cur:
+            await cur.execute(query, values)
+            return await cur.fetchall()
+
+#This helper coroutine runs a read query and returns its first row as a dictionary, or None.
+async def fetch_one(query, values = ()):
+    async with _pool.acquire() as sql_cxn:
+        async with sql_cxn.cursor(aiomysql.DictCursor) as cur:
+            await cur.execute(query, values)
+            return await cur.fetchone()
+
+#This helper coroutine runs a write query to the entry with the given 'id' and returns the number of rows affected. The daily
+#summary of the (store_code, transaction_date) groups touched by the write is updated in the same transaction. 'old_entry' is
+#a query and its values that find the group of the entry before the write, if it already exists.
+async def execute(id, query, values = (), groups = (), old_entry = None):
+    async with _pool.acquire() as sql_cxn:
+        async with sql_cxn.cursor() as cur:
+            await sql_cxn.begin()
+            try:
+                groups = list(groups)
+                if old_entry is not None:
+                    await cur.execute(*old_entry)
+                    groups.extend(await cur.fetchall())
+                await cur.execute(query, values)
+                rowcount = cur.rowcount
+                for summary_query, summary_values in refresh_statements(groups):
+                    await cur.execute(summary_query, summary_values)
+                await sql_cxn.commit()
+            except BaseException:
+                await sql_cxn.rollback()
+                raise
+
+    #The Flask app runs in the same process (see 'asgi.py'), so its cached results, hot dataset and ETags are updated too.
+    #This may read the entry again through the sync pool, so it runs in a thread instead of blocking the event loop.
+    if rowcount:
+        await asyncio.to_thread(sales_changed, [group[1] for group in groups], [id])
+    return rowcount
+
+#This coroutine will obtain a list of all entries/rows within the MySQL database.
+async def all_entries():
+    return await fetch_all("SELECT * FROM sales ORDER BY id")
+
+#This coroutine will return a set of entries based on input date parameters.
+async def entries_by_date(start_date, end_date):
+    query = "SELECT * FROM sales WHERE transaction_date BETWEEN %s AND %s ORDER BY transaction_date ASC, id ASC"
+    return await fetch_all(query, (start_date, end_date))
+
+#This coroutine will count the entries in the database, from the daily summary.
+async def count_entries():
+    row = await fetch_one("SELECT COALESCE(SUM(sale_count), 0) AS total FROM sales_daily_summary")
+    return int(row['total'])
+
+#This coroutine will count the entries between two dates, from the daily summary.
+async def count_entries_by_date(start_date, end_date):
+    row = await fetch_one("SELECT COALESCE(SUM(sale_count), 0) AS total FROM sales_daily_summary WHERE transaction_date BETWEEN %s AND %s",
+                          (start_date, end_date))
+    return int(row['total'])
+
+#This coroutine will return a single page of entries sorted by 'id', starting after 'after_id' if it is given.
+async def entries_page(page = 1, per_page = 25, after_id = None):
+    if after_id is not None:
+        return await fetch_all("SELECT * FROM sales WHERE id > %s ORDER BY id LIMIT %s", (after_id, per_page))
+    return await fetch_all("SELECT * FROM sales ORDER BY id LIMIT %s OFFSET %s", (per_page, (page - 1) * per_page))
+
+#This coroutine will return a single page of entries between two dates, starting after the 'after' cursor if it is given.
+async def entries_by_date_page(start_date, end_date, page = 1, per_page = 25, after = None):
+    if after is not None:
+        after_date, after_id = parse_date_cursor(after)
+        query = ("SELECT * FROM sales WHERE transaction_date BETWEEN %s AND %s "
+                 "AND (transaction_date, id) > (%s, %s) "
+                 "ORDER BY transaction_date ASC, id ASC LIMIT %s")
+        return await fetch_all(query, (start_date, end_date, after_date, after_id, per_page))
+    query = ("SELECT * FROM sales WHERE transaction_date BETWEEN %s AND %s "
+             "ORDER BY transaction_date ASC, id ASC LIMIT %s OFFSET %s")
+    return await fetch_all(query, (start_date, end_date, per_page, (page - 1) * per_page))
+
+#This coroutine will return the entry with the given 'id', or None if there isn't one.
+async def entry_by_id(id):
+    return await fetch_one("SELECT * FROM sales WHERE id = %s", (id,))
+
+#This coroutine will add an entry to the database. It returns 1 if the entry was added and 0 if the 'id' already exists.
+async def add_entry(id = '', store_code = '', total_sale = '', transaction_date = ''):
+    values = (id, store_code, parse_total_sale(total_sale), parse_input_date(transaction_date))
+    try:
+        return await execute(id, "INSERT INTO sales (id, store_code, total_sale, transaction_date) VALUES (%s, %s, %s, %s)",
+                             values, [(values[1], values[3])])
+    except IntegrityError as error:
+        if error.args[0] != DUPLICATE_KEY_ERROR:
+            raise
+        return 0
+
+#This coroutine will edit an entry within the database and return the number of rows that were modified.
+async def edit_entry(id = '', store_code = '', total_sale = '', transaction_date = ''):
+    values = (store_code, parse_total_sale(total_sale), parse_input_date(transaction_date), id)
+    return await execute(id, "UPDATE sales SET store_code = %s, total_sale = %s, transaction_date = %s WHERE id = %s",
+                         values, [(values[0], values[2])], old_entry(id))
+
+#This coroutine will delete an entry from the database and return the number of rows that were deleted.
+async def delete_entry(id = ''):
+    return await execute(id, "DELETE FROM sales WHERE id = %s", (id,), old_entry = old_entry(id))
+
+#This function builds the query that finds the store and date of an entry before it is changed.
+def old_entry(id):
+    return ("SELECT store_code, transaction_date FROM sales WHERE id = %s", (id,))
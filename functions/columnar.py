@@ -0,0 +1,69 @@
+'''
+
+This module builds columnar (Apache Arrow) versions of query results, so that pandas and Arrow clients can load them
+without any parsing. The table is built straight from the tuples returned by the database cursor, one column at a time,
+instead of going through a dictionary per row, a DataFrame and JSON.
+
+It needs the optional 'pyarrow' package (pip install pyarrow); 'available()' tells if it is installed. Since pyarrow (with
+numpy) takes a while to import and only '/as_arrow' uses it, it is imported the first time a table is built rather than when
+the app starts.
+
+'''
+#This is used to write the results into memory instead of a file.
+import io
+
+#This is used to check for pyarrow without importing it.
+import importlib.util
+
+#Arrow and Parquet support is optional. These are set by 'load()'.
+pa = None
+pq = None
+
+#These are the MIME types of the two formats.
+MIMETYPES = {
+    'arrow': 'application/vnd.apache.arrow.stream',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+#This function returns True if pyarrow is installed.
+def available():
+    return pq is not None or importlib.util.find_spec('pyarrow') is not None
+
+#This function imports pyarrow, if it wasn't already.
+def load():
+    global pa, pq
+    if pq is None:
+        import pyarrow
+        import pyarrow.parquet
+        pa, pq = pyarrow, pyarrow.parquet
+
+#This function returns the Arrow schema of the 'sales' table.
+def sales_schema():
+    load()
+    return pa.schema([
+        ('id', pa.int32()),
+        ('store_code', pa.string()),
+        ('total_sale', pa.decimal128(12, 2)),
+        ('transaction_date', pa.date32()),
+    ])
+
+#This function builds an Arrow table from (id, store_code, total_sale, transaction_date) tuples.
+def sales_table(rows):
+    load()
+    schema = sales_schema()
+
+    #zip(*rows) turns the list of rows into one sequence per column.
+    columns = list(zip(*rows)) if rows else [[] for _ in schema]
+    return pa.Table.from_arrays([pa.array(column, type = field.type) for column, field in zip(columns, schema)],
+                                schema = schema)
+
+#This function returns the table encoded as an Arrow IPC stream or as a Parquet file.
+def encode_table(table, table_format):
+    load()
+    sink = io.BytesIO()
+    if table_format == 'parquet':
+        pq.write_table(table, sink)
+    else:
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    return sink.getvalue()
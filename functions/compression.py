@@ -0,0 +1,88 @@
+'''
+
+This module compresses the responses of the app. The encoding is picked from the 'Accept-Encoding' header sent by the client:
+brotli if the optional 'brotli' package is installed (pip install brotli) and the client accepts it, otherwise gzip.
+
+Only text responses (HTML pages, JSON, CSS, JavaScript, CSV...) of at least 'COMPRESS_MIN_SIZE' bytes are compressed.
+Files sent by Flask (like the static assets) and streamed responses (like '/export') are left alone: the static assets are
+compressed once at build time instead (see 'functions/assets.py').
+
+A compressed response gets its own ETag (the ETag of the data followed by '-gzip' or '-br'), so caches never mix up the
+compressed and uncompressed copies. Compressed copies of responses with an ETag are kept in the query cache, so a page asked
+for again is not compressed again until the data changes.
+
+'''
+#These are the compressors.
+import gzip
+
+#Brotli support is optional.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+#This holds the compression settings and caches the compressed copies.
+from functions import settings
+from functions.query_cache import query_cache
+
+#These are the MIME types worth compressing. Images and binary formats (like Arrow and Parquet) are already compact.
+COMPRESSIBLE = {'text/html', 'text/css', 'text/csv', 'text/plain', 'text/javascript', 'application/javascript',
+                'application/json', 'application/x-ndjson'}
+
+#These are the file extensions of the precompressed copies of a file.
+EXTENSIONS = {'br': '.br', 'gzip': '.gz'}
+
+#This function returns the encodings this process can produce, best first.
+def supported():
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+#This function returns the first of the 'available' encodings accepted by the client, or None.
+#'accept_encodings' is the parsed 'Accept-Encoding' header (ie. 'request.accept_encodings').
+def choose_encoding(accept_encodings, available = None):
+    for encoding in available if available is not None else supported():
+        if accept_encodings[encoding] > 0:
+            return encoding
+    return None
+
+#This function compresses 'data' with the given encoding. If 'best' is True, the highest level is used (for files that are
+#compressed once at build time), otherwise the levels from 'settings.py'.
+def compress(data, encoding, best = False):
+    if encoding == 'br':
+        return brotli.compress(data, quality = 11 if best else settings.BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel = 9 if best else settings.GZIP_LEVEL, mtime = 0)
+
+#This function returns the ETag of the copy of a response the client already has (the given ETag, or one of its compressed
+#variants), or None if the client has none of them. 'if_none_match' is the parsed 'If-None-Match' header.
+def matching_etag(if_none_match, etag):
+    for candidate in [etag] + ['%s-%s' % (etag, encoding) for encoding in EXTENSIONS]:
+        if if_none_match.contains(candidate):
+            return candidate
+    return None
+
+#This function compresses a response if the client accepts it and if it is worth it, and returns it.
+def compress_response(response, accept_encodings):
+    if (not settings.COMPRESS_ENABLED or response.status_code != 200 or response.direct_passthrough
+            or response.is_streamed or 'Content-Encoding' in response.headers or response.mimetype not in COMPRESSIBLE):
+        return response
+
+    #The response depends on 'Accept-Encoding' even when it is sent uncompressed.
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding(accept_encodings)
+    if encoding is None or response.content_length is None or response.content_length < settings.COMPRESS_MIN_SIZE:
+        return response
+
+    #The ETag changes with the data, so it identifies the compressed copy too.
+    etag, weak = response.get_etag()
+    cached = etag is not None and settings.QUERY_CACHE_ENABLED
+    key = ('compressed', etag, encoding)
+    found, body = query_cache.get(key) if cached else (False, None)
+    if not found:
+        body = compress(response.get_data(), encoding)
+        if cached:
+            query_cache.set(key, body)
+
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+    if etag:
+        response.set_etag('%s-%s' % (etag, encoding), weak)
+    return response
@@ -13,179 +13,752 @@ from flask import redirect, url_for, flash
 #This will import SQL_Connection module in order to connect with MySQL database.
 from functions.SQL_Connection import * 
 
-#This will be used to change the date format from yyyy-mm-dd to dd/mm/yyyy to ensure consistency within the database.
-from datetime import datetime
+#This cache keeps the results of the read functions below so the same query isn't run again for every page click.
+from functions.query_cache import query_cache, cached_query, sales_version
+
+#When 'HOT_DATASET_ENABLED' is 1, the listing, date range and paging reads below are served from an in-memory copy of the table.
+from functions.hot_dataset import hot_read, hot_dataset_changed
+
+#This will be used to convert the dates and amounts given by the HTML forms to the types stored in the database.
+from functions.formatting import parse_input_date, parse_total_sale
+
+#This keeps the daily summary of the sales up to date on every write.
+from functions.daily_summary import refresh_groups
+
+#This is the MySQL error number for a duplicate primary key.
+from functions.storage import DUPLICATE_KEY_ERROR
 
 #This function will obtain a list of all entries/rows within the MySQL database.
+@cached_query
+@hot_read
 def all_entries():
 
-    #This is a variable representing database connection.
-    sql_cxn = dbConnection()
+    #This borrows a connection from the pool. It is handed back automatically at the end of the 'with' block, even on errors.
+    #'read_only' lets the read go to a replica if there are any (see 'DB_REPLICAS' in 'settings.py').
+    with pooled_connection('all_entries', read_only = True) as sql_cxn:
 
-    #Cursor used to execute statements to communicate with the MySQL database.
-    cur = sql_cxn.cursor(dictionary = True) # 'dictionary=True' will return each entry as a dictionary
+        #Cursor used to execute statements to communicate with the MySQL database.
+        cur = sql_cxn.cursor(dictionary = True) # 'dictionary=True' will return each entry as a dictionary
 
-    #This is a SQL query to return all entries from the datatable sorted by 'id'
-    sql_query = 'SELECT * FROM sales ORDER BY id'
+        #This is a SQL query to return all entries from the datatable sorted by 'id'
+        sql_query = 'SELECT * FROM sales ORDER BY id'
 
-    #This executes given query.
-    cur.execute(sql_query)
+        #This executes given query.
+        cur.execute(sql_query)
 
-    #This represents all entries in the database.
-    all_entries = cur.fetchall()
+        #This represents all entries in the database.
+        all_entries = cur.fetchall()
 
-    #Closes the cursor, resets all results, and ensures that the cursor object has no reference to its original connection object.
-    cur.close()
+        #Closes the cursor, resets all results, and ensures that the cursor object has no reference to its original connection object.
+        cur.close()
 
-    #Closes connection to MySQL database.
-    sql_cxn.close()
     return all_entries
 
 #This function will return a set of entries based on input date parameters. It assumes the input date parameters are valid 
 #(ie. No absurd years like 03/01/2023333). Will also check that start_date <= end_date.
+@cached_query
+@hot_read
 def entries_by_date(start_date, end_date):
 
     #Comments for functionality included already within 'def all_entries()'.
-    sql_cxn = dbConnection()
-    cur = sql_cxn.cursor(dictionary=True)
+    with pooled_connection('entries_by_date', read_only = True) as sql_cxn:
+        cur = sql_cxn.cursor(dictionary=True)
 
-    #SQL query to retrieve data between start_date and end_date
-    #Query is written specifically so that dates from the database are formatted appropiately from MM/DD/YYYY to YYYY-MM-DD.
-    query = "SELECT * FROM sales WHERE STR_TO_DATE(transaction_date, '%m/%d/%Y') BETWEEN %s AND %s ORDER BY STR_TO_DATE(transaction_date, '%m/%d/%Y') ASC"
-    cur.execute(query, (start_date, end_date))
-    filtered_entries = cur.fetchall()
+        #SQL query to retrieve data between start_date and end_date.
+        #'transaction_date' is a DATE column with an index, so MySQL only reads the rows within the range, already in order.
+        query = "SELECT * FROM sales WHERE transaction_date BETWEEN %s AND %s ORDER BY transaction_date ASC, id ASC"
+        cur.execute(query, (start_date, end_date))
+        filtered_entries = cur.fetchall()
 
-    #Close the cursor and connection
-    cur.close()
-    sql_cxn.close()
+        #Close the cursor. The connection goes back to the pool.
+        cur.close()
 
     #Return the filtered_entries list containing entries between start_date and end_date
     return filtered_entries
 
-#This function will allow you to add an entry to the database.
-def add_entry(id = '', store_code = '', total_sale = '', transaction_date = ''):
-
-    #Comments for functionality included already within 'def all_entries()'.
-    sql_cxn = dbConnection()
-    cur = sql_cxn.cursor(dictionary = True)
-
-    #This next part will check that the given 'id' isn't already contained within the database to avoid duplication of primary keys.
-    #If it is, you will be given a flash message and redirected to the 'home' page.
-
-    #This will create a single row/column containing a number representing the number of occurrences of 'id'. The column is labeled
-    #'occurrences'
-    dupeCheckQuery = "SELECT COUNT(*) AS occurrences FROM sales WHERE id = %s" 
-    cur.execute(dupeCheckQuery, (id,))
+#This function will return the entry with the given 'id', or None if there isn't one. It is a primary key lookup.
+@cached_query
+@hot_read
+def entry_by_id(id):
+    with pooled_connection('entry_by_id', read_only = True) as sql_cxn:
+        cur = sql_cxn.cursor(dictionary = True)
+        cur.execute("SELECT * FROM sales WHERE id = %s", (id,))
+        entry = cur.fetchone()
+        cur.close()
+    return entry
+
+#This function will count the entries in the database. It is used to work out the total number of pages.
+#The count is added up from the daily summary, which has one row per store and day.
+@cached_query
+@hot_read
+def count_entries():
+    with pooled_connection('count_entries', read_only = True) as sql_cxn:
+        cur = sql_cxn.cursor(dictionary = True)
+        cur.execute("SELECT COALESCE(SUM(sale_count), 0) AS total FROM sales_daily_summary")
+        total = int(cur.fetchone()['total'])
+        cur.close()
+    return total
+
+#This function will count the entries between two dates. It is used to work out the total number of pages for filtered data.
+#It reads one row per store and day from the daily summary instead of every entry in the range.
+@cached_query
+@hot_read
+def count_entries_by_date(start_date, end_date):
+    with pooled_connection('count_entries_by_date', read_only = True) as sql_cxn:
+        cur = sql_cxn.cursor(dictionary = True)
+        query = "SELECT COALESCE(SUM(sale_count), 0) AS total FROM sales_daily_summary WHERE transaction_date BETWEEN %s AND %s"
+        cur.execute(query, (start_date, end_date))
+        total = int(cur.fetchone()['total'])
+        cur.close()
+    return total
+
+#This function will return a single page of entries sorted by 'id' instead of the whole table.
+#If 'after_id' is given, the page starts right after that 'id' (a keyset cursor), which lets MySQL jump straight to it
+#instead of reading and skipping every row before it like OFFSET does.
+@cached_query
+@hot_read
+def entries_page(page = 1, per_page = 25, after_id = None):
+    with pooled_connection('entries_page', read_only = True) as sql_cxn:
+        cur = sql_cxn.cursor(dictionary = True)
+
+        if after_id is not None:
+            query = "SELECT * FROM sales WHERE id > %s ORDER BY id LIMIT %s"
+            cur.execute(query, (after_id, per_page))
+        else:
+            query = "SELECT * FROM sales ORDER BY id LIMIT %s OFFSET %s"
+            cur.execute(query, (per_page, (page - 1) * per_page))
+
+        items_on_page = cur.fetchall()
+        cur.close()
+    return items_on_page
+
+#This function will return a single page of entries between two dates, sorted by date and then by 'id'.
+#If 'after' is given, it should be a cursor made by 'date_cursor()' from the last row of the previous page.
+@cached_query
+@hot_read
+def entries_by_date_page(start_date, end_date, page = 1, per_page = 25, after = None):
+    with pooled_connection('entries_by_date_page', read_only = True) as sql_cxn:
+        cur = sql_cxn.cursor(dictionary = True)
+
+        #Both queries read the (transaction_date, id) index in order, so no sorting is needed.
+        if after is not None:
+            after_date, after_id = parse_date_cursor(after)
+            query = ("SELECT * FROM sales WHERE transaction_date BETWEEN %s AND %s "
+                     "AND (transaction_date, id) > (%s, %s) "
+                     "ORDER BY transaction_date ASC, id ASC LIMIT %s")
+            cur.execute(query, (start_date, end_date, after_date, after_id, per_page))
+        else:
+            query = ("SELECT * FROM sales WHERE transaction_date BETWEEN %s AND %s "
+                     "ORDER BY transaction_date ASC, id ASC LIMIT %s OFFSET %s")
+            cur.execute(query, (start_date, end_date, per_page, (page - 1) * per_page))
+
+        items_on_page = cur.fetchall()
+        cur.close()
+    return items_on_page
+
+#These functions return the same entries as 'entries_page()', 'entries_by_date_page()' and 'entries_by_date()', but as plain
+#tuples of (id, store_code, total_sale, transaction_date) instead of dictionaries. They are used to build columnar results
+#and the list format, where no column names are needed.
+@cached_query
+@hot_read
+def entries_page_tuples(page = 1, per_page = 50, after_id = None):
+    with pooled_connection('entries_page_tuples', read_only = True) as sql_cxn:
+        cur = sql_cxn.cursor()
+        columns = "SELECT id, store_code, total_sale, transaction_date FROM sales"
+        if after_id is not None:
+            cur.execute(columns + " WHERE id > %s ORDER BY id LIMIT %s", (after_id, per_page))
+        else:
+            cur.execute(columns + " ORDER BY id LIMIT %s OFFSET %s", (per_page, (page - 1) * per_page))
+        rows = cur.fetchall()
+        cur.close()
+    return rows
+
+@cached_query
+@hot_read
+def entries_by_date_page_tuples(start_date, end_date, page = 1, per_page = 50, after = None):
+    with pooled_connection('entries_by_date_page_tuples', read_only = True) as sql_cxn:
+        cur = sql_cxn.cursor()
+        columns = "SELECT id, store_code, total_sale, transaction_date FROM sales WHERE transaction_date BETWEEN %s AND %s "
+        if after is not None:
+            after_date, after_id = parse_date_cursor(after)
+            cur.execute(columns + "AND (transaction_date, id) > (%s, %s) ORDER BY transaction_date ASC, id ASC LIMIT %s",
+                        (start_date, end_date, after_date, after_id, per_page))
+        else:
+            cur.execute(columns + "ORDER BY transaction_date ASC, id ASC LIMIT %s OFFSET %s",
+                        (start_date, end_date, per_page, (page - 1) * per_page))
+        rows = cur.fetchall()
+        cur.close()
+    return rows
+
+@cached_query
+@hot_read
+def entries_by_date_tuples(start_date, end_date):
+    with pooled_connection('entries_by_date_tuples', read_only = True) as sql_cxn:
+        cur = sql_cxn.cursor()
+        query = ("SELECT id, store_code, total_sale, transaction_date FROM sales "
+                 "WHERE transaction_date BETWEEN %s AND %s ORDER BY transaction_date ASC, id ASC")
+        cur.execute(query, (start_date, end_date))
+        rows = cur.fetchall()
+        cur.close()
+    return rows
+
+#This generator will yield every entry (or every entry between two dates) in lists of at most 'chunk_size' rows.
+#It uses an unbuffered cursor, so MySQL sends the rows as they are read instead of the whole result being loaded
+#into memory first. The connection stays borrowed from the pool until the generator is finished or closed.
+#Exports are not cached since they can be as big as the whole table.
+def stream_entries(start_date = None, end_date = None, chunk_size = 1000):
+    with pooled_connection('stream_entries', read_only = True) as sql_cxn:
+        cur = sql_cxn.cursor(dictionary = True, buffered = False)
+
+        if start_date is not None and end_date is not None:
+            query = "SELECT * FROM sales WHERE transaction_date BETWEEN %s AND %s ORDER BY transaction_date ASC, id ASC"
+            cur.execute(query, (start_date, end_date))
+        else:
+            cur.execute("SELECT * FROM sales ORDER BY id")
+
+        #Keep fetching until there are no rows left.
+        while True:
+            rows = cur.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield rows
 
-    #This will retrieve that number. Since it is just one row, fetchone() is used instead of fetchall().
-    singleRow = cur.fetchone()
-    #If that number is greater than 0, you won't be able to add the entry to the database to avoid duplication.
-    if singleRow['occurrences'] > 0: 
         cur.close()
-        sql_cxn.close()
-        flash("That ID is already contained within the database!")
-        return redirect(url_for('home'))
 
-    #Formatting our 'transaction_date'
-    transaction_date = format_transaction_date(transaction_date)
+#These are the periods sales can be grouped by. The SQL for each of them depends on the storage backend.
+PERIODS = ('day', 'week', 'month')
+
+#This function will return the number of sales, their total, average, smallest and largest sale, computed by the database.
+#If 'by_store' is True the results are grouped by 'store_code', and if 'period' is 'day', 'week' or 'month' they are also
+#grouped by that period. The dates are optional and limit the sales that are counted.
+#They are added up from the daily summary, so the time taken depends on the number of days, not the number of sales.
+#The results are cached until a write changes the sales they were computed from.
+@cached_query
+def sales_totals(by_store = False, period = None, start_date = None, end_date = None):
+    columns = []
+    if by_store:
+        columns.append("store_code")
+    if period is not None:
+        columns.append(get_backend().period_sql[period] + " AS period")
+
+    query = "SELECT " + ''.join(column + ", " for column in columns)
+    query += ("SUM(sale_count) AS sale_count, ROUND(SUM(total_sales), 2) AS total_sales, "
+              "ROUND(SUM(total_sales) / SUM(sale_count), 2) AS average_sale, "
+              "MIN(min_sale) AS min_sale, MAX(max_sale) AS max_sale FROM sales_daily_summary")
+    values = ()
+    if start_date is not None and end_date is not None:
+        query += " WHERE transaction_date BETWEEN %s AND %s"
+        values = (start_date, end_date)
+
+    #The groups are listed by store and then by period.
+    group_columns = (["store_code"] if by_store else []) + (["period"] if period is not None else [])
+    if group_columns:
+        query += " GROUP BY " + ', '.join(group_columns) + " ORDER BY " + ', '.join(group_columns)
+
+    with pooled_connection('sales_totals', read_only = True) as sql_cxn:
+        cur = sql_cxn.cursor(dictionary = True)
+        cur.execute(query, values)
+        totals = cur.fetchall()
+        cur.close()
 
-    #Formatting 'total_sale'.
-    total_sale = format_total_sale(total_sale)
+    #MySQL returns the sum of the counts as a DECIMAL.
+    for row in totals:
+        row['sale_count'] = int(row['sale_count'] or 0)
+    return totals
+
+#These are the orders search results can be listed in, with the columns of their sort key. Each of them is the start of an
+#index, so a page of results is read from the index in order instead of finding and sorting every match first.
+SEARCH_ORDERS = {
+    'id': ('id',),
+    'store': ('store_code', 'transaction_date', 'id'),
+    'date': ('transaction_date', 'id'),
+    'amount': ('total_sale', 'id'),
+}
+
+#A store code prefix searched within a date range is turned into the list of matching stores, unless there are more than this.
+SEARCH_MAX_STORES = 1000
+
+#This function returns the order of the results of a search: by the first filter given out of the id, the store code, the
+#dates and the amounts, since that is the index that narrows the search down (the other filters are checked on the way).
+#Without any filter, the results are listed by date like the filtered pages.
+def search_order(store_code = None, id = None, min_total = None, max_total = None, start_date = None, end_date = None):
+    if id is not None:
+        return 'id'
+    if store_code:
+        return 'store'
+    if start_date is not None or end_date is not None:
+        return 'date'
+    if min_total is not None or max_total is not None:
+        return 'amount'
+    return 'date'
+
+#This function builds the WHERE clause of a search and its values. Every filter is optional: 'store_code' is a prefix
+#(ie. 'TX' matches 'TX001', in any case), 'id' an exact id, and the amounts and dates are inclusive bounds.
+#If 'store_codes' is given, it replaces the prefix with the list of stores it matches.
+def search_conditions(store_code = None, id = None, min_total = None, max_total = None, start_date = None, end_date = None,
+                      store_codes = None):
+    conditions = []
+    values = []
+    if id is not None:
+        conditions.append("id = %s")
+        values.append(id)
+    if store_codes is not None:
+        conditions.append(get_backend().store_code_sql + " IN (" + ', '.join(['%s'] * len(store_codes)) + ")")
+        values += store_codes
+    elif store_code:
+        #'!' escapes the characters LIKE would treat as wildcards, so they are matched as they are.
+        conditions.append(get_backend().store_code_sql + " LIKE %s ESCAPE '!'")
+        values.append(store_code.replace('!', '!!').replace('%', '!%').replace('_', '!_') + '%')
+    if min_total is not None:
+        conditions.append("total_sale >= %s")
+        values.append(min_total)
+    if max_total is not None:
+        conditions.append("total_sale <= %s")
+        values.append(max_total)
+    if start_date is not None:
+        conditions.append("transaction_date >= %s")
+        values.append(start_date)
+    if end_date is not None:
+        conditions.append("transaction_date <= %s")
+        values.append(end_date)
+    return conditions, values
+
+#This function returns the store codes starting with 'store_code' that have sales between the two dates, read from the daily
+#summary. Searching those stores one by one lets the database jump to the dates of each of them in the store index, instead
+#of reading every sale of every matching store to check its date. It returns None if there are too many of them.
+@cached_query
+def search_store_codes(store_code, start_date = None, end_date = None):
+    conditions, values = search_conditions(store_code, start_date = start_date, end_date = end_date)
+    query = "SELECT DISTINCT store_code FROM sales_daily_summary WHERE " + " AND ".join(conditions) + " LIMIT %s"
+    with pooled_connection('search_store_codes', read_only = True) as sql_cxn:
+        cur = sql_cxn.cursor()
+        cur.execute(query, values + [SEARCH_MAX_STORES + 1])
+        store_codes = sorted(row[0] for row in cur.fetchall())
+        cur.close()
+    return store_codes if len(store_codes) <= SEARCH_MAX_STORES else None
+
+#This function will return a single page of the entries matching a search (see 'search_conditions()'), in the order given
+#by 'search_order()'. One entry more than 'per_page' is returned if there is a next page, so the caller can tell without
+#counting. If 'after' is given, it should be a cursor made by 'search_cursor()' from the last row of the previous page, and
+#the page starts right after that row.
+@cached_query
+def search_entries(store_code = None, id = None, min_total = None, max_total = None, start_date = None, end_date = None,
+                   page = 1, per_page = 25, after = None):
+    filters = (store_code, id, min_total, max_total, start_date, end_date)
+    order = search_order(*filters)
+
+    store_codes = None
+    if order == 'store' and (start_date is not None or end_date is not None):
+        store_codes = search_store_codes(store_code, start_date, end_date)
+        if store_codes == []:
+            return []
+
+    conditions, values = search_conditions(*filters, store_codes = store_codes)
+    columns = [get_backend().store_code_sql if column == 'store_code' else column for column in SEARCH_ORDERS[order]]
+
+    #The first column is also compared on its own, which lets the database start reading the index at the cursor.
+    offset = (page - 1) * per_page
+    if after is not None:
+        after_values = parse_search_cursor(after, order)
+        conditions.append(columns[0] + " >= %s")
+        conditions.append("(" + ', '.join(columns) + ") > (" + ', '.join(['%s'] * len(columns)) + ")")
+        values += [after_values[0]] + after_values
+        offset = 0
+
+    query = "SELECT * FROM sales"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY " + ', '.join(columns) + " LIMIT %s OFFSET %s"
+
+    with pooled_connection('search_entries', read_only = True) as sql_cxn:
+        cur = sql_cxn.cursor(dictionary = True)
+        cur.execute(query, values + [per_page + 1, offset])
+        items_on_page = cur.fetchall()
+        cur.close()
+    return items_on_page
+
+#This function will count the entries matching a search when it can be done without reading many rows, and returns a
+#(total, more) pair:
+#   - Searches by store code and dates only are counted exactly from the daily summary.
+#   - Searches by id, or by amounts only, are counted from their index, up to 'limit'. If 'more' is True, there are more
+#     than 'total' results.
+#   - Other searches (amounts together with a store code or dates) would have to read every sale of the stores or dates
+#     to check their amount, so they are not counted and 'total' is None.
+@cached_query
+def count_search(store_code = None, id = None, min_total = None, max_total = None, start_date = None, end_date = None,
+                 limit = 10000):
+    amounts = min_total is not None or max_total is not None
+    if id is None and amounts and (store_code or start_date is not None or end_date is not None):
+        return None, False
+
+    conditions, values = search_conditions(store_code, id, min_total, max_total, start_date, end_date)
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    if id is None and not amounts:
+        query = "SELECT COALESCE(SUM(sale_count), 0) AS total FROM sales_daily_summary" + where
+    else:
+        query = "SELECT COUNT(*) AS total FROM (SELECT 1 FROM sales" + where + " LIMIT %s) AS matches"
+        values.append(limit + 1)
+
+    with pooled_connection('count_search', read_only = True) as sql_cxn:
+        cur = sql_cxn.cursor(dictionary = True)
+        cur.execute(query, values)
+        total = int(cur.fetchone()['total'])
+        cur.close()
+    if id is None and not amounts:
+        return total, False
+    return min(total, limit), total > limit
 
-    #SQL query for inserting data into database.
-    sql_query = ("INSERT INTO sales (id, store_code, total_sale, transaction_date) VALUES (%s, %s, %s, %s)")
-    values = (id, store_code, total_sale, transaction_date)
-    cur.execute(sql_query, values)
+#This function will allow you to add an entry to the database.
+def add_entry(id = '', store_code = '', total_sale = '', transaction_date = ''):
 
-    #Commit changes to data base and close.
-    sql_cxn.commit()
-    cur.close()
-    sql_cxn.close()
+    #Comments for functionality included already within 'def all_entries()'.
+    with pooled_connection('add_entry') as sql_cxn:
+        cur = sql_cxn.cursor(dictionary = True)
+
+        #Formatting our 'transaction_date'
+        transaction_date = format_transaction_date(transaction_date)
+
+        #Formatting 'total_sale'.
+        total_sale = format_total_sale(total_sale)
+
+        #SQL query for inserting data into database.
+        sql_query = ("INSERT INTO sales (id, store_code, total_sale, transaction_date) VALUES (%s, %s, %s, %s)")
+        values = (id, store_code, total_sale, transaction_date)
+
+        #'id' is the primary key, so the database itself refuses a duplicate 'id' without us having to look for it first.
+        #If it is a duplicate, you will be given a flash message and redirected to the 'home' page.
+        #The entry and the daily summary are written in one transaction.
+        backend = get_backend()
+        sql_cxn.start_transaction()
+        try:
+            cur.execute(sql_query, values)
+        except backend.IntegrityError as error:
+            sql_cxn.rollback()
+            cur.close()
+            if not backend.is_duplicate_key(error):
+                raise
+            flash("That ID is already contained within the database!")
+            return redirect(url_for('home'))
+
+        #This represents number of rows affected (0 or 1).
+        add_result = cur.rowcount
+
+        #Update the summary of the store and day of the new entry.
+        refresh_groups(cur, [(store_code, transaction_date)])
+
+        #Commit changes to data base and close the cursor. The connection goes back to the pool.
+        sql_cxn.commit()
+        cur.close()
 
-    #This represents number of rows affected (0 or 1).
-    add_result = cur.rowcount
+    #Remove the cached results that could contain the new entry.
+    sales_changed([transaction_date], [id])
 
     #Will return 1 if addition was successful.
     return add_result
 
 #This function will allow you to edit an entry within the database.
 def edit_entry(id = '', store_code = '', total_sale = '', transaction_date = ''):
-    sql_cxn = dbConnection()
-    cur = sql_cxn.cursor(dictionary = True)
+    with pooled_connection('edit_entry') as sql_cxn:
+        cur = sql_cxn.cursor(dictionary = True)
+
+        # Formatting our 'transaction_date'
+        transaction_date = format_transaction_date(transaction_date)
 
-    # Formatting our 'transaction_date'
-    transaction_date = format_transaction_date(transaction_date)
+        #Formatting our 'total_sale'
+        total_sale = format_total_sale(total_sale)
 
-    #Formatting our 'total_sale'
-    total_sale = format_total_sale(total_sale)
+        #The entry and the daily summary are written in one transaction.
+        sql_cxn.start_transaction()
 
-    #SQL query for editing and updating data wihtin the database.
-    sql_query = ("UPDATE sales SET store_code = %s, total_sale = %s, transaction_date = %s WHERE id = %s")
-    values = (store_code, total_sale, transaction_date, id)
-    cur.execute(sql_query, values)
+        #The old store and date are needed to know which summary rows and cached date ranges held the entry before the edit.
+        old_store_code, old_date = entry_group(cur, id)
 
-    #Commit changes to data base and close.
-    sql_cxn.commit()
-    cur.close()
-    sql_cxn.close()
+        #SQL query for editing and updating data wihtin the database.
+        sql_query = ("UPDATE sales SET store_code = %s, total_sale = %s, transaction_date = %s WHERE id = %s")
+        values = (store_code, total_sale, transaction_date, id)
+        cur.execute(sql_query, values)
 
-    #This represents the number of rows that were modified. 
-    edit_result = cur.rowcount 
+        #This represents the number of rows that were modified. 
+        edit_result = cur.rowcount 
+
+        #Update the summary of the store and day the entry was in before and after the edit.
+        if old_date is not None:
+            refresh_groups(cur, [(old_store_code, old_date), (store_code, transaction_date)])
+
+        #Commit changes to data base and close the cursor.
+        sql_cxn.commit()
+        cur.close()
+
+    #Remove the cached results that held the entry before or after the edit.
+    sales_changed([old_date, transaction_date], [id])
     return edit_result
 
 #This function will allow you to delete an entry from the database.
 def delete_entry(id = ''):
-    sql_cxn = dbConnection()
-    cur = sql_cxn.cursor(dictionary = True)
+    with pooled_connection('delete_entry') as sql_cxn:
+        cur = sql_cxn.cursor(dictionary = True)
+
+        #The entry and the daily summary are written in one transaction.
+        sql_cxn.start_transaction()
+
+        #The store and date are needed to know which summary row and cached date ranges held the entry.
+        old_store_code, old_date = entry_group(cur, id)
 
-    #SQL query for deleting data wihtin the database.
-    sql_query = ("DELETE FROM sales WHERE id = %s")
+        #SQL query for deleting data wihtin the database.
+        sql_query = ("DELETE FROM sales WHERE id = %s")
 
-    #Since 'id' is a single value wrapped in parentheses, we include a comma so that it can be interpreted as a tuple.
-    values = (id,)
-    cur.execute(sql_query, values)
+        #Since 'id' is a single value wrapped in parentheses, we include a comma so that it can be interpreted as a tuple.
+        values = (id,)
+        cur.execute(sql_query, values)
 
-    #Commit changes to data base and close.
-    sql_cxn.commit()
-    cur.close()
-    sql_cxn.close()
+        #This represents the number of rows that were modified.
+        delete_result = cur.rowcount 
+
+        #Update the summary of the store and day the entry was in.
+        if old_date is not None:
+            refresh_groups(cur, [(old_store_code, old_date)])
+
+        #Commit changes to data base and close the cursor.
+        sql_cxn.commit()
+        cur.close()
 
-    #This represents the number of rows that were modified.
-    delete_result = cur.rowcount 
+    #Remove the cached results that held the deleted entry.
+    sales_changed([old_date], [id])
     return delete_result
 
 
 '''
 
-Included below are additional helper functions for formatting.
+The functions below handle many rows at once. Each of them checks every row first, finds duplicates or missing ids with
+a single query, and then writes all the valid rows with 'executemany' inside one transaction. They return one result
+per row, in the same order as the rows were given, with a 'status' of either 'ok' or 'error' (and an 'error' message).
 
 '''
 
-#This helper function is designed to format the dates. In HTML, dates are represented as YYYY-MM-DD, whereas in our MySQLdatabase 
-#the dates are formatted as MM/DD/YYYY with no trailing zeroes.
-def format_transaction_date(transaction_date):
+#This function will add many entries to the database at once. 'rows' is a list of dictionaries with the same keys as the
+#'sales' table. If 'raise_errors' is True, a database error raises instead of being reported in the results.
+def add_entries(rows, raise_errors = False):
+    results, valid = check_rows(rows)
+    refuse_repeated_ids(valid, results)
+
+    with pooled_connection('add_entries') as sql_cxn:
+        cur = sql_cxn.cursor(dictionary = True)
+
+        #One query finds every 'id' that is already contained within the database.
+        existing = existing_entries(cur, [values[0] for values in valid.values()])
+        for index, values in list(valid.items()):
+            if values[0] in existing:
+                del valid[index]
+                results[index] = row_error(values[0], "That ID is already contained within the database!")
+
+        sql_query = "INSERT INTO sales (id, store_code, total_sale, transaction_date) VALUES (%s, %s, %s, %s)"
+        groups = [(values[1], values[3]) for values in valid.values()]
+        write_rows(sql_cxn, cur, sql_query, list(valid.values()), valid, results, groups, raise_errors)
+        cur.close()
 
-    # Convert the transaction_date string to a datetime object
-    transaction_date_obj = datetime.strptime(transaction_date, '%Y-%m-%d')
+    sales_changed([values[3] for values in valid.values()], [values[0] for values in valid.values()])
+    return results
 
-    # Format the datetime object to the desired format without leading zeroes
-    transaction_date_formatted = transaction_date_obj.strftime('%m/%d/%Y')
+#This function will edit many entries at once. Every row must contain all four columns.
+def edit_entries(rows):
+    results, valid = check_rows(rows)
 
-    # Remove leading zeroes from day and month if present
-    transaction_date_final = '/'.join(str(int(x)) for x in transaction_date_formatted.split('/'))
+    with pooled_connection('edit_entries') as sql_cxn:
+        cur = sql_cxn.cursor(dictionary = True)
 
-    return transaction_date_final
+        #One query finds which ids exist, together with their current store and date (needed to update the summary and the cache).
+        old_entries = existing_entries(cur, [values[0] for values in valid.values()])
+        for index, values in list(valid.items()):
+            if values[0] not in old_entries:
+                del valid[index]
+                results[index] = row_error(values[0], "That ID is not contained within the database!")
 
-#This helper function is designed to format the 'total_sale' amount like the other values in our MySQL database.
-def format_total_sale(total_sale):
+        sql_query = "UPDATE sales SET store_code = %s, total_sale = %s, transaction_date = %s WHERE id = %s"
+        parameters = [(store_code, total_sale, transaction_date, id) for id, store_code, total_sale, transaction_date in valid.values()]
+        groups = [old_entries[values[0]] for values in valid.values()] + [(values[1], values[3]) for values in valid.values()]
+        write_rows(sql_cxn, cur, sql_query, parameters, valid, results, groups)
+        cur.close()
+
+    sales_changed([old_entries[values[0]][1] for values in valid.values()] + [values[3] for values in valid.values()],
+                  [values[0] for values in valid.values()])
+    return results
+
+#This function will delete many entries at once. 'ids' is a list of ids, or of dictionaries with an 'id' key.
+def delete_entries(ids):
+    results = [None] * len(ids)
+    valid = {}
+    for index, id in enumerate(ids):
+        if isinstance(id, dict):
+            id = id.get('id')
+        try:
+            valid[index] = (int(id),)
+        except (TypeError, ValueError):
+            results[index] = row_error(id, "The ID must be a whole number!")
+    refuse_repeated_ids(valid, results)
+
+    with pooled_connection('delete_entries') as sql_cxn:
+        cur = sql_cxn.cursor(dictionary = True)
+
+        old_entries = existing_entries(cur, [values[0] for values in valid.values()])
+        for index, values in list(valid.items()):
+            if values[0] not in old_entries:
+                del valid[index]
+                results[index] = row_error(values[0], "That ID is not contained within the database!")
+
+        groups = [old_entries[values[0]] for values in valid.values()]
+        write_rows(sql_cxn, cur, "DELETE FROM sales WHERE id = %s", list(valid.values()), valid, results, groups)
+        cur.close()
 
-    #Convert total_sale to float and format it to two decimal places.
-    total_sale_formatted = '{:,.2f}'.format(float(total_sale))
+    sales_changed([old_entries[values[0]][1] for values in valid.values()], [values[0] for values in valid.values()])
+    return results
 
-    #Add dollar sign to the formatted total_sale.
-    total_sale_with_currency = '$' + str(total_sale_formatted)
+'''
 
-    return total_sale_with_currency
+Included below are additional helper functions for formatting.
 
+'''
 
+#This helper function is designed to convert the dates from HTML forms. In HTML, dates are represented as YYYY-MM-DD, and
+#our MySQL database stores them in a DATE column, so the string is turned into a 'date' object.
+def format_transaction_date(transaction_date):
+    return parse_input_date(transaction_date)
 
+#This helper function is designed to convert the 'total_sale' amount to a Decimal rounded to two decimal places, which is
+#how it is stored in our MySQL database.
+def format_total_sale(total_sale):
+    return parse_total_sale(total_sale)
+
+#This helper function is called after every write to the 'sales' table with the dates and ids of the entries that were written.
+#It updates those entries in the hot dataset (if it is used), removes the cached results that could contain them and bumps the
+#table version used for ETags. The hot dataset is updated first, so a result cached right after can't come from its old rows.
+#If no entry was written (all dates are None), nothing changed and nothing is done.
+def sales_changed(dates, ids = ()):
+    dates = [value for value in dates if value is not None]
+    if not dates:
+        return
+    hot_dataset_changed(ids)
+    query_cache.invalidate(dates)
+    sales_version.bump(ids)
+
+#This helper function returns the 'store_code' and 'transaction_date' of the entry with the given 'id', or (None, None) if
+#there isn't one. It is a primary key lookup, so it only reads a single row.
+def entry_group(cur, id):
+    cur.execute("SELECT store_code, transaction_date FROM sales WHERE id = %s", (id,))
+    row = cur.fetchone()
+    return (row['store_code'], row['transaction_date']) if row else (None, None)
+
+#This helper function builds the cursor for the row after which the next page of filtered data starts.
+#It looks like '2023-02-12_15' (the date of the row followed by its 'id'). The row can be a dictionary or a tuple.
+def date_cursor(row):
+    if isinstance(row, dict):
+        return row['transaction_date'].isoformat() + '_' + str(row['id'])
+    return row[3].isoformat() + '_' + str(row[0])
+
+#This helper function splits a cursor made by 'date_cursor()' back into its date and 'id'.
+#It will raise a ValueError if the cursor is not valid.
+def parse_date_cursor(cursor):
+    after_date, after_id = cursor.split('_')
+    return parse_input_date(after_date), int(after_id)
+
+#This helper function builds the cursor for the row after which the next page of search results starts. It holds the values
+#of the row's sort key joined with '_' (ie. 'TX001_2023-02-12_15' when the results are listed by store).
+def search_cursor(row, order):
+    return '_'.join(row[column].isoformat() if column == 'transaction_date' else str(row[column])
+                    for column in SEARCH_ORDERS[order])
+
+#This helper function splits a cursor made by 'search_cursor()' back into its values.
+#It will raise a ValueError if the cursor is not valid.
+def parse_search_cursor(cursor, order):
+    columns = SEARCH_ORDERS[order]
+
+    #A store code may contain '_' itself, so the cursor is split from the right.
+    parts = cursor.rsplit('_', len(columns) - 1)
+    if len(parts) != len(columns):
+        raise ValueError("Invalid cursor")
+    values = []
+    for column, part in zip(columns, parts):
+        if column == 'transaction_date':
+            values.append(parse_input_date(part))
+        elif column == 'total_sale':
+            try:
+                values.append(parse_total_sale(part))
+            except ArithmeticError:
+                raise ValueError("Invalid cursor")
+        elif column == 'id':
+            values.append(int(part))
+        else:
+            values.append(part)
+    return values
+
+#This helper function checks and converts every row given to 'add_entries()' or 'edit_entries()'.
+#It returns the list of results, where rows with a problem already have their error, and a dictionary mapping the
+#position of every valid row to its converted (id, store_code, total_sale, transaction_date) values.
+def check_rows(rows):
+    results = [None] * len(rows)
+    valid = {}
+    for index, row in enumerate(rows):
+        try:
+            store_code = str(row['store_code']).strip()
+            if not store_code or len(store_code) > 32:
+                raise ValueError("The store code must be between 1 and 32 characters long!")
+            valid[index] = (int(row['id']), store_code,
+                            format_total_sale(row['total_sale']), format_transaction_date(str(row['transaction_date'])))
+        except KeyError as error:
+            results[index] = row_error(row.get('id') if isinstance(row, dict) else None, "Missing column: " + str(error))
+        except (TypeError, AttributeError):
+            results[index] = row_error(None, "Each row must contain 'id', 'store_code', 'total_sale' and 'transaction_date'!")
+        except ValueError as error:
+            results[index] = row_error(row.get('id'), str(error))
+        except ArithmeticError:
+            results[index] = row_error(row.get('id'), "The total sale must be a number!")
+    return results, valid
+
+#This helper function refuses the rows repeating an 'id' that appears earlier in the same request. They are removed from
+#'valid' and get an error in 'results'.
+def refuse_repeated_ids(valid, results):
+    seen = set()
+    for index, values in list(valid.items()):
+        if values[0] in seen:
+            del valid[index]
+            results[index] = row_error(values[0], "That ID appears more than once in this request!")
+        seen.add(values[0])
+
+#This helper function returns a dictionary mapping each of the given ids that exists in the database to its
+#(store_code, transaction_date). The ids are looked up with one query per 1000 ids.
+def existing_entries(cur, ids):
+    entries = {}
+    ids = list(ids)
+    for start in range(0, len(ids), 1000):
+        chunk = ids[start:start + 1000]
+        placeholders = ', '.join(['%s'] * len(chunk))
+        cur.execute("SELECT id, store_code, transaction_date FROM sales WHERE id IN (" + placeholders + ")", chunk)
+        for row in cur.fetchall():
+            entries[row['id']] = (row['store_code'], row['transaction_date'])
+    return entries
+
+#This helper function runs 'sql_query' for every set of parameters inside one transaction and fills in the results of the
+#valid rows. The daily summary of the (store_code, transaction_date) 'groups' touched by the rows is updated in the same
+#transaction. If the transaction fails, it is rolled back, every valid row gets the error and 'valid' is emptied (or the error is
+#raised again if 'raise_errors' is True, ie. for the ingestion queue, which retries the whole batch).
+def write_rows(sql_cxn, cur, sql_query, parameters, valid, results, groups, raise_errors = False):
+    if not parameters:
+        return
+    try:
+        sql_cxn.start_transaction()
+        cur.executemany(sql_query, parameters)
+        refresh_groups(cur, groups)
+        sql_cxn.commit()
+    except get_backend().Error as error:
+        sql_cxn.rollback()
+        if raise_errors:
+            raise
+        for index, values in valid.items():
+            results[index] = row_error(values[0], "The batch could not be written: " + str(error))
+        valid.clear()
+        return
+    for index, values in valid.items():
+        results[index] = {'id': values[0], 'status': 'ok'}
+
+#This helper function builds the result of a row that could not be written.
+def row_error(id, message):
+    return {'id': id, 'status': 'error', 'error': message}
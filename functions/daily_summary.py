@@ -0,0 +1,117 @@
+'''
+
+This module maintains 'sales_daily_summary', a table holding one row per store and per day with the number of sales, their
+total, and the smallest and largest sale. Counting the entries of a date range or adding up their sales only has to read
+one row per store and day from it, instead of every sale in the range.
+
+The summary is kept up to date by the write functions in 'crud_functions.py' (and 'async_crud.py'): in the same transaction
+as the write, they call 'refresh_groups()' for every (store, day) group the write touched, which recomputes just those groups
+from 'sales'.
+
+A summary that is missing or out of date (ie. after loading rows by hand or after 'migrate_sales.py') can be rebuilt from
+the 'sales' table, a few days at a time so that no statement holds its locks for long:
+
+    python -m functions.daily_summary --rebuild --days 31
+
+'''
+#These are used to read the command line options and to walk through the date range.
+import argparse
+from datetime import timedelta
+
+#This turns the dates returned by the database into 'date' objects (SQLite returns them as text).
+from functions.query_cache import normalize_date
+
+#This query removes the summary rows of the groups being refreshed.
+DELETE_GROUPS = "DELETE FROM sales_daily_summary WHERE (store_code, transaction_date) IN ({groups})"
+
+#This query recomputes the summary rows of the groups being refreshed. The 'transaction_date IN' condition lets the
+#database use the date index; the groups that end up empty simply get no row.
+INSERT_GROUPS = (
+    "INSERT INTO sales_daily_summary (transaction_date, store_code, sale_count, total_sales, min_sale, max_sale) "
+    "SELECT transaction_date, store_code, COUNT(*), SUM(total_sale), MIN(total_sale), MAX(total_sale) FROM sales "
+    "WHERE transaction_date IN ({dates}) AND (store_code, transaction_date) IN ({groups}) "
+    "GROUP BY transaction_date, store_code"
+)
+
+#These queries rebuild the summary rows of a date range.
+DELETE_RANGE = "DELETE FROM sales_daily_summary WHERE transaction_date BETWEEN %s AND %s"
+INSERT_RANGE = (
+    "INSERT INTO sales_daily_summary (transaction_date, store_code, sale_count, total_sales, min_sale, max_sale) "
+    "SELECT transaction_date, store_code, COUNT(*), SUM(total_sale), MIN(total_sale), MAX(total_sale) FROM sales "
+    "WHERE transaction_date BETWEEN %s AND %s GROUP BY transaction_date, store_code"
+)
+
+#This is the number of groups refreshed by each pair of statements.
+GROUPS_PER_STATEMENT = 500
+
+#This generator yields the (query, values) statements that recompute the summary rows of the given
+#(store_code, transaction_date) groups.
+def refresh_statements(groups):
+    groups = sorted(set(group for group in groups if group is not None and group[1] is not None))
+    for start in range(0, len(groups), GROUPS_PER_STATEMENT):
+        chunk = groups[start:start + GROUPS_PER_STATEMENT]
+        dates = sorted(set(transaction_date for store_code, transaction_date in chunk))
+        group_placeholders = ', '.join(['(%s, %s)'] * len(chunk))
+        group_values = [value for group in chunk for value in group]
+
+        yield DELETE_GROUPS.format(groups = group_placeholders), group_values
+        yield (INSERT_GROUPS.format(dates = ', '.join(['%s'] * len(dates)), groups = group_placeholders),
+               dates + group_values)
+
+#This function recomputes the summary rows of the given groups with the cursor 'cur'.
+#It must be called inside the transaction of the write, after the write itself, so both are committed together.
+def refresh_groups(cur, groups):
+    for query, values in refresh_statements(groups):
+        cur.execute(query, values)
+
+#This function rebuilds the whole summary from the 'sales' table, 'days' days per transaction.
+def rebuild(sql_cxn, days = 31):
+
+    #Every batch is its own transaction, so nothing else may be left open between them.
+    sql_cxn.autocommit = True
+    cur = sql_cxn.cursor()
+    try:
+        cur.execute("SELECT MIN(transaction_date), MAX(transaction_date) FROM sales")
+        first_date, last_date = [normalize_date(value) for value in cur.fetchone()]
+
+        #Summary rows outside of the range of the sales are left over from deleted sales.
+        sql_cxn.start_transaction()
+        if first_date is None:
+            cur.execute("DELETE FROM sales_daily_summary")
+        else:
+            cur.execute("DELETE FROM sales_daily_summary WHERE transaction_date < %s OR transaction_date > %s",
+                        (first_date, last_date))
+        sql_cxn.commit()
+        if first_date is None:
+            return 0
+
+        groups = 0
+        start_date = first_date
+        while start_date <= last_date:
+            end_date = min(start_date + timedelta(days = days - 1), last_date)
+            sql_cxn.start_transaction()
+            cur.execute(DELETE_RANGE, (start_date, end_date))
+            cur.execute(INSERT_RANGE, (start_date, end_date))
+            groups += cur.rowcount
+            sql_cxn.commit()
+            print("Rebuilt the summary up to %s (%s groups so far)" % (end_date, groups))
+            start_date = end_date + timedelta(days = 1)
+        return groups
+    finally:
+        cur.close()
+
+#This will rebuild the summary from the command line.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Rebuild the 'sales_daily_summary' table from the 'sales' table.")
+    parser.add_argument('--rebuild', action = 'store_true', required = True)
+    parser.add_argument('--days', type = int, default = 31, help = "number of days rebuilt per transaction")
+    args = parser.parse_args()
+
+    from functions.SQL_Connection import get_backend
+    backend = get_backend()
+    sql_cxn = backend.connect()
+    try:
+        backend.create_schema(sql_cxn)
+        print("Rebuilt %s groups." % rebuild(sql_cxn, args.days))
+    finally:
+        sql_cxn.close()
@@ -0,0 +1,81 @@
+'''
+
+This module contains the single formatting layer of the app. It converts values in both directions:
+
+    - From the database to the templates: 'format_rows()' takes a whole page of entries at once and adds ready-to-render
+      versions of 'total_sale' and 'transaction_date', so the templates don't have to run a filter for every row.
+    - From the HTML forms to the database: 'parse_total_sale()' and 'parse_input_date()' turn the text typed by the user
+      into the Decimal and date values stored in MySQL.
+
+Dates repeat a lot (many sales happen on the same day), so every date conversion is memoized.
+
+'''
+#These are used to convert amounts and dates.
+import re
+from datetime import date
+from decimal import Decimal
+from functools import lru_cache
+
+#This is used to round amounts to whole cents.
+CENTS = Decimal('0.01')
+
+#Amounts are stored as DECIMAL(12,2), so they must be smaller than this (in absolute value).
+MAX_TOTAL_SALE = Decimal(10) ** 10
+
+#This pattern matches the characters allowed around an amount typed by the user (ie. '$1,117.77 ').
+AMOUNT_NOISE = re.compile(r'[\s$,]')
+
+#This pattern matches a date from an HTML form.
+INPUT_DATE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+#This function gives the 'transaction_date' in the format shown in the tables (ie. 3/25/2023, without leading zeroes).
+@lru_cache(maxsize = 4096)
+def display_date(transaction_date):
+    return '%d/%d/%d' % (transaction_date.month, transaction_date.day, transaction_date.year)
+
+#This function gives the 'transaction_date' in the format used by 'date' inputs (ie. 2023-03-25).
+@lru_cache(maxsize = 4096)
+def input_date(transaction_date):
+    return transaction_date.isoformat()
+
+#This function gives the 'total_sale' value as currency (ie. $1,117.77).
+def display_total_sale(total_sale):
+    return '${:,.2f}'.format(total_sale)
+
+#This function gives the 'total_sale' value in the format used by 'number' inputs (ie. 1117.77).
+def input_total_sale(total_sale):
+    return '{:.2f}'.format(total_sale)
+
+#This function takes a list of entries and returns a new list where every entry also has the ready-to-render values
+#'total_sale_display', 'total_sale_input', 'transaction_date_display' and 'transaction_date_input'.
+#New dictionaries are created because the given entries may be shared with the query cache.
+def format_rows(rows):
+    return [dict(row,
+                 total_sale_display = display_total_sale(row['total_sale']),
+                 total_sale_input = input_total_sale(row['total_sale']),
+                 transaction_date_display = display_date(row['transaction_date']),
+                 transaction_date_input = input_date(row['transaction_date']))
+            for row in rows]
+
+#This function converts an amount typed by the user (ie. '1117.77' or '$1,117.77') to a Decimal rounded to whole cents.
+#It raises a decimal.InvalidOperation error if the text isn't a number, and a ValueError if it is not a finite amount that
+#fits in the DECIMAL(12,2) column of the database (ie. 'NaN', 'Infinity' or '1e20'), which would make the whole write fail.
+def parse_total_sale(total_sale):
+    if isinstance(total_sale, str):
+        total_sale = AMOUNT_NOISE.sub('', total_sale)
+    total_sale = Decimal(str(total_sale))
+    if not total_sale.is_finite():
+        raise ValueError("The total sale must be a number!")
+    if abs(total_sale) < MAX_TOTAL_SALE:
+        total_sale = total_sale.quantize(CENTS)
+    if abs(total_sale) >= MAX_TOTAL_SALE:
+        raise ValueError("The total sale must be less than 10,000,000,000!")
+    return total_sale
+
+#This function converts a date from an HTML form (YYYY-MM-DD) to a 'date' object.
+#It raises a ValueError if the text isn't a valid date.
+@lru_cache(maxsize = 4096)
+def parse_input_date(transaction_date):
+    if not INPUT_DATE.fullmatch(transaction_date):
+        raise ValueError("The date must be given as YYYY-MM-DD!")
+    return date.fromisoformat(transaction_date)
@@ -0,0 +1,636 @@
+'''
+
+This module keeps an in-memory copy of the 'sales' table (the "hot dataset"), used when 'HOT_DATASET_ENABLED' is 1. The
+listing, date range and paging reads of 'crud_functions.py' ('entries_page()', 'entries_by_date_page()', 'count_entries()'...)
+are then served from it instead of MySQL, and return exactly the same rows.
+
+The table is held as a few NumPy arrays instead of a dictionary per row, which takes about 28 bytes per row instead of several
+hundred:
+
+    - 'ids' (sorted), 'cents' (the total sale in cents), 'days' (the date as a day number, see 'date.toordinal()') and
+      'stores' (the position of the store code in 'store_codes', where every store code is kept once).
+    - 'date_days' and 'date_ids': the day and id of every row sorted by day and then by id, the same order as the
+      (transaction_date, id) index of MySQL. A date range or a date cursor is found with a binary search on them.
+
+The arrays are never changed in place. A write builds new arrays and swaps them in at once, so a read always sees the table
+either before or after a write, without taking any lock.
+
+It is kept up to date in two ways:
+
+    - Every write made through 'crud_functions.py' hands the ids it wrote to 'hot_dataset_changed()', which reads those rows
+      again from the primary and inserts, updates or removes them (a missing row was deleted).
+    - Writes made by the other workers of 'serve.py' are applied before this process serves anything read after them. Their
+      ids come from the change log of the table version the workers share (see 'TableVersion.refresh()' in 'query_cache.py'),
+      and those rows are read again the same way. If this process missed too many of them, it reconciles right away (below).
+    - Writes made by other processes (ie. by hand) are found by a background thread. Every 'HOT_DATASET_RECONCILE_SECONDS'
+      seconds, it adds up the number of sales and their total per store and day and compares them with
+      'sales_daily_summary'. The days that differ are read again from the primary.
+
+NumPy is needed (pip install numpy). Without it, the reads simply go to the database. The memory used per million rows can be
+measured with:
+
+    python -m functions.hot_dataset --report
+
+'''
+#These are used to read the options, run the background thread and time the loads.
+import os
+import sys
+import time
+import logging
+import argparse
+import functools
+import threading
+from datetime import date
+from decimal import Decimal
+
+#NumPy is optional. Since it takes a while to import, it is only imported by 'load_numpy()' when the hot dataset is used.
+np = None
+
+#This holds the configuration.
+from functions import settings
+
+#This will be used to read the table from the primary.
+from functions.SQL_Connection import pooled_connection
+
+#This turns the dates returned by the database into 'date' objects, and estimates the memory used by rows as dictionaries.
+#The table version tells about the writes made by the other workers of 'serve.py'.
+from functions.query_cache import normalize_date, estimate_size, sales_version
+
+logger = logging.getLogger(__name__)
+
+#These are the columns of the 'sales' table, in the order the rows are returned as tuples.
+COLUMNS = "id, store_code, total_sale, transaction_date"
+
+#This is the number of rows read from the database at a time while loading.
+LOAD_CHUNK_SIZE = 100000
+
+#A write touching more rows than this rebuilds the arrays from scratch instead of inserting and removing the rows one by one.
+REBUILD_ROWS = 5000
+
+#This class holds the arrays of one version of the table. It is never changed once built.
+class Snapshot:
+
+    def __init__(self, ids, cents, days, stores, date_days, date_ids):
+        self.ids = ids
+        self.cents = cents
+        self.days = days
+        self.stores = stores
+        self.date_days = date_days
+        self.date_ids = date_ids
+
+    #This function returns the number of bytes used by every array.
+    def nbytes(self):
+        return {name: getattr(self, name).nbytes for name in ('ids', 'cents', 'days', 'stores', 'date_days', 'date_ids')}
+
+#This function returns the NumPy type used for the ids: 32 bits (like the INT column of MySQL), unless an id doesn't fit.
+def id_dtype(*arrays):
+    limits = np.iinfo(np.int32)
+    for array in arrays:
+        if len(array) and (array.min() < limits.min or array.max() > limits.max):
+            return np.int64
+    return np.int32
+
+#This function returns the position of 'value' in a sorted array, like 'np.searchsorted()'. The value is converted to the type
+#of the array first: otherwise NumPy converts the whole array to the type of the value, which takes a copy of it.
+def search(array, value, side = 'left'):
+    limits = np.iinfo(array.dtype)
+    if value < limits.min:
+        return 0
+    if value > limits.max:
+        return len(array)
+    return int(np.searchsorted(array, array.dtype.type(value), side))
+
+#This function returns the position of the row with the given day and id in the (date_days, date_ids) order, or the
+#position it would be inserted at. With side = 'right', it is the position of the first row after it.
+def date_position(date_days, date_ids, day, id, side = 'left'):
+    start = search(date_days, day, 'left')
+    end = search(date_days, day, 'right')
+    return start + search(date_ids[start:end], id, side)
+
+#This class represents the hot dataset. It holds the current snapshot, the store codes, and the thread that reconciles it.
+class HotDataset:
+
+    def __init__(self, reconcile_seconds = 60):
+        self.reconcile_seconds = reconcile_seconds
+        self.snapshot = None
+
+        #Every store code is kept once. Codes are only ever added, so older snapshots can still use the list.
+        self.store_codes = []
+        self.store_index = {}
+
+        #This lock is held while the snapshot is being replaced, so writes are applied one at a time and in order.
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.thread = None
+        self.thread_lock = threading.Lock()
+
+        #These counters are exposed through 'stats()'.
+        self.load_ms = None
+        self.loaded_at = None
+        self.applied_rows = 0
+        self.reconciles = 0
+        self.reloaded_days = 0
+        self.last_reconcile_ms = None
+
+    '''
+
+    Loading and updating the arrays.
+
+    '''
+
+    #This function turns a list of (id, store_code, total_sale, transaction_date) tuples into arrays, sorted by id.
+    #It must be called while holding the lock, since it may add store codes.
+    def columns(self, rows):
+        store_index = self.store_index
+        for store_code in set(row[1] for row in rows):
+            if store_code not in store_index:
+                store_index[store_code] = len(self.store_codes)
+                self.store_codes.append(store_code)
+
+        count = len(rows)
+        ids = np.fromiter((row[0] for row in rows), np.int64, count)
+
+        #An amount has at most 12 digits (DECIMAL(12,2)), which a float holds exactly, and converting through a float is
+        #faster than multiplying every Decimal.
+        cents = np.rint(np.fromiter((float(row[2]) for row in rows), np.float64, count) * 100).astype(np.int64)
+        days = np.fromiter((row[3].toordinal() for row in rows), np.int32, count)
+        stores = np.fromiter((store_index[row[1]] for row in rows), np.int32, count)
+        order = np.argsort(ids, kind = 'stable')
+        return ids[order], cents[order], days[order], stores[order]
+
+    #This function builds a snapshot from the columns of every row, sorting them and building the date order.
+    def build(self, ids, cents, days, stores):
+        order = np.argsort(ids, kind = 'stable')
+        ids, cents, days, stores = ids[order], cents[order], days[order], stores[order]
+        date_order = np.lexsort((ids, days))
+        ids = ids.astype(id_dtype(ids))
+        return Snapshot(ids, cents, days, stores, days[date_order], ids[date_order])
+
+    #This function reads every row from the primary and replaces the snapshot. The rows are read in chunks, so only one
+    #chunk of them is held as Python objects at a time.
+    def load(self):
+        started = time.perf_counter()
+        with self.lock:
+            parts = []
+            with pooled_connection('hot_dataset_load', count_write = False) as sql_cxn:
+                cur = sql_cxn.cursor(buffered = False)
+                cur.execute("SELECT " + COLUMNS + " FROM sales ORDER BY id")
+                while True:
+                    rows = cur.fetchmany(LOAD_CHUNK_SIZE)
+                    if not rows:
+                        break
+                    parts.append(self.columns(rows))
+                cur.close()
+
+            empty = [np.empty(0, dtype) for dtype in (np.int64, np.int64, np.int32, np.int32)]
+            self.snapshot = self.build(*(np.concatenate([part[index] for part in parts] + [empty[index]])
+                                         for index in range(4)))
+        self.load_ms = (time.perf_counter() - started) * 1000
+        self.loaded_at = time.time()
+        logger.info("event=hot_dataset_load rows=%d stores=%d duration_ms=%.1f", len(self.snapshot.ids),
+                    len(self.store_codes), self.load_ms)
+
+    #This function reads the rows with the given ids from the primary.
+    def read_ids(self, ids):
+        rows = []
+        with pooled_connection('hot_dataset_read_ids', count_write = False) as sql_cxn:
+            cur = sql_cxn.cursor()
+            for start in range(0, len(ids), 1000):
+                chunk = ids[start:start + 1000]
+                cur.execute("SELECT " + COLUMNS + " FROM sales WHERE id IN (" + ', '.join(['%s'] * len(chunk)) + ")", chunk)
+                rows.extend(cur.fetchall())
+            cur.close()
+        return rows
+
+    #This function is called after a write with the ids it wrote. The rows are read again and replace the ones in memory; the
+    #ids that are not found anymore were deleted. The rows are read while holding the lock, so that when two writes to the
+    #same row are applied one after the other, the last one applied is the one that read the latest version.
+    def refresh_ids(self, ids):
+        ids = sorted(set(int(id) for id in ids))
+        if not ids:
+            return
+        with self.lock:
+            if self.snapshot is None:
+                return
+            rows = self.read_ids(ids)
+            self.snapshot = self.apply(self.snapshot, np.array(ids, np.int64), self.columns(rows))
+            self.applied_rows += len(ids)
+
+    #This function returns a new snapshot where the rows with the ids in 'removed' are taken out and the given rows (as
+    #columns) are put in. Small changes are made with one binary search per row; big ones rebuild the arrays.
+    def apply(self, snapshot, removed, columns):
+        ids, cents, days, stores = columns
+
+        if len(removed) + len(ids) > REBUILD_ROWS:
+            keep = ~np.isin(snapshot.ids, removed)
+            return self.build(*(np.concatenate((getattr(snapshot, name)[keep], column))
+                                for name, column in zip(('ids', 'cents', 'days', 'stores'), columns)))
+
+        #The rows to take out are found by id, and then by day and id in the date order. Ids too big for the id array can't be
+        #in it.
+        limits = np.iinfo(snapshot.ids.dtype)
+        removed = removed[(removed >= limits.min) & (removed <= limits.max)].astype(snapshot.ids.dtype)
+        positions = np.searchsorted(snapshot.ids, removed)
+        found = positions < len(snapshot.ids)
+        found[found] = snapshot.ids[positions[found]] == removed[found]
+        positions = positions[found]
+        date_positions = np.array([date_position(snapshot.date_days, snapshot.date_ids, snapshot.days[position],
+                                                 snapshot.ids[position]) for position in positions], np.intp)
+
+        new_ids = np.delete(snapshot.ids, positions)
+        new_cents = np.delete(snapshot.cents, positions)
+        new_days = np.delete(snapshot.days, positions)
+        new_stores = np.delete(snapshot.stores, positions)
+        date_days = np.delete(snapshot.date_days, date_positions)
+        date_ids = np.delete(snapshot.date_ids, date_positions)
+
+        #An id too big for 32 bits turns the id arrays into 64 bits ones.
+        dtype = id_dtype(ids)
+        if dtype != new_ids.dtype and dtype == np.int64:
+            new_ids = new_ids.astype(np.int64)
+            date_ids = date_ids.astype(np.int64)
+
+        #The new rows are put in at the position given by a binary search. Rows put in at the same position keep their order.
+        ids = ids.astype(new_ids.dtype)
+        at = np.searchsorted(new_ids, ids)
+        new_ids = np.insert(new_ids, at, ids)
+        new_cents = np.insert(new_cents, at, cents)
+        new_days = np.insert(new_days, at, days)
+        new_stores = np.insert(new_stores, at, stores)
+
+        date_order = np.lexsort((ids, days))
+        at = np.array([date_position(date_days, date_ids, days[index], ids[index]) for index in date_order], np.intp)
+        date_days = np.insert(date_days, at, days[date_order])
+        date_ids = np.insert(date_ids, at, ids[date_order])
+        return Snapshot(new_ids, new_cents, new_days, new_stores, date_days, date_ids)
+
+    '''
+
+    Reconciling with the database.
+
+    '''
+
+    #This function returns a dictionary mapping every (day, store code) to its number of sales and their total in cents,
+    #computed from the arrays. Store codes are compared in upper case, since MySQL groups them without regard to case.
+    def group_totals(self, snapshot):
+        totals = {}
+        if not len(snapshot.ids):
+            return totals
+        #Every (day, store) gets a number, and the rows are added up by number. If the days are spread too far apart for one
+        #counter per possible number, the numbers in use are found by sorting them instead.
+        first_day = int(snapshot.days.min())
+        keys = (snapshot.days - first_day).astype(np.int64) * len(self.store_codes) + snapshot.stores
+        if int(keys.max()) < 4 * len(keys) + 100000:
+            counts = np.bincount(keys)
+            sums = np.bincount(keys, weights = snapshot.cents)
+            groups = np.flatnonzero(counts)
+            counts, sums = counts[groups], sums[groups]
+        else:
+            groups, inverse = np.unique(keys, return_inverse = True)
+            counts = np.bincount(inverse)
+            sums = np.bincount(inverse, weights = snapshot.cents)
+        sums = np.rint(sums).astype(np.int64)
+        for key, count, total in zip(groups.tolist(), counts.tolist(), sums.tolist()):
+            day, store = divmod(key, len(self.store_codes))
+            group = (first_day + day, self.store_codes[store].upper())
+            old_count, old_total = totals.get(group, (0, 0))
+            totals[group] = (old_count + count, old_total + total)
+        return totals
+
+    #This function returns the same dictionary as 'group_totals()', read from the daily summary.
+    def summary_totals(self):
+        totals = {}
+        with pooled_connection('hot_dataset_summary_totals', count_write = False) as sql_cxn:
+            cur = sql_cxn.cursor()
+            cur.execute("SELECT transaction_date, store_code, sale_count, total_sales FROM sales_daily_summary")
+            for transaction_date, store_code, sale_count, total_sales in cur.fetchall():
+                group = (normalize_date(transaction_date).toordinal(), store_code.upper())
+                old_count, old_total = totals.get(group, (0, 0))
+                totals[group] = (old_count + int(sale_count), old_total + int(Decimal(total_sales).scaleb(2)))
+            cur.close()
+        return totals
+
+    #This function reads the rows of the given days (day numbers) again and replaces them in the snapshot.
+    def reload_days(self, days):
+        rows = []
+        with pooled_connection('hot_dataset_reload_days', count_write = False) as sql_cxn:
+            cur = sql_cxn.cursor()
+            for start in range(0, len(days), 500):
+                chunk = [date.fromordinal(day) for day in days[start:start + 500]]
+                cur.execute("SELECT " + COLUMNS + " FROM sales WHERE transaction_date IN (" + ', '.join(['%s'] * len(chunk))
+                            + ")", chunk)
+                rows.extend(cur.fetchall())
+            cur.close()
+
+        #The rows of those days are taken out, together with rows that were moved to one of those days by another process.
+        ids, cents, day_numbers, stores = self.columns(rows)
+        snapshot = self.snapshot
+        keep = ~(np.isin(snapshot.days, np.array(days, np.int32)) | np.isin(snapshot.ids, ids))
+        self.snapshot = self.build(*(np.concatenate((getattr(snapshot, name)[keep], column))
+                                     for name, column in zip(('ids', 'cents', 'days', 'stores'),
+                                                             (ids, cents, day_numbers, stores))))
+
+    #This function compares the snapshot with the daily summary and reads the days that differ again. The cached results of
+    #those days are removed too. It returns the dates that were read again.
+    def reconcile(self):
+        from functions.query_cache import query_cache
+
+        started = time.perf_counter()
+        with self.lock:
+            summary = self.summary_totals()
+            memory = self.group_totals(self.snapshot)
+            days = sorted(set(group[0] for group in summary.keys() | memory.keys()
+                              if summary.get(group) != memory.get(group)))
+            if days:
+                self.reload_days(days)
+        dates = [date.fromordinal(day) for day in days]
+        if dates:
+            query_cache.invalidate(dates)
+            sales_version.bump()
+
+        self.reconciles += 1
+        self.reloaded_days += len(days)
+        self.last_reconcile_ms = (time.perf_counter() - started) * 1000
+        if days:
+            logger.info("event=hot_dataset_reconcile days=%d first=%s last=%s duration_ms=%.1f", len(days), dates[0],
+                        dates[-1], self.last_reconcile_ms)
+        return dates
+
+    #This function starts the background thread, if it isn't running. It loads the table first if it isn't loaded yet.
+    def start(self):
+        if self.thread is not None and self.thread.is_alive():
+            return
+        with self.thread_lock:
+            if self.thread is not None and self.thread.is_alive():
+                return
+            self.stopping.clear()
+            self.thread = threading.Thread(target = self.run, name = 'hot-dataset', daemon = True)
+            self.thread.start()
+
+    #This function is run by the background thread.
+    def run(self):
+        wait = 0 if self.snapshot is None else self.reconcile_seconds
+        while not self.stopping.wait(wait):
+            wait = self.reconcile_seconds
+            try:
+                if self.snapshot is None:
+                    self.load()
+                else:
+                    self.reconcile()
+            except Exception:
+                logger.exception("event=hot_dataset_refresh status=error retry_in=%.1f", wait)
+
+    #This function stops the background thread.
+    def stop(self):
+        self.stopping.set()
+
+    '''
+
+    The reads. Each of them has the same name and parameters as the function of 'crud_functions.py' it replaces, and returns
+    the same rows.
+
+    '''
+
+    #This function turns the rows at the given positions into (id, store_code, total_sale, transaction_date) tuples, or into
+    #dictionaries if 'as_dict' is True.
+    def rows(self, snapshot, positions, as_dict = True):
+        store_codes = self.store_codes
+        days = snapshot.days[positions].tolist()
+        dates = {day: date.fromordinal(day) for day in set(days)}
+        rows = [(id, store_codes[store], Decimal(cents).scaleb(-2), dates[day]) for id, store, cents, day
+                in zip(snapshot.ids[positions].tolist(), snapshot.stores[positions].tolist(),
+                       snapshot.cents[positions].tolist(), days)]
+        if as_dict:
+            return [{'id': id, 'store_code': store_code, 'total_sale': total_sale, 'transaction_date': transaction_date}
+                    for id, store_code, total_sale, transaction_date in rows]
+        return rows
+
+    #This function returns the positions, in the date order, of the first row on or after 'start_date' and of the first row
+    #after 'end_date'. Dates that aren't valid match nothing, like they do in SQL.
+    def date_range(self, snapshot, start_date, end_date):
+        start_date, end_date = normalize_date(start_date), normalize_date(end_date)
+        if not isinstance(start_date, date) or not isinstance(end_date, date):
+            return 0, 0
+        start = search(snapshot.date_days, start_date.toordinal(), 'left')
+        end = search(snapshot.date_days, end_date.toordinal(), 'right')
+        return start, max(start, end)
+
+    #This function returns the positions of the rows between two positions of the date order.
+    def date_rows(self, snapshot, start, end):
+        return np.searchsorted(snapshot.ids, snapshot.date_ids[start:end])
+
+    #This function returns the positions of one page of rows sorted by id.
+    def id_page(self, snapshot, page, per_page, after_id):
+        if after_id is not None:
+            start = search(snapshot.ids, int(after_id), 'right')
+        else:
+            start = max((page - 1) * per_page, 0)
+        return np.arange(start, min(start + per_page, len(snapshot.ids)))
+
+    #This function returns the positions of one page of rows between two dates, sorted by date and then by id.
+    def date_page(self, snapshot, start_date, end_date, page, per_page, after):
+        from functions.crud_functions import parse_date_cursor
+
+        start, end = self.date_range(snapshot, start_date, end_date)
+        if after is not None:
+            after_date, after_id = parse_date_cursor(after)
+            start = max(start, date_position(snapshot.date_days, snapshot.date_ids, after_date.toordinal(), after_id, 'right'))
+        else:
+            start += max((page - 1) * per_page, 0)
+        return self.date_rows(snapshot, start, max(start, min(start + per_page, end)))
+
+    def all_entries(self):
+        snapshot = self.snapshot
+        return self.rows(snapshot, slice(None))
+
+    def entries_by_date(self, start_date, end_date):
+        snapshot = self.snapshot
+        return self.rows(snapshot, self.date_rows(snapshot, *self.date_range(snapshot, start_date, end_date)))
+
+    def entry_by_id(self, id):
+        snapshot = self.snapshot
+        try:
+            id = int(id)
+        except (TypeError, ValueError):
+            return None
+        position = search(snapshot.ids, id)
+        if position == len(snapshot.ids) or snapshot.ids[position] != id:
+            return None
+        return self.rows(snapshot, [position])[0]
+
+    def count_entries(self):
+        return len(self.snapshot.ids)
+
+    def count_entries_by_date(self, start_date, end_date):
+        start, end = self.date_range(self.snapshot, start_date, end_date)
+        return end - start
+
+    def entries_page(self, page = 1, per_page = 25, after_id = None):
+        snapshot = self.snapshot
+        return self.rows(snapshot, self.id_page(snapshot, page, per_page, after_id))
+
+    def entries_by_date_page(self, start_date, end_date, page = 1, per_page = 25, after = None):
+        snapshot = self.snapshot
+        return self.rows(snapshot, self.date_page(snapshot, start_date, end_date, page, per_page, after))
+
+    def entries_page_tuples(self, page = 1, per_page = 50, after_id = None):
+        snapshot = self.snapshot
+        return self.rows(snapshot, self.id_page(snapshot, page, per_page, after_id), as_dict = False)
+
+    def entries_by_date_page_tuples(self, start_date, end_date, page = 1, per_page = 50, after = None):
+        snapshot = self.snapshot
+        return self.rows(snapshot, self.date_page(snapshot, start_date, end_date, page, per_page, after), as_dict = False)
+
+    def entries_by_date_tuples(self, start_date, end_date):
+        snapshot = self.snapshot
+        return self.rows(snapshot, self.date_rows(snapshot, *self.date_range(snapshot, start_date, end_date)),
+                         as_dict = False)
+
+    #This function returns the size of the dataset and the memory it uses as a dictionary.
+    def stats(self):
+        snapshot = self.snapshot
+        if snapshot is None:
+            return {'loaded': False}
+        arrays = snapshot.nbytes()
+
+        #The store codes are counted with the list and dictionary that hold them.
+        store_bytes = (sys.getsizeof(self.store_codes) + sys.getsizeof(self.store_index)
+                       + sum(sys.getsizeof(code) for code in self.store_codes))
+        total = sum(arrays.values()) + store_bytes
+        rows = len(snapshot.ids)
+        return {
+            'loaded': True,
+            'rows': rows,
+            'stores': len(self.store_codes),
+            'array_bytes': arrays,
+            'store_code_bytes': store_bytes,
+            'bytes': total,
+            'bytes_per_row': round(total / rows, 1) if rows else 0,
+            'mb_per_million_rows': round(total / rows * 1000000 / 1048576, 1) if rows else 0,
+            'load_ms': round(self.load_ms, 1) if self.load_ms is not None else None,
+            'applied_rows': self.applied_rows,
+            'reconciles': self.reconciles,
+            'reloaded_days': self.reloaded_days,
+            'last_reconcile_ms': round(self.last_reconcile_ms, 1) if self.last_reconcile_ms is not None else None,
+        }
+
+#This function imports NumPy, if it wasn't already. It returns False if it isn't installed.
+def load_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return False
+        np = numpy
+    return True
+
+#This is the hot dataset of the process, created the first time it is needed.
+_dataset = None
+_dataset_lock = threading.Lock()
+
+#This function returns the hot dataset of the process, creating it if needed, or None if it isn't used. If 'start' is True,
+#the background thread is started too (it loads the table first if needed).
+def get_hot_dataset(start = True):
+    global _dataset
+    if not settings.HOT_DATASET_ENABLED:
+        return None
+    if not load_numpy():
+        logger.warning("event=hot_dataset status=disabled message=\"numpy is not installed\"")
+        settings.HOT_DATASET_ENABLED = False
+        return None
+    with _dataset_lock:
+        if _dataset is None:
+            _dataset = HotDataset(settings.HOT_DATASET_RECONCILE_SECONDS)
+        dataset = _dataset
+    if start:
+        dataset.start()
+    return dataset
+
+#This function loads the table into memory right away, without starting the background thread. 'create_app()' calls it, so
+#the workers of 'serve.py' share the arrays loaded by the main process instead of each loading their own.
+def load_hot_dataset():
+    dataset = get_hot_dataset(start = False)
+    if dataset is not None and dataset.snapshot is None:
+        dataset.load()
+    return dataset
+
+#This function is called by the write functions of 'crud_functions.py' with the ids of the rows they wrote.
+def hot_dataset_changed(ids):
+    if _dataset is not None:
+        _dataset.refresh_ids(ids)
+
+#This function is called with the ids written by another worker of 'serve.py', or None if they aren't known.
+def hot_dataset_shared_write(ids):
+    if _dataset is None or _dataset.snapshot is None:
+        return
+    if ids is None:
+        _dataset.reconcile()
+    else:
+        _dataset.refresh_ids(ids)
+
+sales_version.listeners.append(hot_dataset_shared_write)
+
+#This function returns the state of the hot dataset, or an empty dictionary if it isn't used.
+def hot_dataset_stats():
+    return _dataset.stats() if _dataset is not None else {}
+
+#This decorator serves a read function of 'crud_functions.py' from the hot dataset, through the method with the same name.
+#Until the table is loaded (or if the dataset isn't used), the function reads from the database as usual.
+def hot_read(function):
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        dataset = get_hot_dataset() if settings.HOT_DATASET_ENABLED else None
+        if dataset is None or dataset.snapshot is None:
+            return function(*args, **kwargs)
+
+        #The writes made by the other workers are applied first.
+        sales_version.refresh()
+        return getattr(dataset, function.__name__)(*args, **kwargs)
+
+    return wrapper
+
+#A worker process forked from this one (see 'start_worker()' in 'workers.py') keeps the arrays of its parent, which it
+#shares in memory until they are replaced, but not the background thread, which it starts again on its first read.
+def reset_after_fork():
+    global _dataset_lock
+    _dataset_lock = threading.Lock()
+    if _dataset is not None:
+        _dataset.lock = threading.Lock()
+        _dataset.thread_lock = threading.Lock()
+        _dataset.stopping = threading.Event()
+        _dataset.thread = None
+
+#This function loads the table and prints the memory used by the hot dataset, compared with the same rows as dictionaries.
+def report():
+    settings.HOT_DATASET_ENABLED = True
+    dataset = load_hot_dataset()
+    if dataset is None:
+        raise SystemExit("numpy is not installed")
+    stats = dataset.stats()
+    rows = stats['rows']
+    print("rows                    %12d" % rows)
+    print("stores                  %12d" % stats['stores'])
+    print("load time               %12.1f ms" % stats['load_ms'])
+    for name, nbytes in stats['array_bytes'].items():
+        print("%-23s %12d bytes (%s)" % (name, nbytes, getattr(dataset.snapshot, name).dtype))
+    print("store codes             %12d bytes" % stats['store_code_bytes'])
+    print("total                   %12d bytes (%.1f bytes per row)" % (stats['bytes'], stats['bytes_per_row']))
+    print("per million rows        %12.1f MB" % stats['mb_per_million_rows'])
+
+    #The rows as dictionaries (like 'all_entries()' returns them) are measured on a sample and scaled up.
+    sample = dataset.rows(dataset.snapshot, slice(0, min(rows, 10000)))
+    if sample:
+        dict_bytes = (estimate_size(sample) - sys.getsizeof(sample)) / len(sample)
+        print("as dictionaries         %12.1f MB per million rows (%.0f bytes per row, %.1fx)"
+              % (dict_bytes * 1000000 / 1048576, dict_bytes, dict_bytes / stats['bytes_per_row']))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Load the 'sales' table into memory and report the memory it uses.")
+    parser.add_argument('--report', action = 'store_true', help = "print the memory used per million rows")
+    args = parser.parse_args()
+    if args.report:
+        report()
+    else:
+        parser.print_help()
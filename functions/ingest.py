@@ -0,0 +1,325 @@
+'''
+
+This module contains the ingestion queue used by '/add_entry' when 'INGEST_MODE' is 'queue'. Instead of writing every new
+entry with its own transaction (and its own disk sync on the database server), the entry is checked, written to a local
+append-only log, and put in an in-process queue. The request is answered right away.
+
+A background thread takes the entries out of the queue in batches and writes every batch with 'add_entries()', in a single
+transaction (a "group commit"). A batch is written as soon as it holds 'INGEST_BATCH_SIZE' entries, or when its oldest entry
+has waited 'INGEST_MAX_LATENCY' seconds. If the database can't be reached (or the batch hits a deadlock), the batch is retried
+until it is written. If the database refuses the batch because of one of its entries, the entries are written one at a time
+instead: the ones it still refuses are moved to 'dead_letter.log' in the log folder (with the error), and the others are
+written as usual, so one bad entry doesn't hold up the whole queue.
+
+    - Backpressure: the queue holds at most 'INGEST_QUEUE_SIZE' entries. When it is full, 'submit()' waits a little for room
+      and then raises 'IngestQueueFull', which the route turns into '503 Service Unavailable'.
+    - Crash safety: the log is made of numbered files (segments) in 'INGEST_LOG_DIR'. A segment is removed once every entry
+      in it has been written to the database. When the queue starts, the entries of the segments left over by a crash are
+      queued again. Entries that were written just before the crash are refused as duplicate ids, so nothing is added twice.
+
+An entry is only visible on the pages once its batch has been written.
+
+'''
+#These are used to run the worker thread, write the log and time the batches.
+import os
+import json
+import time
+import atexit
+import logging
+import threading
+from collections import deque
+
+#This holds the configuration and the metrics.
+from functions import settings
+from functions import metrics
+
+#The batches are written by the bulk insert, and the entries are checked the same way it checks them.
+from functions.crud_functions import add_entries, check_rows
+from functions.SQL_Connection import get_backend, PoolTimeoutError
+
+logger = logging.getLogger(__name__)
+
+#This is raised by 'submit()' when the queue stays full for longer than 'INGEST_FULL_TIMEOUT'.
+class IngestQueueFull(Exception):
+    pass
+
+#This class represents the queue, its log and the thread that writes the batches.
+class IngestQueue:
+
+    def __init__(self, log_dir, max_size, batch_size, max_latency, segment_bytes, fsync = False):
+        self.log_dir = log_dir
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.max_latency = max_latency
+        self.segment_bytes = segment_bytes
+        self.fsync = fsync
+
+        #Each queued entry is a (segment number, row, time it was queued) tuple. The condition protects the queue and the
+        #log, wakes up the worker when entries arrive and wakes up 'submit()' when room is made.
+        self.entries = deque()
+        self.condition = threading.Condition()
+        self.stopping = False
+        self.worker = None
+
+        #This maps every segment to the number of its entries that are not written yet. 'file' is the current segment.
+        self.pending = {}
+        self.segment = 0
+        self.file = None
+
+        #These counters are exposed through 'stats()'.
+        self.accepted = 0
+        self.written = 0
+        self.duplicates = 0
+        self.dead_letters = 0
+        self.in_flight = 0
+
+    #This function queues the entries left in the log, opens a new segment and starts the worker thread.
+    def start(self):
+        os.makedirs(self.log_dir, exist_ok = True)
+        with self.condition:
+            for segment in self.segments():
+                self.replay(segment)
+            self.segment = max(self.segments(), default = 0)
+            self.open_segment()
+        self.worker = threading.Thread(target = self.run, name = 'ingest-worker', daemon = True)
+        self.worker.start()
+        atexit.register(self.stop)
+
+    #This function returns the numbers of the segments in the log folder, in order.
+    def segments(self):
+        return sorted(int(name[:-4]) for name in os.listdir(self.log_dir) if name.endswith('.log') and name[:-4].isdigit())
+
+    #This function returns the path of a segment.
+    def segment_path(self, segment):
+        return os.path.join(self.log_dir, '%08d.log' % segment)
+
+    #This function queues the entries of a segment left over from a previous run. A line cut short by a crash is skipped.
+    def replay(self, segment):
+        count = 0
+        with open(self.segment_path(segment), encoding = 'utf-8') as file:
+            for line in file:
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    logger.warning("event=ingest_replay status=skipped segment=%d", segment)
+                    continue
+                self.entries.append((segment, row, time.monotonic()))
+                count += 1
+        self.pending[segment] = count
+        if count == 0:
+            self.remove_segment(segment)
+        else:
+            logger.info("event=ingest_replay status=ok segment=%d entries=%d", segment, count)
+
+    #This function starts a new segment. It must be called while holding the condition.
+    def open_segment(self):
+        if self.file is not None:
+            self.file.close()
+        self.segment += 1
+        self.pending[self.segment] = 0
+        self.file = open(self.segment_path(self.segment), 'a', encoding = 'utf-8')
+
+    #This function removes a segment whose entries are all written. It must be called while holding the condition.
+    def remove_segment(self, segment):
+        del self.pending[segment]
+        try:
+            os.remove(self.segment_path(segment))
+        except FileNotFoundError:
+            pass
+
+    #This function checks a new entry (a dictionary with the four columns of the 'sales' table) and queues it.
+    #It raises a ValueError if the entry isn't valid, and 'IngestQueueFull' if there is no room for it.
+    def submit(self, row):
+        results, valid = check_rows([row])
+        if not valid:
+            metrics.ingest_rejected.inc('invalid')
+            raise ValueError(results[0]['error'])
+        id, store_code, total_sale, transaction_date = valid[0]
+        row = {'id': id, 'store_code': store_code, 'total_sale': str(total_sale),
+               'transaction_date': transaction_date.isoformat()}
+
+        with self.condition:
+            if not self.condition.wait_for(lambda: len(self.entries) < self.max_size, settings.INGEST_FULL_TIMEOUT):
+                metrics.ingest_rejected.inc('full')
+                raise IngestQueueFull()
+
+            #The entry is in the log before the request is answered.
+            self.file.write(json.dumps(row) + '\n')
+            self.file.flush()
+            if self.fsync:
+                os.fsync(self.file.fileno())
+
+            self.entries.append((self.segment, row, time.monotonic()))
+            self.pending[self.segment] += 1
+            self.accepted += 1
+            if self.file.tell() >= self.segment_bytes:
+                self.open_segment()
+            self.condition.notify_all()
+
+    #This function is run by the worker thread. It takes the entries out of the queue in batches and writes them.
+    def run(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.entries or self.stopping)
+                if self.stopping:
+                    return
+
+                #Wait until the batch is full or its oldest entry has waited long enough.
+                while len(self.entries) < self.batch_size and not self.stopping:
+                    remaining = self.entries[0][2] + self.max_latency - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+
+                batch = [self.entries.popleft() for _ in range(min(self.batch_size, len(self.entries)))]
+                self.in_flight = len(batch)
+                self.condition.notify_all()
+
+            if not self.flush(batch):
+                return
+
+    #This function writes a batch in one transaction, retrying it while the errors are only temporary. It returns False if the
+    #queue was stopped first, in which case the entries stay in the log and are written on the next start.
+    def flush(self, batch):
+        delay = 0.1
+        while True:
+            started = time.perf_counter()
+            try:
+                rows = [row for segment, row, queued in batch]
+                try:
+                    results = add_entries(rows, raise_errors = True)
+                except Exception as error:
+                    if is_transient(error):
+                        raise
+                    logger.warning('event=ingest_flush status=refused entries=%d error="%s"', len(batch), error)
+                    results = self.write_each(rows)
+                break
+            except Exception:
+                metrics.ingest_flush_errors.inc()
+                logger.exception("event=ingest_flush status=error entries=%d retry_in=%.1f", len(batch), delay)
+                if self.stopping:
+                    return False
+                time.sleep(delay)
+                delay = min(delay * 2, 5.0)
+
+        finished = time.monotonic()
+        metrics.ingest_flush_duration.observe(time.perf_counter() - started)
+        metrics.ingest_batch_rows.observe(len(batch))
+        for (segment, row, queued), result in zip(batch, results):
+            metrics.ingest_latency.observe(finished - queued)
+            if result.get('dead_letter'):
+                metrics.ingest_rejected.inc('database')
+            elif result['status'] != 'ok':
+                metrics.ingest_rejected.inc('duplicate')
+                logger.warning('event=ingest_rejected id=%s error="%s"', row['id'], result['error'])
+
+        with self.condition:
+            self.in_flight = 0
+            self.written += len(batch)
+            self.duplicates += sum(1 for result in results if result['status'] != 'ok' and not result.get('dead_letter'))
+            self.dead_letters += sum(1 for result in results if result.get('dead_letter'))
+            for segment, row, queued in batch:
+                self.pending[segment] -= 1
+                if self.pending[segment] == 0 and segment != self.segment:
+                    self.remove_segment(segment)
+
+            #Once everything in the current segment is written, it is emptied so it isn't queued again on the next start.
+            if self.pending[self.segment] == 0:
+                self.file.truncate(0)
+            self.condition.notify_all()
+        return True
+
+    #This function writes the entries of a refused batch one at a time. An entry the database still refuses is added to the
+    #dead-letter file. A temporary error is raised, and the whole batch is retried (the entries already written are then
+    #refused as duplicate ids).
+    def write_each(self, rows):
+        results = []
+        for row in rows:
+            try:
+                results.extend(add_entries([row], raise_errors = True))
+            except Exception as error:
+                if is_transient(error):
+                    raise
+                self.dead_letter(row, error)
+                results.append({'id': row['id'], 'status': 'error', 'error': str(error), 'dead_letter': True})
+        return results
+
+    #This function adds an entry and its error to the dead-letter file, from which it can be fixed and added by hand.
+    def dead_letter(self, row, error):
+        with open(os.path.join(self.log_dir, 'dead_letter.log'), 'a', encoding = 'utf-8') as file:
+            file.write(json.dumps({'row': row, 'error': str(error), 'time': time.time()}) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+        logger.error('event=ingest_dead_letter id=%s error="%s"', row['id'], error)
+
+    #This function waits until every queued entry is written (or for at most 'timeout' seconds), and then stops the worker
+    #thread. The entries still queued then stay in the log.
+    def drain(self, timeout = None):
+        with self.condition:
+            self.condition.wait_for(lambda: not self.entries and not self.in_flight, timeout)
+        self.stop()
+
+    #This function stops the worker thread, waiting up to 'timeout' seconds for the current batch.
+    #Entries still in the queue stay in the log.
+    def stop(self, timeout = 5):
+        with self.condition:
+            self.stopping = True
+            self.condition.notify_all()
+        if self.worker is not None:
+            self.worker.join(timeout)
+
+    #This function returns the state of the queue as a dictionary.
+    def stats(self):
+        with self.condition:
+            return {
+                'depth': len(self.entries),
+                'max_size': self.max_size,
+                'in_flight': self.in_flight,
+                'accepted': self.accepted,
+                'written': self.written,
+                'duplicates': self.duplicates,
+                'dead_letters': self.dead_letters,
+                'segments': len(self.pending),
+            }
+
+#This function tells whether a batch that failed with this error may be written if it is simply tried again: the database
+#couldn't be reached, no connection was free, or the transaction hit a lock (see 'is_transient()' in 'storage.py').
+def is_transient(error):
+    if isinstance(error, PoolTimeoutError):
+        return True
+    return isinstance(error, get_backend().Error) and get_backend().is_transient(error)
+
+#This is the queue of the process. It is created and started by 'get_ingest_queue()' the first time it is needed.
+_queue = None
+_queue_lock = threading.Lock()
+
+#This function returns the ingestion queue, starting it if needed.
+def get_ingest_queue():
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = IngestQueue(settings.INGEST_LOG_DIR, settings.INGEST_QUEUE_SIZE, settings.INGEST_BATCH_SIZE,
+                                 settings.INGEST_MAX_LATENCY, settings.INGEST_SEGMENT_BYTES, settings.INGEST_LOG_FSYNC)
+            _queue.start()
+        return _queue
+
+#This function returns the state of the ingestion queue, or an empty dictionary if it isn't used.
+def ingest_stats():
+    return _queue.stats() if _queue is not None else {}
+
+#This function stops the ingestion queue if it was started. The entries still queued stay in the log.
+def stop_ingest_queue():
+    if _queue is not None:
+        _queue.stop()
+
+#This function writes the entries still queued (for at most 'timeout' seconds) and stops the ingestion queue, if it was started.
+def drain_ingest_queue(timeout = None):
+    if _queue is not None:
+        _queue.drain(timeout)
+
+#A worker process forked from this one (see 'start_worker()' in 'workers.py') doesn't have the worker thread of its parent,
+#so it starts its own queue when it needs one.
+def reset_after_fork():
+    global _queue, _queue_lock
+    _queue = None
+    _queue_lock = threading.Lock()
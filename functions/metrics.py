@@ -0,0 +1,203 @@
+'''
+
+This module collects performance metrics for the app and writes them in the Prometheus text format, so they can be read from
+the '/metrics' endpoint by Prometheus (or simply opened in a browser).
+
+It keeps:
+
+    - Counters, which only go up (ie. the number of rows read from MySQL).
+    - Histograms, which count how many observations fell under each bucket boundary (ie. how many requests took less than
+      5ms, 10ms, 25ms...), together with their sum, so averages and percentiles can be worked out from them.
+
+It also keeps a small set of totals for the request that is currently being handled (time spent in MySQL, number of queries
+and rows fetched). They are stored in a context variable, so every request (or thread) only sees its own totals.
+
+'''
+#These are used to keep the metrics safe across threads and to hold the totals of the current request.
+import threading
+import contextvars
+
+#These are the default bucket boundaries (in seconds) used for durations. They are the same as Prometheus' own defaults.
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+#These are the bucket boundaries used for row counts.
+ROW_BUCKETS = (0, 1, 10, 25, 50, 100, 250, 1000, 10000, 100000)
+
+#This function escapes a label value as required by the Prometheus text format.
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+#This function writes a set of labels as '{name="value",...}', or an empty string if there are none.
+def format_labels(names, values, extra = ()):
+    pairs = ['%s="%s"' % (name, escape_label(value)) for name, value in zip(names, values)]
+    pairs += ['%s="%s"' % (name, escape_label(value)) for name, value in extra]
+    return '{%s}' % ','.join(pairs) if pairs else ''
+
+#This function writes a number the way Prometheus expects it.
+def format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return '%d' % value
+    return repr(value)
+
+#This class represents a counter. Every combination of label values has its own total.
+class Counter:
+
+    def __init__(self, name, help, labels = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    #This function adds 'amount' to the total of the given label values.
+    def inc(self, *label_values, amount = 1):
+        with self.lock:
+            self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    #This function returns the lines of the counter in the Prometheus text format.
+    def render(self):
+        lines = ['# HELP %s %s' % (self.name, self.help), '# TYPE %s counter' % self.name]
+        with self.lock:
+            for label_values, value in sorted(self.values.items()):
+                lines.append('%s%s %s' % (self.name, format_labels(self.labels, label_values), format_value(value)))
+        return lines
+
+#This class represents a histogram. Every combination of label values has its own buckets, sum and count.
+class Histogram:
+
+    def __init__(self, name, help, labels = (), buckets = DURATION_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+
+        #Each set of label values maps to [count per bucket, sum, count]. The counts per bucket are not cumulative here,
+        #they are added up when the histogram is rendered.
+        self.values = {}
+        self.lock = threading.Lock()
+
+    #This function records one observation for the given label values.
+    def observe(self, value, *label_values):
+        with self.lock:
+            entry = self.values.get(label_values)
+            if entry is None:
+                entry = self.values[label_values] = [[0] * len(self.buckets), 0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][index] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    #This function returns the lines of the histogram in the Prometheus text format.
+    def render(self):
+        lines = ['# HELP %s %s' % (self.name, self.help), '# TYPE %s histogram' % self.name]
+        with self.lock:
+            for label_values, (counts, total, count) in sorted(self.values.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (float('inf'),), counts + [count - sum(counts)]):
+                    cumulative += bucket_count
+                    labels = format_labels(self.labels, label_values, [('le', format_value(float(bound)))])
+                    lines.append('%s_bucket%s %d' % (self.name, labels, cumulative))
+                labels = format_labels(self.labels, label_values)
+                lines.append('%s_sum%s %s' % (self.name, labels, format_value(total)))
+                lines.append('%s_count%s %d' % (self.name, labels, count))
+        return lines
+
+#This class represents a gauge whose values are read from a function every time the metrics are rendered
+#(ie. the number of idle connections in the pool). The function returns a {label value: number} dictionary.
+class CallbackGauge:
+
+    def __init__(self, name, help, label, callback):
+        self.name = name
+        self.help = help
+        self.label = label
+        self.callback = callback
+
+    #This function returns the lines of the gauge in the Prometheus text format.
+    def render(self):
+        lines = ['# HELP %s %s' % (self.name, self.help), '# TYPE %s gauge' % self.name]
+        for label_value, value in sorted(self.callback().items()):
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                lines.append('%s%s %s' % (self.name, format_labels((self.label,), (label_value,)), format_value(value)))
+        return lines
+
+#This class holds every metric of the process, in the order they are rendered.
+class Registry:
+
+    def __init__(self):
+        self.metrics = []
+
+    #This function adds a metric to the registry and returns it.
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    #This function returns every metric in the Prometheus text format.
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+#This is the registry shared by the whole process.
+registry = Registry()
+
+#These are the metrics collected by the app.
+request_duration = registry.register(Histogram(
+    'http_request_duration_seconds', 'Time taken to handle a request.', ('method', 'endpoint', 'status')))
+request_db_rows = registry.register(Histogram(
+    'http_request_db_rows', 'Rows fetched from the database while handling a request.', ('endpoint',), ROW_BUCKETS))
+request_db_duration = registry.register(Histogram(
+    'http_request_db_duration_seconds', 'Time spent in database queries while handling a request.', ('endpoint',)))
+query_duration = registry.register(Histogram(
+    'db_query_duration_seconds', 'Time taken by database calls, by CRUD function.', ('function',)))
+query_rows = registry.register(Counter(
+    'db_rows_fetched_total', 'Rows fetched from the database, by CRUD function.', ('function',)))
+pool_wait_duration = registry.register(Histogram(
+    'db_pool_wait_duration_seconds', 'Time spent waiting to borrow a connection from the pool.'))
+routed_reads = registry.register(Counter(
+    'db_routed_reads_total', 'Read connections borrowed, by target (primary or replica).', ('target',)))
+replica_fallbacks = registry.register(Counter(
+    'db_replica_fallbacks_total', 'Reads sent to the primary because a replica could not be reached.'))
+template_duration = registry.register(Histogram(
+    'template_render_duration_seconds', 'Time taken to render a template.', ('template',)))
+json_duration = registry.register(Histogram(
+    'json_serialization_duration_seconds', 'Time taken to serialize a JSON response.', ('endpoint',)))
+ingest_flush_duration = registry.register(Histogram(
+    'ingest_flush_duration_seconds', 'Time taken to write a batch of queued entries to the database.'))
+ingest_batch_rows = registry.register(Histogram(
+    'ingest_batch_rows', 'Entries written per batch by the ingestion queue.', (), ROW_BUCKETS))
+ingest_latency = registry.register(Histogram(
+    'ingest_latency_seconds', 'Time from accepting an entry into the ingestion queue to committing it.'))
+ingest_rejected = registry.register(Counter(
+    'ingest_rejected_total', 'Entries refused by the ingestion queue, by reason.', ('reason',)))
+ingest_flush_errors = registry.register(Counter(
+    'ingest_flush_errors_total', 'Batches of queued entries that failed to be written and were retried.'))
+
+#These are the totals of the request currently being handled, or None outside of a request.
+_request_totals = contextvars.ContextVar('request_totals', default = None)
+
+#This function starts a new set of totals for the current request.
+def start_request():
+    totals = {'db_seconds': 0.0, 'queries': 0, 'rows': 0}
+    _request_totals.set(totals)
+    return totals
+
+#This function returns the totals of the current request, or None outside of a request.
+def request_totals():
+    return _request_totals.get()
+
+#This function records a database call made by the CRUD function 'function': how long it took and how many rows it returned.
+def record_query(function, seconds, rows = 0):
+    query_duration.observe(seconds, function)
+    if rows:
+        query_rows.inc(function, amount = rows)
+
+    totals = _request_totals.get()
+    if totals is not None:
+        totals['db_seconds'] += seconds
+        totals['queries'] += 1
+        totals['rows'] += rows
@@ -0,0 +1,190 @@
+'''
+
+This module converts an existing 'sales' table from the old all-TEXT layout ('$1,117.77 ' amounts and '3/25/2023' dates)
+to the typed layout used by the app: 'id' as the PRIMARY KEY, 'total_sale' as DECIMAL, 'transaction_date' as DATE and an
+indexed 'store_code'. New installs already get the typed table from 'connection/SQL_Database/store_data.sql'.
+
+The migration is done online, so the app can keep running while it happens. Run it while the previous version of the app
+(the one written for the TEXT layout) is still serving, and deploy this version once it has finished: this version reads
+dates as DATE values, and relies on the primary key to refuse duplicate ids, neither of which works on the old table. The
+triggers below accept the dates written by both versions, so a write made by a new process started early is not lost.
+
+    1. An index is added on the old 'id' column (in place, without locking the table) so batches can be found quickly.
+    2. An empty typed copy of the table called 'sales_typed' is created.
+    3. Triggers on the old table copy every insert, update and delete made by the app into the copy.
+    4. Existing rows are copied over in small batches of 'id' ranges. Each batch only locks the rows it reads.
+    5. Once the row counts match, both tables are swapped with a single atomic RENAME TABLE and the triggers are dropped.
+
+The old table is kept as 'sales_old' so you can go back if something is wrong (pass --drop-old to remove it).
+
+Run it from the project directory with:
+
+    python -m functions.migrate_sales --batch-size 5000
+
+'''
+#This will be used to read the command line options.
+import argparse
+
+#This will be used to pause between batches.
+import time
+
+#This will import SQL_Connection module in order to connect with MySQL database.
+from functions.SQL_Connection import dbConnection
+
+#These SQL expressions convert the old TEXT values to their typed versions. Amounts may have a '$' and commas ('$1,117.77')
+#or not ('1117.77'), and dates may be in the old format ('3/25/2023') or the ISO one ('2023-03-25'). The date format is picked
+#by looking for a '/', since a STR_TO_DATE() that fails is an error (not NULL) inside an INSERT in strict mode.
+TOTAL_SALE_SQL = "CAST(REPLACE(REPLACE(TRIM({0}.total_sale), '$', ''), ',', '') AS DECIMAL(12,2))"
+TRANSACTION_DATE_SQL = ("CASE WHEN TRIM({0}.transaction_date) LIKE '%/%' "
+                        "THEN STR_TO_DATE(TRIM({0}.transaction_date), '%m/%d/%Y') "
+                        "ELSE STR_TO_DATE(TRIM({0}.transaction_date), '%Y-%m-%d') END")
+
+#This is the typed table that replaces 'sales'.
+CREATE_TYPED_TABLE = '''
+CREATE TABLE IF NOT EXISTS sales_typed (
+  id int NOT NULL,
+  store_code varchar(32) NOT NULL,
+  total_sale decimal(12,2) NOT NULL,
+  transaction_date date NOT NULL,
+  PRIMARY KEY (id),
+  KEY idx_sales_store_date (store_code, transaction_date, id),
+  KEY idx_sales_transaction_date (transaction_date, id),
+  KEY idx_sales_total_sale (total_sale, id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci
+'''
+
+#These triggers keep 'sales_typed' up to date with the writes made to 'sales' while the rows are being copied.
+TRIGGERS = {
+    'sales_migrate_insert': (
+        "CREATE TRIGGER sales_migrate_insert AFTER INSERT ON sales FOR EACH ROW "
+        "REPLACE INTO sales_typed (id, store_code, total_sale, transaction_date) "
+        "VALUES (NEW.id, NEW.store_code, " + TOTAL_SALE_SQL.format('NEW') + ", " + TRANSACTION_DATE_SQL.format('NEW') + ")"
+    ),
+    'sales_migrate_update': (
+        "CREATE TRIGGER sales_migrate_update AFTER UPDATE ON sales FOR EACH ROW BEGIN "
+        "DELETE FROM sales_typed WHERE id = OLD.id; "
+        "REPLACE INTO sales_typed (id, store_code, total_sale, transaction_date) "
+        "VALUES (NEW.id, NEW.store_code, " + TOTAL_SALE_SQL.format('NEW') + ", " + TRANSACTION_DATE_SQL.format('NEW') + "); "
+        "END"
+    ),
+    'sales_migrate_delete': (
+        "CREATE TRIGGER sales_migrate_delete AFTER DELETE ON sales FOR EACH ROW "
+        "DELETE FROM sales_typed WHERE id = OLD.id"
+    ),
+}
+
+#This query copies one batch of rows. INSERT IGNORE leaves alone any row a trigger has already written, since that one is newer.
+#Rows without an 'id', or whose amount or date can't be converted, are skipped and reported at the end.
+COPY_BATCH = (
+    "INSERT IGNORE INTO sales_typed (id, store_code, total_sale, transaction_date) "
+    "SELECT s.id, s.store_code, " + TOTAL_SALE_SQL.format('s') + ", " + TRANSACTION_DATE_SQL.format('s') + " "
+    "FROM sales s WHERE s.id > %s AND s.id <= %s "
+    "AND " + TRANSACTION_DATE_SQL.format('s') + " IS NOT NULL "
+    "AND TRIM(s.total_sale) REGEXP '^[$]?[0-9,]+([.][0-9]+)?$'"
+)
+
+#This function checks whether 'sales' has already been converted by looking at the type of its 'transaction_date' column.
+def is_migrated(cur):
+    cur.execute("SELECT DATA_TYPE FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'sales' AND COLUMN_NAME = 'transaction_date'")
+    row = cur.fetchone()
+    return row is not None and row[0].lower() == 'date'
+
+#This function adds an index on the old 'id' column so that each batch is a quick range read instead of a full table scan.
+def add_id_index(cur):
+    cur.execute("SELECT COUNT(*) FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'sales' AND INDEX_NAME = 'idx_sales_migrate_id'")
+    if cur.fetchone()[0] == 0:
+        cur.execute("ALTER TABLE sales ADD INDEX idx_sales_migrate_id (id), ALGORITHM=INPLACE, LOCK=NONE")
+
+#This function creates the triggers, replacing any left over from an earlier run that was interrupted.
+def create_triggers(cur):
+    drop_triggers(cur)
+    for statement in TRIGGERS.values():
+        cur.execute(statement)
+
+#This function removes the migration triggers.
+def drop_triggers(cur):
+    for name in TRIGGERS:
+        cur.execute("DROP TRIGGER IF EXISTS " + name)
+
+#This function copies the existing rows in batches of 'batch_size' ids and returns the number of rows copied.
+def backfill(cur, batch_size, pause):
+    cur.execute("SELECT MIN(id), MAX(id) FROM sales")
+    min_id, max_id = cur.fetchone()
+    if min_id is None:
+        return 0
+
+    copied = 0
+    last_id = min_id - 1
+    while last_id < max_id:
+        upper_id = last_id + batch_size
+        cur.execute(COPY_BATCH, (last_id, upper_id))
+        copied += cur.rowcount
+        print("Copied rows with id up to %s (%s rows so far)" % (min(upper_id, max_id), copied))
+        last_id = upper_id
+
+        #A short pause between batches leaves room for the app's own queries.
+        if pause:
+            time.sleep(pause)
+
+    return copied
+
+#This function counts the rows that could not be copied, so they can be fixed by hand before swapping.
+def count_skipped(cur):
+    cur.execute("SELECT COUNT(*) FROM sales s LEFT JOIN sales_typed t ON t.id = s.id WHERE t.id IS NULL")
+    return cur.fetchone()[0]
+
+#This function runs the whole migration.
+def migrate(batch_size = 5000, pause = 0.0, drop_old = False, allow_skipped = False):
+    sql_cxn = dbConnection()
+
+    #Every statement is committed straight away so that no batch keeps its locks longer than it needs to.
+    sql_cxn.autocommit = True
+    cur = sql_cxn.cursor()
+
+    try:
+        if is_migrated(cur):
+            print("The 'sales' table already uses the typed layout. Nothing to do.")
+            return True
+
+        add_id_index(cur)
+        cur.execute(CREATE_TYPED_TABLE)
+        create_triggers(cur)
+
+        copied = backfill(cur, batch_size, pause)
+        skipped = count_skipped(cur)
+        print("Copied %s rows, %s rows could not be converted." % (copied, skipped))
+
+        #If some rows could not be converted, stop here and leave the triggers in place so the copy stays current.
+        if skipped and not allow_skipped:
+            print("Fix or remove those rows and run the migration again, or pass --allow-skipped to leave them behind.")
+            return False
+
+        #RENAME TABLE swaps both tables in one atomic step, so the app never sees a missing 'sales' table.
+        cur.execute("RENAME TABLE sales TO sales_old, sales_typed TO sales")
+
+        #The triggers moved with the old table, so they are not needed anymore.
+        drop_triggers(cur)
+
+        if drop_old:
+            cur.execute("DROP TABLE sales_old")
+            print("Migration finished. The old table was dropped.")
+        else:
+            print("Migration finished. The old table was kept as 'sales_old'.")
+        return True
+    finally:
+        cur.close()
+        sql_cxn.close()
+
+#This will run the migration from the command line.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Convert the 'sales' table to typed, indexed columns without a long table lock.")
+    parser.add_argument('--batch-size', type = int, default = 5000, help = "number of ids copied per batch")
+    parser.add_argument('--pause', type = float, default = 0.0, help = "seconds to wait between batches")
+    parser.add_argument('--drop-old', action = 'store_true', help = "drop the old table once the swap is done")
+    parser.add_argument('--allow-skipped', action = 'store_true', help = "swap even if some rows could not be converted")
+    args = parser.parse_args()
+
+    succeeded = migrate(args.batch_size, args.pause, args.drop_old, args.allow_skipped)
+    raise SystemExit(0 if succeeded else 1)
@@ -0,0 +1,392 @@
+'''
+
+This module contains an in-process cache for the results of the read queries in 'crud_functions.py'. Paging through the same
+date range used to run the same query again for every page click; now the result is kept in memory and reused.
+
+Results are stored under a key made from the function name and its normalized parameters. The cache drops the least recently
+used results when it holds too many of them or when they take up too much memory, and every result expires after a while.
+When an entry is added, edited or deleted, only the cached results that could contain that entry are removed: results for the
+whole table and results for the date ranges that include the entry's date.
+
+The JSON endpoints of 'app.py' also keep their encoded response bodies here (see 'cached_call()'), under the requested URL.
+
+Cached results are shared between requests, so the lists and dictionaries they return must not be modified.
+
+'''
+#These are used to measure the size of cached results, to keep the cache safe across threads, to build the decorator and the ETags,
+#to reset the cache in forked processes and to share the version of the table between them.
+import os
+import sys
+import mmap
+import struct
+import threading
+import time
+import functools
+import inspect
+import hashlib
+import uuid
+import contextvars
+from contextlib import contextmanager
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+
+#This holds the cache configuration.
+from functions import settings
+
+#This locks the version shared by the workers of 'serve.py', which only runs on Unix.
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+#This function turns a date given as a string (like the ones stored in the session) into a 'date' object, so that
+#'2023-02-01' and date(2023, 2, 1) give the same cache key. Anything else is returned as it is.
+def normalize_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value.strip())
+        except ValueError:
+            return value
+    return value
+
+#This function estimates how many bytes of memory a query result takes up.
+def estimate_size(value):
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key) + estimate_size(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            size += estimate_size(item)
+    return size
+
+#This class represents the cache itself.
+class QueryCache:
+
+    def __init__(self, max_entries = 256, max_bytes = 64 * 1024 * 1024, ttl = 60):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        #Each key maps to (result, size in bytes, expiry time, date range). The least recently used key is at the front.
+        #The date range is None for results that cover the whole table.
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.current_bytes = 0
+
+        #This number goes up on every invalidation. A result read from the database before an invalidation may already be
+        #out of date, so it is only stored if the number hasn't changed in the meantime.
+        self.generation = 0
+
+        #These counters are exposed through 'stats()'.
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    #This function returns a (found, result) pair for the given key.
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+
+            result, size, expires_at, date_range = entry
+            if time.monotonic() >= expires_at:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+
+            #Mark this key as the most recently used one.
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, result
+
+    #This function stores a result. 'date_range' is a (start_date, end_date) pair, or None if the result covers the whole table.
+    #'generation' is the value of 'self.generation' from before the result was read from the database.
+    def set(self, key, result, date_range = None, generation = None):
+        size = estimate_size(result)
+
+        #A result bigger than the whole cache is never stored.
+        if size > self.max_bytes:
+            return
+
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (result, size, time.monotonic() + self.ttl, date_range)
+            self.current_bytes += size
+
+            #Drop the least recently used results until the cache is within its limits again.
+            while len(self.entries) > self.max_entries or self.current_bytes > self.max_bytes:
+                oldest_key = next(iter(self.entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    #This function removes the results affected by a write to entries with the given dates.
+    #Results for the whole table are always removed, results for a date range only if one of the dates falls within it.
+    def invalidate(self, dates):
+        dates = [normalize_date(value) for value in dates if value is not None]
+        with self.lock:
+            self.generation += 1
+            for key, (result, size, expires_at, date_range) in list(self.entries.items()):
+                if date_range is None or any(date_range[0] <= value <= date_range[1] for value in dates):
+                    self._remove(key)
+                    self.invalidations += 1
+
+    #This function keeps the result of the read currently running in this thread from being stored (ie. because it was
+    #read from a replica that may not have the latest writes yet).
+    def skip_store(self):
+        _skip_store.set(True)
+
+    #This function empties the cache.
+    def clear(self):
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
+            self.current_bytes = 0
+
+    #This function returns the cache counters as a dictionary.
+    def stats(self):
+        with self.lock:
+            return {
+                'entries': len(self.entries),
+                'bytes': self.current_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+            }
+
+    #This function removes a single key. It must be called while holding the lock.
+    def _remove(self, key):
+        result, size, expires_at, date_range = self.entries.pop(key)
+        self.current_bytes -= size
+
+#This is set by 'skip_store()' while a cached function is running.
+_skip_store = contextvars.ContextVar('skip_store', default = False)
+
+#This is the cache shared by the whole process.
+query_cache = QueryCache(settings.QUERY_CACHE_MAX_ENTRIES, settings.QUERY_CACHE_MAX_BYTES, settings.QUERY_CACHE_TTL)
+
+#This function calls 'compute()' and returns its result, together with True if it was built from a result that couldn't be
+#stored (see 'QueryCache.skip_store()'), like a read from a replica that may not have the latest writes yet.
+def tracked_call(compute):
+    token = _skip_store.set(False)
+    try:
+        result = compute()
+        skip = _skip_store.get()
+    finally:
+        _skip_store.reset(token)
+
+    #Whatever is built from a result that couldn't be stored can't be stored either, so the caller is told too.
+    if skip:
+        query_cache.skip_store()
+    return result, skip
+
+#This function returns the result cached under 'key', or calls 'compute()' and caches what it returns.
+#'date_range' is given to 'QueryCache.set()'. If 'cache_none' is False, a result of None is returned but not cached.
+def cached_call(key, compute, date_range = None, cache_none = True):
+    sales_version.refresh()
+    found, result = query_cache.get(key)
+    if found:
+        return result
+
+    generation = query_cache.generation
+    result, skip = tracked_call(compute)
+    if skip:
+        return result
+
+    if result is not None or cache_none:
+        query_cache.set(key, result, date_range, generation)
+    return result
+
+#This decorator caches the results of a read function in 'crud_functions.py'.
+#If the function takes 'start_date' and 'end_date' parameters, its results are only removed by writes within that range.
+def cached_query(function):
+    signature = inspect.signature(function)
+    has_date_range = 'start_date' in signature.parameters and 'end_date' in signature.parameters
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not settings.QUERY_CACHE_ENABLED:
+            return function(*args, **kwargs)
+
+        #The key is built from every parameter, including the default ones, so equivalent calls share the same key.
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        parameters = tuple(normalize_date(value) for value in bound.arguments.values())
+        key = (function.__name__,) + parameters
+
+        date_range = None
+        if has_date_range:
+            start_date = normalize_date(bound.arguments['start_date'])
+            end_date = normalize_date(bound.arguments['end_date'])
+            if isinstance(start_date, date) and isinstance(end_date, date):
+                date_range = (start_date, end_date)
+
+        return cached_call(key, lambda: function(*args, **kwargs), date_range)
+
+    return wrapper
+
+#This class keeps a version number for the 'sales' table that goes up on every write made through this process (or through
+#any worker of 'serve.py', see 'share()'), together with the time of the last write. The JSON endpoints use it to build ETags and Last-Modified headers, so a client asking for a
+#page it already has can be answered with '304 Not Modified' without touching MySQL.
+class TableVersion:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = 0
+
+        #Last-Modified headers only have a precision of one second.
+        self.last_modified = datetime.now(timezone.utc).replace(microsecond = 0)
+
+        #Every process gets its own token, so two processes never hand out the same ETag for different data.
+        self.token = uuid.uuid4().hex[:8]
+
+        #When the workers of 'serve.py' share the version (see 'share()'), this is the memory holding it and its file, 'seen'
+        #is the last (token, version, last modified, log position) record this process read from it or wrote to it, and
+        #'position' is the number of ids of the change log this process has already applied.
+        self.shared = None
+        self.shared_fd = None
+        self.seen = None
+        self.position = 0
+        self.refresh_lock = threading.Lock()
+
+        #These functions are called with the ids written by another worker (or None if they aren't known) before this
+        #process serves anything read after that write (ie. to update the hot dataset, see 'hot_dataset.py').
+        self.listeners = []
+
+    #This function makes this process (and the ones forked from it) keep the version in the given file, mapped in memory,
+    #instead of in the process itself. A write made by any of them then changes the ETags of all of them.
+    def share(self, fileno):
+        size = SHARED_VERSION.size + CHANGE_LOG_SIZE * CHANGE_LOG_ID.size
+        if os.fstat(fileno).st_size < size:
+            os.ftruncate(fileno, size)
+        self.shared_fd = fileno
+        self.shared = mmap.mmap(fileno, size)
+
+        #A new file is filled with the version of this process. A file handed over on a reload keeps its version, and the
+        #changes already in its log are not applied again, since this process has just read the table.
+        with self.lock, self.shared_lock(True):
+            if SHARED_VERSION.unpack_from(self.shared)[0] == bytes(8):
+                SHARED_VERSION.pack_into(self.shared, 0, self.token.encode(), self.version, self.last_modified.timestamp(), 0)
+            self.use(SHARED_VERSION.unpack_from(self.shared))
+
+    #This context manager locks the shared version against the other workers, for writing if 'exclusive' is True.
+    @contextmanager
+    def shared_lock(self, exclusive = False):
+        fcntl.lockf(self.shared_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.lockf(self.shared_fd, fcntl.LOCK_UN)
+
+    #This function takes a record read from the shared version as the version of this process. It must be called while
+    #holding the lock.
+    def use(self, record):
+        self.seen = record
+        token, self.version, timestamp, self.position = record
+        self.token = token.decode('ascii', 'replace')
+        self.last_modified = datetime.fromtimestamp(timestamp, timezone.utc)
+
+    #This function records a write to the table. 'ids' are the ids of the written entries, which the other workers of
+    #'serve.py' read again; None means they aren't known, and the other workers then check their whole hot dataset.
+    def bump(self, ids = None):
+        with self.lock:
+            self.version += 1
+            self.last_modified = datetime.now(timezone.utc).replace(microsecond = 0)
+            if self.shared is None:
+                return
+
+            ids = [int(id) for id in ids] if ids is not None else None
+            if ids is not None and any(not ID_LIMITS[0] <= id <= ID_LIMITS[1] for id in ids):
+                ids = None
+            count = len(ids) if ids is not None else CHANGE_LOG_SIZE + 1
+
+            #Every write draws a new token, so two workers writing at the same time never leave the version they both
+            #started from behind.
+            self.token = uuid.uuid4().hex[:8]
+            with self.shared_lock(True):
+                token, version, timestamp, position = SHARED_VERSION.unpack_from(self.shared)
+                self.version = max(self.version, version + 1)
+
+                #The ids go to the change log, which keeps the last 'CHANGE_LOG_SIZE' of them. A write with more ids than
+                #that (or unknown ids) leaves a gap in it, and the other workers then check everything.
+                for offset, id in enumerate((ids or [])[-CHANGE_LOG_SIZE:], position + max(count - CHANGE_LOG_SIZE, 0)):
+                    CHANGE_LOG_ID.pack_into(self.shared, change_log_offset(offset), id)
+
+                #If this process was up to date, it doesn't need to read its own write back.
+                if self.position == position:
+                    self.position = position + count
+                self.seen = (self.token.encode(), self.version, self.last_modified.timestamp(), position + count)
+                SHARED_VERSION.pack_into(self.shared, 0, *self.seen)
+
+    #This function reads the shared version, if there is one. When another worker wrote to the table since the last call,
+    #the listeners are given the ids it wrote, and the results cached by this process, which may be out of date, are all
+    #removed. Until that is done, the other threads of this process wait here instead of reading the old data.
+    def refresh(self):
+        if self.shared is None or SHARED_VERSION.unpack_from(self.shared) == self.seen:
+            return
+        with self.refresh_lock:
+            with self.lock, self.shared_lock():
+                record = SHARED_VERSION.unpack_from(self.shared)
+                if record == self.seen:
+                    return
+                position = record[3]
+                if position - self.position > CHANGE_LOG_SIZE:
+                    ids = None
+                else:
+                    ids = [CHANGE_LOG_ID.unpack_from(self.shared, change_log_offset(offset))[0]
+                           for offset in range(self.position, position)]
+
+            for listener in self.listeners:
+                listener(ids)
+            query_cache.clear()
+            with self.lock:
+                self.use(record)
+
+    #This function returns a strong ETag for the given key (ie. the URL of a page) at the current version.
+    def etag(self, key):
+        self.refresh()
+        digest = hashlib.blake2b(key.encode(), digest_size = 8).hexdigest()
+        return '%s-%d-%s' % (self.token, self.version, digest)
+
+#This is the layout of the version shared by the workers of 'serve.py': the token, the version, the time of the last write and
+#the number of ids written to the change log so far. The change log follows it: the ids written by the last writes, in a
+#ring of 'CHANGE_LOG_SIZE' ids.
+SHARED_VERSION = struct.Struct('<8sQdQ')
+CHANGE_LOG_ID = struct.Struct('<q')
+CHANGE_LOG_SIZE = 4096
+ID_LIMITS = (-2 ** 63, 2 ** 63 - 1)
+
+#This function returns where the id with the given number is kept in the change log.
+def change_log_offset(number):
+    return SHARED_VERSION.size + number % CHANGE_LOG_SIZE * CHANGE_LOG_ID.size
+
+#This is the version of the 'sales' table shared by the whole process.
+sales_version = TableVersion()
+
+#A worker process forked from this one (see 'start_worker()' in 'workers.py') starts with an empty cache. Unless it shares
+#the version with its parent (see 'on_starting()' in 'gunicorn.conf.py'), it also gets its own ETag token, since the writes
+#made by other processes are never seen by its cache.
+def reset_after_fork():
+    query_cache.lock = threading.Lock()
+    query_cache.clear()
+    sales_version.lock = threading.Lock()
+    sales_version.refresh_lock = threading.Lock()
+    if sales_version.shared is None:
+        sales_version.token = uuid.uuid4().hex[:8]
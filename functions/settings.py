@@ -0,0 +1,148 @@
+'''
+
+This module contains the configuration values used by the rest of the application. Every value can be overridden with an
+environment variable of the same name, so the app can be tuned for a given machine without editing any code.
+
+'''
+#This will be used to read environment variables.
+import os
+
+#These are the parameters used to connect to the MySQL database. You will need to change the password (or set 'DB_PASSWORD')
+#in order to be able to connect to your MySQL Workbench.
+DB_HOST = os.environ.get('DB_HOST', 'localhost')
+DB_USER = os.environ.get('DB_USER', 'root')
+DB_PASSWORD = os.environ.get('DB_PASSWORD', '')
+DB_NAME = os.environ.get('DB_NAME', 'store_data')
+
+#This is the storage backend: 'mysql' (the default) or 'sqlite', an embedded database that needs no server.
+DB_BACKEND = os.environ.get('DB_BACKEND', 'mysql')
+
+#This is the SQLite database file used by the 'sqlite' backend. Use ':memory:' to keep the whole database in memory.
+SQLITE_PATH = os.environ.get('SQLITE_PATH', 'store_data.sqlite3')
+
+#These are the read replicas, as a comma-separated list of 'host' or 'host:port' (or SQLite file paths with the 'sqlite'
+#backend). When there are some, the listing and export queries read from them instead of the primary.
+DB_REPLICAS = [dsn.strip() for dsn in os.environ.get('DB_REPLICAS', '').split(',') if dsn.strip()]
+
+#This is how a replica is picked for each read: 'round_robin' or 'least_connections'.
+DB_REPLICA_POLICY = os.environ.get('DB_REPLICA_POLICY', 'round_robin')
+
+#For this number of seconds after a user's write, their reads go to the primary so they see their own changes.
+READ_YOUR_WRITES_SECONDS = float(os.environ.get('READ_YOUR_WRITES_SECONDS', 5))
+
+#This is the maximum number of connections the pool will keep open to MySQL at the same time.
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+
+#This is the number of seconds a request will wait for a free connection before giving up.
+DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', 10))
+
+#Connections that have been idle for longer than this number of seconds are closed instead of being reused.
+DB_POOL_MAX_IDLE = float(os.environ.get('DB_POOL_MAX_IDLE', 300))
+
+#Connections that have been idle for longer than this number of seconds are pinged before being handed out.
+DB_POOL_PING_AFTER = float(os.environ.get('DB_POOL_PING_AFTER', 5))
+
+#Set 'QUERY_CACHE_ENABLED' to 0 to turn off the in-process cache of query results.
+QUERY_CACHE_ENABLED = os.environ.get('QUERY_CACHE_ENABLED', '1') == '1'
+
+#This is the maximum number of query results kept in the cache.
+QUERY_CACHE_MAX_ENTRIES = int(os.environ.get('QUERY_CACHE_MAX_ENTRIES', 256))
+
+#This is the approximate maximum amount of memory (in bytes) used by the cached results.
+QUERY_CACHE_MAX_BYTES = int(os.environ.get('QUERY_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+
+#This is the number of seconds a cached result is used before it is read from the database again. Writes made through this
+#process (or, with 'serve.py', through any of its workers) remove the affected results straight away, so this only matters for
+#writes made by other processes.
+QUERY_CACHE_TTL = float(os.environ.get('QUERY_CACHE_TTL', 60))
+
+#Set 'HOT_DATASET_ENABLED' to 1 to load the 'sales' table into memory (as NumPy arrays, see 'hot_dataset.py') and serve the
+#listing, date range and paging reads from there instead of MySQL. Writes made through this process are applied to it right
+#away; every 'HOT_DATASET_RECONCILE_SECONDS' seconds it is checked against the daily summary, and the days that differ
+#(ie. written by another process) are read again.
+HOT_DATASET_ENABLED = os.environ.get('HOT_DATASET_ENABLED', '0') == '1'
+HOT_DATASET_RECONCILE_SECONDS = float(os.environ.get('HOT_DATASET_RECONCILE_SECONDS', 60))
+
+#This is the number of rows read from MySQL at a time by the streaming export.
+EXPORT_CHUNK_SIZE = int(os.environ.get('EXPORT_CHUNK_SIZE', 1000))
+
+#This is the maximum number of rows accepted by a single request to one of the bulk endpoints.
+BULK_MAX_ROWS = int(os.environ.get('BULK_MAX_ROWS', 50000))
+
+#Set 'INGEST_MODE' to 'queue' to accept new entries from '/add_entry' into an in-process queue instead of writing each one
+#right away. A background thread writes them in batches of up to 'INGEST_BATCH_SIZE' entries, one transaction per batch,
+#waiting at most 'INGEST_MAX_LATENCY' seconds for a batch to fill up.
+INGEST_MODE = os.environ.get('INGEST_MODE', 'sync')
+INGEST_BATCH_SIZE = int(os.environ.get('INGEST_BATCH_SIZE', 500))
+INGEST_MAX_LATENCY = float(os.environ.get('INGEST_MAX_LATENCY', 0.05))
+
+#This is the largest number of entries the queue may hold. When it is full, new entries wait up to 'INGEST_FULL_TIMEOUT'
+#seconds for room, and are then refused with '503 Service Unavailable'.
+INGEST_QUEUE_SIZE = int(os.environ.get('INGEST_QUEUE_SIZE', 10000))
+INGEST_FULL_TIMEOUT = float(os.environ.get('INGEST_FULL_TIMEOUT', 0.5))
+
+#Queued entries are also written to an append-only log in this folder, so they are written to the database after a crash.
+#The log is split into files of about 'INGEST_SEGMENT_BYTES' bytes, which are removed once all their entries are written.
+#Set 'INGEST_LOG_FSYNC' to 1 to also survive a power loss, at the cost of one disk sync per entry.
+INGEST_LOG_DIR = os.environ.get('INGEST_LOG_DIR', 'ingest_log')
+INGEST_SEGMENT_BYTES = int(os.environ.get('INGEST_SEGMENT_BYTES', 4 * 1024 * 1024))
+INGEST_LOG_FSYNC = os.environ.get('INGEST_LOG_FSYNC', '0') == '1'
+
+#This is the key used to sign the session cookie. Set it to a long random value in production. Without it, a random key is
+#made every time the app starts, so sessions don't survive a restart.
+SECRET_KEY = os.environ.get('SECRET_KEY')
+
+#These are used by the production server (see 'gunicorn.conf.py'): the address to listen on, the number of worker processes
+#(one per CPU by default), the number of requests each worker handles at once, how long (in seconds) a worker may take to
+#finish its requests when it is stopped, and how long an idle keep-alive connection is kept.
+WEB_BIND = os.environ.get('WEB_BIND', '127.0.0.1:5000')
+WEB_WORKERS = int(os.environ.get('WEB_WORKERS', os.cpu_count() or 1))
+WEB_THREADS = int(os.environ.get('WEB_THREADS', 8))
+WEB_GRACEFUL_TIMEOUT = float(os.environ.get('WEB_GRACEFUL_TIMEOUT', 30))
+WEB_KEEPALIVE_TIMEOUT = float(os.environ.get('WEB_KEEPALIVE_TIMEOUT', 5))
+
+#Searches count their results up to this number. Above it, the pages say "more than" this number instead of counting on.
+SEARCH_COUNT_LIMIT = int(os.environ.get('SEARCH_COUNT_LIMIT', 10000))
+
+#Compiled templates are kept in this folder (next to 'app.py') so they aren't compiled again on every start. Set it to an
+#empty value to turn this off. Set 'PRELOAD_PANDAS' to 1 to import pandas when the app starts instead of on the first
+#DataFrame request (with 'serve.py', the workers then share it in memory).
+TEMPLATE_CACHE_DIR = os.environ.get('TEMPLATE_CACHE_DIR', '.jinja_cache')
+PRELOAD_PANDAS = os.environ.get('PRELOAD_PANDAS', '0') == '1'
+
+#Set 'APP_MODE' to 'async' to serve the data endpoints from 'async_app.py' through 'asgi.py', with an asyncio connection pool.
+APP_MODE = os.environ.get('APP_MODE', 'sync')
+
+#These are the smallest and largest number of connections kept by the asyncio connection pool used in async mode.
+ASYNC_POOL_MIN_SIZE = int(os.environ.get('ASYNC_POOL_MIN_SIZE', 1))
+ASYNC_POOL_MAX_SIZE = int(os.environ.get('ASYNC_POOL_MAX_SIZE', 20))
+
+#This is the JSON encoder used by the data endpoints: 'orjson' (the default, much faster on large pages, used if the 'orjson'
+#package is installed) or 'default' (Flask's own encoder).
+JSON_PROVIDER = os.environ.get('JSON_PROVIDER', 'orjson')
+
+#This is the Cache-Control header sent with the JSON data endpoints. 'no-cache' lets browsers and proxies keep a copy but
+#makes them check it with the server first, which is answered with '304 Not Modified' if the data hasn't changed.
+CACHE_CONTROL = os.environ.get('CACHE_CONTROL', 'no-cache')
+
+#Set 'COMPRESS_ENABLED' to 0 to turn off the compression of responses (gzip, or brotli if the 'brotli' package is installed).
+#Responses smaller than 'COMPRESS_MIN_SIZE' bytes are sent as they are, since compressing them saves next to nothing.
+COMPRESS_ENABLED = os.environ.get('COMPRESS_ENABLED', '1') == '1'
+COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))
+
+#These are the compression levels used for responses. Higher levels give smaller responses but take longer to compress.
+#The static assets are compressed once at build time, with the highest levels.
+GZIP_LEVEL = int(os.environ.get('GZIP_LEVEL', 6))
+BROTLI_QUALITY = int(os.environ.get('BROTLI_QUALITY', 4))
+
+#This is how long (in seconds) browsers may keep the fingerprinted static assets without asking for them again (one year).
+STATIC_MAX_AGE = int(os.environ.get('STATIC_MAX_AGE', 31536000))
+
+#This is the level of the messages written to the log (ie. 'DEBUG', 'INFO' or 'WARNING').
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
+
+#This is the share of requests that are logged (0.01 means 1 in 100). Logging every request slows the app down under load.
+LOG_SAMPLE_RATE = float(os.environ.get('LOG_SAMPLE_RATE', 0.01))
+
+#Requests that take at least this number of seconds are always logged.
+LOG_SLOW_REQUEST = float(os.environ.get('LOG_SLOW_REQUEST', 1.0))
@@ -0,0 +1,362 @@
+'''
+
+This module contains the storage backends the app can run on. The CRUD functions in 'crud_functions.py' are written once,
+as SQL run through DB-API cursors, and the backend takes care of everything that differs between database engines:
+
+    - How a connection is opened, and how the table and its indexes are created (or upgraded).
+    - The errors raised by the driver (ie. how a duplicate 'id' is recognized).
+    - The few SQL expressions that are not the same in every engine (like the first day of a week or month).
+
+There are two backends:
+
+    - 'mysql' is the default. It uses the MySQL server configured in 'settings.py'.
+    - 'sqlite' uses an embedded SQLite database, either a file or ':memory:'. It needs no server, so it starts instantly,
+      which is useful for local benchmarking, profiling without a network and small read-heavy deployments.
+
+The backend is chosen with the 'DB_BACKEND' setting. A SQLite database can be filled from a MySQL dump with:
+
+    DB_BACKEND=sqlite python -m functions.storage --load-dump connection/SQL_Database/store_data.sql
+
+A database created before the search indexes existed (see 'search_entries()' in 'crud_functions.py') gets them with:
+
+    python -m functions.storage --add-search-indexes
+
+'''
+#These are the database drivers.
+import mysql.connector
+import sqlite3
+
+#These are used to convert the values stored by SQLite and to read MySQL dumps.
+import re
+import argparse
+import logging
+import functools
+from datetime import date
+from decimal import Decimal
+
+#This holds the configuration of the backends.
+from functions import settings
+
+logger = logging.getLogger(__name__)
+
+#This is the MySQL error number for a duplicate primary key.
+DUPLICATE_KEY_ERROR = 1062
+
+#These are the MySQL error numbers for a lock wait timeout and a deadlock. The transaction can simply be run again.
+RETRYABLE_ERRORS = (1205, 1213)
+
+#This pattern matches one row of the INSERT statements of a MySQL dump, ie. (1,'TX001',937.70,'2023-02-12').
+DUMP_ROW = re.compile(r"\((\d+),'((?:[^'\\]|\\.)*)',([\d.]+),'(\d{4}-\d{2}-\d{2})'\)")
+
+#This class represents the MySQL backend. 'connect' is the function that opens a new connection.
+class MySQLBackend:
+
+    name = 'mysql'
+
+    #These are the errors raised by the driver.
+    Error = mysql.connector.Error
+    IntegrityError = mysql.connector.errors.IntegrityError
+
+    #These SQL expressions give the first day of the period each sale belongs to (weeks start on Monday).
+    period_sql = {
+        'day': "transaction_date",
+        'week': "DATE_SUB(transaction_date, INTERVAL WEEKDAY(transaction_date) DAY)",
+        'month': "DATE_SUB(transaction_date, INTERVAL DAYOFMONTH(transaction_date) - 1 DAY)",
+    }
+
+    #This is the expression store codes are searched and sorted by. The collation of the table already ignores case.
+    store_code_sql = "store_code"
+
+    #These are the 'sales' table and its daily summary, the same as in 'connection/SQL_Database/store_data.sql'.
+    schema = ['''CREATE TABLE IF NOT EXISTS sales (
+  id int NOT NULL,
+  store_code varchar(32) NOT NULL,
+  total_sale decimal(12,2) NOT NULL,
+  transaction_date date NOT NULL,
+  PRIMARY KEY (id),
+  KEY idx_sales_store_date (store_code, transaction_date, id),
+  KEY idx_sales_transaction_date (transaction_date, id),
+  KEY idx_sales_total_sale (total_sale, id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci''', '''CREATE TABLE IF NOT EXISTS sales_daily_summary (
+  transaction_date date NOT NULL,
+  store_code varchar(32) NOT NULL,
+  sale_count int NOT NULL,
+  total_sales decimal(14,2) NOT NULL,
+  min_sale decimal(12,2) NOT NULL,
+  max_sale decimal(12,2) NOT NULL,
+  PRIMARY KEY (transaction_date, store_code)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci''']
+
+    def __init__(self, connect):
+        self.connect = connect
+
+    #This function returns the function that opens a connection to a read replica given as 'host' or 'host:port'.
+    #The replica uses the same user, password and database name as the primary.
+    def replica(self, dsn):
+        host, _, port = dsn.partition(':')
+        return functools.partial(self.connect, host, int(port) if port else None)
+
+    #This function returns the number of connections the pool may keep open.
+    def pool_size(self, size):
+        return size
+
+    #This function tells whether an IntegrityError was caused by a duplicate 'id'.
+    def is_duplicate_key(self, error):
+        return error.errno == DUPLICATE_KEY_ERROR
+
+    #This function tells whether an error is only temporary (a lost connection, a lock wait timeout or a deadlock), so the
+    #same statement may succeed if it is run again. Other errors (ie. a value the table refuses) will happen every time.
+    def is_transient(self, error):
+        return (isinstance(error, (mysql.connector.errors.OperationalError, mysql.connector.errors.InterfaceError))
+                or getattr(error, 'errno', None) in RETRYABLE_ERRORS)
+
+    #This function creates the 'sales' table and its indexes if they don't exist yet.
+    def create_schema(self, cxn):
+        cur = cxn.cursor()
+        for statement in self.schema:
+            cur.execute(statement)
+        cur.close()
+
+    #This function adds the search indexes to a 'sales' table created before they existed, in place and without locking the
+    #table. The index on 'store_code' alone is dropped, since the new index starts with the same column.
+    def add_search_indexes(self, cxn):
+        cur = cxn.cursor()
+        cur.execute("SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'sales'")
+        existing = set(row[0] for row in cur.fetchall())
+
+        changes = []
+        if 'idx_sales_store_date' not in existing:
+            changes.append("ADD INDEX idx_sales_store_date (store_code, transaction_date, id)")
+        if 'idx_sales_total_sale' not in existing:
+            changes.append("ADD INDEX idx_sales_total_sale (total_sale, id)")
+        if 'idx_sales_store_code' in existing:
+            changes.append("DROP INDEX idx_sales_store_code")
+        if changes:
+            cur.execute("ALTER TABLE sales " + ', '.join(changes) + ", ALGORITHM=INPLACE, LOCK=NONE")
+        cur.close()
+        return changes
+
+#This class represents the SQLite backend. 'path' is the database file, or ':memory:'.
+class SQLiteBackend:
+
+    name = 'sqlite'
+
+    Error = sqlite3.Error
+    IntegrityError = sqlite3.IntegrityError
+
+    period_sql = {
+        'day': "transaction_date",
+        'week': "date(transaction_date, 'weekday 0', '-6 days')",
+        'month': "date(transaction_date, 'start of month')",
+    }
+
+    #SQLite compares text case-sensitively unless told otherwise. With NOCASE, a store code prefix matches like it does in
+    #MySQL, and 'LIKE' can read the store index (which is built with the same collation).
+    store_code_sql = "store_code COLLATE NOCASE"
+
+    #The declared types 'DATE' and 'DECIMAL' are read back as 'date' and 'Decimal' objects (see the converters below).
+    #The composite index on (transaction_date, id) serves both the date filters and the keyset pagination. The other two
+    #serve the searches by store code and by amount.
+    schema = [
+        '''CREATE TABLE IF NOT EXISTS sales (
+  id INTEGER NOT NULL PRIMARY KEY,
+  store_code VARCHAR(32) NOT NULL,
+  total_sale DECIMAL(12,2) NOT NULL,
+  transaction_date DATE NOT NULL
+)''',
+        "CREATE INDEX IF NOT EXISTS idx_sales_store_date ON sales (store_code COLLATE NOCASE, transaction_date, id)",
+        "CREATE INDEX IF NOT EXISTS idx_sales_transaction_date ON sales (transaction_date, id)",
+        "CREATE INDEX IF NOT EXISTS idx_sales_total_sale ON sales (total_sale, id)",
+        '''CREATE TABLE IF NOT EXISTS sales_daily_summary (
+  transaction_date DATE NOT NULL,
+  store_code VARCHAR(32) NOT NULL,
+  sale_count INTEGER NOT NULL,
+  total_sales DECIMAL(14,2) NOT NULL,
+  min_sale DECIMAL(12,2) NOT NULL,
+  max_sale DECIMAL(12,2) NOT NULL,
+  PRIMARY KEY (transaction_date, store_code)
+) WITHOUT ROWID''',
+    ]
+
+    def __init__(self, path):
+        self.path = path
+        self.keeper = None
+
+        #Every connection to ':memory:' would get its own empty database, so a named in-memory database shared by the
+        #whole process is used instead. It lives as long as at least one connection to it is open.
+        self.uri = None
+        if path == ':memory:':
+            self.uri = 'file:sales_data?mode=memory&cache=shared'
+            self.keeper = self.connect()
+
+    #This function returns the function that opens a connection to a read replica, given as the path of its file.
+    def replica(self, dsn):
+        return SQLiteBackend(dsn).connect
+
+    #A shared in-memory database locks whole tables, so its connections can't be used at the same time.
+    def pool_size(self, size):
+        return 1 if self.keeper is not None else size
+
+    def is_duplicate_key(self, error):
+        return str(error).startswith('UNIQUE constraint failed')
+
+    #SQLite raises an OperationalError when the database is locked by another connection for too long.
+    def is_transient(self, error):
+        return isinstance(error, sqlite3.OperationalError)
+
+    #This function opens a new connection and makes sure the table exists.
+    def connect(self):
+        cxn = sqlite3.connect(self.uri or self.path, uri = self.uri is not None, detect_types = sqlite3.PARSE_DECLTYPES,
+                              timeout = settings.DB_POOL_TIMEOUT, check_same_thread = False, isolation_level = None)
+        if self.uri is None:
+            #Write-ahead logging lets readers carry on while a write is being committed.
+            cxn.execute("PRAGMA journal_mode = WAL")
+            cxn.execute("PRAGMA synchronous = NORMAL")
+        connection = SQLiteConnection(cxn)
+        self.create_schema(connection)
+        logger.info("event=db_connect status=ok backend=sqlite path=%s", self.path)
+        return connection
+
+    def create_schema(self, cxn):
+        cur = cxn.cursor()
+        for statement in self.schema:
+            cur.execute(statement)
+        cur.close()
+
+    #The search indexes are created with the schema on every connection, so only the old index is left to drop.
+    def add_search_indexes(self, cxn):
+        cur = cxn.cursor()
+        cur.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'idx_sales_store_code'")
+        changes = ["DROP INDEX idx_sales_store_code"] if cur.fetchall() else []
+        for statement in changes:
+            cur.execute(statement)
+        cur.close()
+        return changes
+
+#These store dates and amounts as text in SQLite, and turn them back into 'date' and 'Decimal' objects when read.
+#Amounts are stored in a column with numeric affinity (so they can be summed and compared) and rounded back to cents.
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_converter('DATE', lambda value: date.fromisoformat(value.decode()))
+sqlite3.register_converter('DECIMAL', lambda value: Decimal(value.decode()).quantize(Decimal('0.01')))
+
+#This class wraps a SQLite connection so it can be used exactly like a MySQL connection by the CRUD functions.
+class SQLiteConnection:
+
+    def __init__(self, cxn):
+        self.cxn = cxn
+
+    #MySQL cursors return dictionaries when 'dictionary' is True. 'buffered' doesn't matter to SQLite, which reads
+    #rows lazily anyway.
+    def cursor(self, dictionary = False, buffered = True):
+        return SQLiteCursor(self.cxn.cursor(), dictionary)
+
+    #The connection is always in autocommit mode unless a transaction is started explicitly.
+    @property
+    def autocommit(self):
+        return not self.cxn.in_transaction
+
+    @autocommit.setter
+    def autocommit(self, value):
+        pass
+
+    def start_transaction(self):
+        self.cxn.execute("BEGIN")
+
+    def commit(self):
+        self.cxn.commit()
+
+    def rollback(self):
+        self.cxn.rollback()
+
+    #This is used by the pool's health check. An embedded database is always reachable.
+    def ping(self, reconnect = False):
+        self.cxn.execute("SELECT 1")
+
+    def close(self):
+        self.cxn.close()
+
+#This class wraps a SQLite cursor. It accepts queries written with MySQL's '%s' placeholders.
+class SQLiteCursor:
+
+    def __init__(self, cur, dictionary):
+        self.cur = cur
+        self.dictionary = dictionary
+
+    def execute(self, query, values = ()):
+        self.cur.execute(query.replace('%s', '?'), tuple(values))
+
+    def executemany(self, query, values):
+        self.cur.executemany(query.replace('%s', '?'), [tuple(row) for row in values])
+
+    def fetchone(self):
+        row = self.cur.fetchone()
+        return self._row(row) if row is not None else None
+
+    def fetchmany(self, size = 1):
+        return [self._row(row) for row in self.cur.fetchmany(size)]
+
+    def fetchall(self):
+        return [self._row(row) for row in self.cur.fetchall()]
+
+    @property
+    def rowcount(self):
+        return self.cur.rowcount
+
+    @property
+    def lastrowid(self):
+        return self.cur.lastrowid
+
+    def close(self):
+        self.cur.close()
+
+    #This turns a row into a dictionary if the cursor was asked for dictionaries.
+    def _row(self, row):
+        if not self.dictionary:
+            return row
+        return dict(zip([column[0] for column in self.cur.description], row))
+
+#This function creates the backend chosen in 'settings.py'. 'mysql_connect' opens a MySQL connection.
+def create_backend(mysql_connect):
+    if settings.DB_BACKEND == 'mysql':
+        return MySQLBackend(mysql_connect)
+    if settings.DB_BACKEND == 'sqlite':
+        return SQLiteBackend(settings.SQLITE_PATH)
+    raise ValueError("Unknown DB_BACKEND %r, it must be 'mysql' or 'sqlite'" % settings.DB_BACKEND)
+
+#This function reads the rows of the 'sales' table from a MySQL dump (like 'store_data.sql').
+def dump_rows(path):
+    with open(path, encoding = 'utf-8') as file:
+        for line in file:
+            if line.startswith('INSERT INTO'):
+                for id, store_code, total_sale, transaction_date in DUMP_ROW.findall(line):
+                    yield (int(id), store_code, Decimal(total_sale), date.fromisoformat(transaction_date))
+
+#This will fill the configured database from a MySQL dump, or add the search indexes to it.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Fill the configured database from a MySQL dump of the 'sales' table.")
+    action = parser.add_mutually_exclusive_group(required = True)
+    action.add_argument('--load-dump', metavar = 'PATH')
+    action.add_argument('--add-search-indexes', action = 'store_true')
+    args = parser.parse_args()
+
+    from functions.SQL_Connection import get_backend
+    from functions.daily_summary import rebuild
+    backend = get_backend()
+    cxn = backend.connect()
+    backend.create_schema(cxn)
+    if args.add_search_indexes:
+        changes = backend.add_search_indexes(cxn)
+        cxn.close()
+        print(', '.join(changes) if changes else "The search indexes already exist.")
+        raise SystemExit(0)
+    cur = cxn.cursor()
+    rows = list(dump_rows(args.load_dump))
+    cxn.start_transaction()
+    cur.executemany("REPLACE INTO sales (id, store_code, total_sale, transaction_date) VALUES (%s, %s, %s, %s)", rows)
+    cxn.commit()
+    cur.close()
+    rebuild(cxn)
+    cxn.close()
+    print("Loaded %s rows into the %s database." % (len(rows), backend.name))
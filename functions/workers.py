@@ -0,0 +1,65 @@
+'''
+
+This module holds the identity and the statistics of the current process when the app runs in one of the worker processes
+started by the production server (see 'gunicorn.conf.py'), or in the single process of the development server. They are
+shown in '/stats' and '/metrics', so it is possible to tell which worker answered a request and how busy each one is.
+
+'''
+#These are used to identify the process and to count its requests safely across threads.
+import os
+import time
+import threading
+
+#This class holds the identity and the counters of the current process.
+class WorkerInfo:
+
+    def __init__(self, index = None, generation = 0):
+        self.index = index
+        self.generation = generation
+        self.pid = os.getpid()
+        self.started = time.time()
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    #This function counts a request handled by this process.
+    def count_request(self):
+        with self.lock:
+            self.requests += 1
+
+    #This function returns the identity and the counters of this process as a dictionary.
+    def stats(self):
+        with self.lock:
+            return {
+                'index': self.index,
+                'generation': self.generation,
+                'pid': self.pid,
+                'uptime_seconds': round(time.time() - self.started, 1),
+                'requests': self.requests,
+            }
+
+#This is the identity of the current process.
+worker = WorkerInfo()
+
+#This function is called in every worker with its number (from 0) and the number of times the server was reloaded.
+def set_worker(index, generation):
+    global worker
+    worker = WorkerInfo(index, generation)
+
+#This function counts a request handled by the current process.
+def count_request():
+    worker.count_request()
+
+#This function returns the identity and the counters of the current process.
+def worker_stats():
+    return worker.stats()
+
+#This function is called in every worker process right after it is forked from the main process (see 'post_fork()' in
+#'gunicorn.conf.py'). The worker drops the connections, threads and locks it inherited, and starts with its own identity and
+#counters.
+def start_worker(index, generation):
+    from functions import SQL_Connection, query_cache, hot_dataset, ingest
+    SQL_Connection.reset_after_fork()
+    query_cache.reset_after_fork()
+    hot_dataset.reset_after_fork()
+    ingest.reset_after_fork()
+    set_worker(index, generation)
@@ -0,0 +1,102 @@
+'''
+This module is the gunicorn configuration of the production server ('python serve.py', or 'gunicorn "app:create_app()"' run
+from this folder, which reads this file by itself). The main process loads the app once (routes, templates, pandas, the hot
+dataset...) and then forks 'WEB_WORKERS' worker processes, which share the memory of what was loaded before the fork
+(copy-on-write). Each worker opens its own database connections after it is forked, and handles up to 'WEB_THREADS' requests
+at once with a thread each.
+
+Gunicorn restarts any worker that dies, and reacts to these signals sent to the main process:
+
+    - SIGHUP: graceful reload. The configuration is read again, new workers are started, and the old ones finish their
+      requests and exit. The app itself is loaded once, so code changes need a restart (or SIGUSR2, see gunicorn's docs).
+    - SIGTERM: graceful shutdown. The workers finish their requests (for up to 'WEB_GRACEFUL_TIMEOUT' seconds) and exit.
+
+Every worker has its own connection pool ('DB_POOL_SIZE' connections each), query cache and ingestion queue. The version of
+the 'sales' table, used for the ETags of the JSON endpoints, is kept in a small file mapped in the memory of every worker,
+so a write made by one worker changes the ETags of all of them, and the other workers empty their query cache before they
+read it again. '/stats' shows which worker answered, and how many requests it handled.
+'''
+#These are used to share the table version and to lock the ingestion log folders of the workers.
+import gc
+import os
+import fcntl
+import itertools
+import tempfile
+
+#This holds the configuration of the app.
+from functions import settings
+
+bind = settings.WEB_BIND
+workers = max(settings.WEB_WORKERS, 1)
+worker_class = 'gthread'
+threads = settings.WEB_THREADS
+graceful_timeout = int(settings.WEB_GRACEFUL_TIMEOUT)
+keepalive = int(settings.WEB_KEEPALIVE_TIMEOUT)
+
+#The app is loaded in the main process, before the workers are forked, so they share it in memory.
+preload_app = True
+
+#This function runs in the main process once the app is loaded. The workers forked from it share the version of the 'sales'
+#table, so none of them answers '304 Not Modified' after another one wrote.
+def on_starting(server):
+    from functions.query_cache import sales_version
+    fd, path = tempfile.mkstemp(prefix = 'serve-version-')
+    os.unlink(path)
+    sales_version.share(fd)
+
+#This function runs in the main process before the first workers are forked. The objects loaded so far are moved out of the
+#garbage collector's reach, so collections in the workers don't write to (and copy) the memory pages they share.
+def when_ready(server):
+    gc.freeze()
+
+#This function runs in the main process on a reload (SIGHUP). It counts the reloads, which '/stats' shows for every worker.
+def on_reload(server):
+    server.generation = getattr(server, 'generation', 0) + 1
+
+#This function returns the ingestion log folder of the worker with the given number.
+def worker_log_dir(root, index):
+    return os.path.join(root, 'worker-%d' % index)
+
+#This function tells whether an ingestion log folder still holds entries (ie. its worker died before writing them).
+def holds_entries(path):
+    return any(entry.name[:-4].isdigit() and entry.stat().st_size for entry in os.scandir(path) if entry.name.endswith('.log'))
+
+#This function gives a worker an ingestion log folder ('worker-<number>') that no other worker holds, and returns its number.
+#The folders still holding entries are taken first, so a worker that replaces one that died queues its entries again. The
+#folder stays locked until the worker exits.
+def claim_log_dir(root):
+    os.makedirs(root, exist_ok = True)
+    existing = [int(name[7:]) for name in os.listdir(root) if name.startswith('worker-') and name[7:].isdigit()]
+    existing.sort(key = lambda index: (not holds_entries(worker_log_dir(root, index)), index))
+    for index in itertools.chain(existing, itertools.count()):
+        path = worker_log_dir(root, index)
+        os.makedirs(path, exist_ok = True)
+        fd = os.open(os.path.join(path, '.lock'), os.O_RDWR | os.O_CREAT)
+        try:
+            fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return index, path
+        except OSError:
+            os.close(fd)
+
+#This function runs in every worker right after it is forked. The worker drops what it can't share with the main process
+#(connections, threads and locks), opens its own connection pools, and starts its ingestion queue.
+def post_fork(server, worker):
+    from functions import workers as worker_info
+    from functions.SQL_Connection import get_pool, get_replica_pools
+    from functions.ingest import get_ingest_queue
+
+    index, settings.INGEST_LOG_DIR = claim_log_dir(settings.INGEST_LOG_DIR)
+    worker_info.start_worker(index, getattr(server, 'generation', 0))
+    get_pool()
+    get_replica_pools()
+
+    #The queue is started right away, so the entries left in the log by a worker that died are written without waiting for
+    #the next new entry.
+    if settings.INGEST_MODE == 'queue':
+        get_ingest_queue()
+
+#This function runs in every worker when it exits. The entries still queued are written first (for up to
+#'WEB_GRACEFUL_TIMEOUT' seconds), so the log of a worker that was stopped is left empty.
+def worker_exit(server, worker):
+    from functions.ingest import drain_ingest_queue
+    drain_ingest_queue(settings.WEB_GRACEFUL_TIMEOUT)
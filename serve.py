@@ -0,0 +1,43 @@
+'''
+This module is the production entry point of the app. It runs gunicorn with the configuration of 'gunicorn.conf.py': the app
+is loaded once, and 'WEB_WORKERS' worker processes are forked from it, each with its own connection pool.
+
+    SECRET_KEY=... python serve.py --bind 0.0.0.0:5000 --workers 4
+
+This is the same as running gunicorn from this folder (it reads 'gunicorn.conf.py' by itself):
+
+    SECRET_KEY=... gunicorn --bind 0.0.0.0:5000 --workers 4 'app:create_app()'
+
+'kill -HUP <pid>' reloads the configuration and replaces the workers without refusing connections, and 'kill -TERM <pid>'
+stops the workers once their requests are finished.
+'''
+#These are used to read the options.
+import argparse
+import os
+import sys
+
+#This holds the configuration of the app.
+from functions import settings
+
+#This is the folder of the app, where gunicorn finds 'app.py' and 'gunicorn.conf.py'.
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+#This will start the server from the command line.
+def main():
+    parser = argparse.ArgumentParser(description = "Serve the app with several worker processes.")
+    parser.add_argument('--bind', default = settings.WEB_BIND, help = "address to listen on (ie. 0.0.0.0:5000)")
+    parser.add_argument('--workers', type = int, default = settings.WEB_WORKERS, help = "number of worker processes")
+    args = parser.parse_args()
+
+    #The production server needs gunicorn, which only runs on Unix.
+    try:
+        from gunicorn.app.wsgiapp import run
+    except ImportError:
+        sys.exit("The production server needs the 'gunicorn' package: pip install -r requirements.txt")
+
+    sys.argv = ['gunicorn', '--config', os.path.join(ROOT, 'gunicorn.conf.py'), '--chdir', ROOT, '--bind', args.bind,
+                '--workers', str(max(args.workers, 1)), 'app:create_app()']
+    run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+'''
+
+The tests run the app on the SQLite backend, in a database file of their own, so they need no MySQL server and never touch
+the configured database. The settings are read when 'functions.settings' is first imported, so they are set here, before
+any test imports the app. Run the tests with:
+
+    python -m unittest discover tests
+
+'''
+import os
+import tempfile
+
+TEST_DIR = tempfile.mkdtemp(prefix = 'sales-tests-')
+
+os.environ['DB_BACKEND'] = 'sqlite'
+os.environ['SQLITE_PATH'] = os.path.join(TEST_DIR, 'sales.sqlite3')
+os.environ['DB_REPLICAS'] = ''
+os.environ['INGEST_LOG_DIR'] = os.path.join(TEST_DIR, 'ingest_log')
+os.environ['INGEST_MODE'] = 'sync'
+os.environ['HOT_DATASET_ENABLED'] = '0'
+os.environ['TEMPLATE_CACHE_DIR'] = ''
+os.environ['SECRET_KEY'] = 'tests'
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
@@ -0,0 +1,50 @@
+'''
+
+This module contains the helpers shared by the tests: a small, predictable 'sales' table and a clean state (empty query
+cache, read-your-writes window closed) for every test.
+
+'''
+from datetime import date, timedelta
+from decimal import Decimal
+
+from functions import settings
+from functions import SQL_Connection
+from functions.SQL_Connection import pooled_connection
+from functions.query_cache import query_cache
+from functions.crud_functions import add_entries
+
+#This is the first day of the sales made by 'make_rows()'.
+FIRST_DAY = date(2023, 1, 1)
+
+#This function returns 'count' rows for the 'sales' table: ids 1 to 'count', five store codes, amounts that all differ and
+#one date out of ten consecutive days.
+def make_rows(count):
+    return [{'id': id,
+             'store_code': 'TX%03d' % (id % 5 + 1),
+             'total_sale': str(Decimal(id * 7 % 1000) + Decimal('0.25')),
+             'transaction_date': (FIRST_DAY + timedelta(days = id % 10)).isoformat()}
+            for id in range(1, count + 1)]
+
+#This function empties the 'sales' table and its daily summary, fills them with the given rows and empties the query cache.
+def reset_sales(rows = ()):
+    with pooled_connection('reset_sales') as sql_cxn:
+        cur = sql_cxn.cursor()
+        cur.execute("DELETE FROM sales")
+        cur.execute("DELETE FROM sales_daily_summary")
+        cur.close()
+    if rows:
+        add_entries(list(rows))
+    query_cache.clear()
+    SQL_Connection.pin_reads_until(None)
+    SQL_Connection._last_write = 0.0
+
+#This function returns the rows of the 'sales' table as (id, store_code, total_sale, transaction_date) tuples, by id.
+def table_rows(path = None):
+    import sqlite3
+    cxn = sqlite3.connect(path or settings.SQLITE_PATH)
+    try:
+        return [(id, store_code, Decimal(str(total_sale)).quantize(Decimal('0.01')), date.fromisoformat(transaction_date))
+                for id, store_code, total_sale, transaction_date in
+                cxn.execute("SELECT id, store_code, total_sale, transaction_date FROM sales ORDER BY id")]
+    finally:
+        cxn.close()
@@ -0,0 +1,90 @@
+'''
+
+These tests check '/aggregate' against totals computed here from the rows of the 'sales' table, before and after the writes
+that keep the daily summary (which the totals are read from) up to date.
+
+'''
+import unittest
+from datetime import date, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+
+#This sets the test settings before the app is imported (see 'tests/__init__.py').
+import tests
+from tests.support import make_rows, reset_sales, table_rows
+
+from functions.crud_functions import add_entry, edit_entry, delete_entry, add_entries, delete_entries
+from app import app
+
+#These give the start of the period of a date, like the SQL of the storage backends does.
+PERIODS = {
+    'day': lambda day: day,
+    'week': lambda day: day - timedelta(days = day.weekday()),
+    'month': lambda day: day.replace(day = 1),
+}
+
+#This function returns the totals '/aggregate' should answer, computed from the rows of the table.
+def expected_totals(by_store, period, start_date = None, end_date = None):
+    groups = {}
+    for id, store_code, total_sale, transaction_date in table_rows():
+        if start_date is not None and not start_date <= transaction_date <= end_date:
+            continue
+        key = ((store_code,) if by_store else ()) + ((PERIODS[period](transaction_date).isoformat(),) if period else ())
+        groups.setdefault(key, []).append(total_sale)
+
+    totals = []
+    for key, sales in sorted(groups.items()):
+        total = {'sale_count': len(sales), 'total_sales': sum(sales), 'min_sale': min(sales), 'max_sale': max(sales),
+                 'average_sale': (sum(sales) / len(sales)).quantize(Decimal('0.01'), ROUND_HALF_UP)}
+        if by_store:
+            total['store_code'] = key[0]
+        if period:
+            total['period'] = key[-1]
+        totals.append(total)
+    return totals
+
+#This function turns the amounts of a response into 'Decimal' objects, so they compare with the expected ones.
+def decimal_totals(totals):
+    return [{name: Decimal(str(value)) if name.endswith('_sale') or name == 'total_sales' else value
+             for name, value in total.items()} for total in totals]
+
+class AggregateTest(unittest.TestCase):
+
+    def setUp(self):
+        reset_sales(make_rows(60))
+        self.client = app.test_client()
+
+    def assertTotals(self, by_store, period, start_date = None, end_date = None):
+        by = ','.join((['store'] if by_store else []) + ([period] if period else []))
+        url = '/aggregate?by=' + by
+        if start_date is not None:
+            url += '&start_date=%s&end_date=%s' % (start_date, end_date)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(decimal_totals(response.get_json()['data']), expected_totals(by_store, period, start_date, end_date))
+
+    def assertAllTotals(self):
+        for by_store in (False, True):
+            for period in (None, 'day', 'week', 'month'):
+                with self.subTest(by_store = by_store, period = period):
+                    self.assertTotals(by_store, period)
+                    self.assertTotals(by_store, period, date(2023, 1, 3), date(2023, 1, 8))
+
+    def test_totals(self):
+        self.assertAllTotals()
+
+    #Every write updates the summary of the store and day it left as well as the one it went to.
+    def test_totals_after_writes(self):
+        add_entry(100, 'TX009', '12.34', '2023-02-01')
+        edit_entry(1, 'TX009', '99.99', '2023-01-31')
+        delete_entry(2)
+        add_entries([{'id': 101, 'store_code': 'TX001', 'total_sale': '0.01', 'transaction_date': '2023-01-05'}])
+        delete_entries([3, 4])
+        self.assertAllTotals()
+
+    def test_bad_grouping(self):
+        for by in ('day,month', 'country', 'store,store,year'):
+            with self.subTest(by = by):
+                self.assertEqual(self.client.get('/aggregate?by=' + by).status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+'''
+
+These tests check the async mode of 'asgi.py': the routes of 'async_app.py' are served by the Quart app, every other route is
+still served by the Flask app, and the add/edit/delete routes answer like the Flask ones (a redirect to the home page with a
+flashed message that the Flask page then shows). The async data functions need MySQL, so the write is replaced here by a
+coroutine that reports one deleted row.
+
+'''
+import asyncio
+import importlib
+import unittest
+from unittest import mock
+
+#This sets the test settings before the app is imported (see 'tests/__init__.py').
+import tests
+from tests.support import make_rows, reset_sales
+
+from functions import settings
+
+try:
+    import quart, aiomysql, asgiref
+except ImportError:
+    quart = None
+
+#This function sends a request without a body to an ASGI app and returns its status, headers and body.
+def call(app, method, path, headers = ()):
+    scope = {'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': method, 'scheme': 'http',
+             'path': path, 'raw_path': path.encode(), 'root_path': '', 'query_string': b'',
+             'headers': [(name.lower().encode(), value.encode()) for name, value in headers],
+             'client': ('127.0.0.1', 1234), 'server': ('testserver', 80)}
+    messages = []
+
+    async def run():
+        requested = False
+        sent = asyncio.Event()
+
+        #The client disconnects once the whole response is sent.
+        async def receive():
+            nonlocal requested
+            if not requested:
+                requested = True
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            await sent.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            messages.append(message)
+            if message['type'] == 'http.response.body' and not message.get('more_body'):
+                sent.set()
+
+        await app(scope, receive, send)
+
+    asyncio.run(run())
+
+    start = next(message for message in messages if message['type'] == 'http.response.start')
+    headers = {}
+    for name, value in start['headers']:
+        headers.setdefault(name.decode().lower(), []).append(value.decode())
+    body = b''.join(message.get('body', b'') for message in messages if message['type'] == 'http.response.body')
+    return start['status'], headers, body
+
+@unittest.skipUnless(quart, "the async mode needs the packages of 'requirements-async.txt'")
+class AsyncModeTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with mock.patch.object(settings, 'APP_MODE', 'async'):
+            import asgi
+            cls.asgi = importlib.reload(asgi)
+        import async_app
+        cls.async_app = async_app
+
+    def setUp(self):
+        reset_sales(make_rows(20))
+
+    def test_routes_of_the_async_app(self):
+        handles = self.async_app.handles
+        self.assertTrue(handles('/as_jsondict', 'GET'))
+        self.assertTrue(handles('/entry/5', 'GET'))
+        self.assertTrue(handles('/add_entry', 'POST'))
+        self.assertTrue(handles('/delete_entry/5/', 'GET'))
+        self.assertFalse(handles('/', 'GET'))
+        self.assertFalse(handles('/aggregate', 'GET'))
+        self.assertFalse(handles('/export', 'GET'))
+
+        #The Flask app also answers 'GET /edit_entry', which the async app doesn't.
+        self.assertFalse(handles('/edit_entry', 'GET'))
+
+    def test_other_routes_are_served_by_flask(self):
+        status, headers, body = call(self.asgi.app, 'GET', '/')
+        self.assertEqual(status, 200)
+        self.assertIn(b'TX001', body)
+
+        status, headers, body = call(self.asgi.app, 'GET', '/no_such_page')
+        self.assertEqual(status, 404)
+
+    def test_write_redirects_with_a_message(self):
+        async def delete_entry(id):
+            return 1
+
+        with mock.patch.object(self.async_app.async_crud, 'delete_entry', delete_entry):
+            status, headers, body = call(self.asgi.app, 'GET', '/delete_entry/5/')
+        self.assertEqual(status, 302)
+        self.assertEqual(headers['location'], ['/'])
+        cookie = headers['set-cookie'][0].split(';')[0]
+
+        #The message flashed by the Quart app is shown by the home page of the Flask app.
+        status, headers, body = call(self.asgi.app, 'GET', '/', [('Cookie', cookie)])
+        self.assertEqual(status, 200)
+        self.assertIn(b'Your Entry Was Deleted!', body)
+
+if __name__ == '__main__':
+    unittest.main()
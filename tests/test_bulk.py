@@ -0,0 +1,59 @@
+'''
+
+These tests check the bulk routes: every row gets its own result, in the order it was given, and the rows that repeat an id
+of the same request are refused instead of being written (or reported as written) twice.
+
+'''
+import unittest
+
+#This sets the test settings before the app is imported (see 'tests/__init__.py').
+import tests
+from tests.support import make_rows, reset_sales, table_rows
+
+from functions.crud_functions import count_entries
+from app import app
+
+class BulkTest(unittest.TestCase):
+
+    def setUp(self):
+        reset_sales(make_rows(20))
+        self.client = app.test_client()
+
+    def statuses(self, response):
+        self.assertEqual(response.status_code, 200)
+        return [(result['status'], result.get('error')) for result in response.get_json()['results']]
+
+    def test_add_entries(self):
+        rows = [{'id': 100, 'store_code': 'TX001', 'total_sale': '1.00', 'transaction_date': '2023-01-02'},
+                {'id': 100, 'store_code': 'TX002', 'total_sale': '2.00', 'transaction_date': '2023-01-03'},
+                {'id': 5, 'store_code': 'TX001', 'total_sale': '1.00', 'transaction_date': '2023-01-02'},
+                {'id': 101, 'store_code': 'TX001', 'total_sale': 'a lot', 'transaction_date': '2023-01-02'}]
+        response = self.client.post('/bulk/add_entries', json = rows)
+        self.assertEqual(self.statuses(response), [
+            ('ok', None),
+            ('error', "That ID appears more than once in this request!"),
+            ('error', "That ID is already contained within the database!"),
+            ('error', "The total sale must be a number!"),
+        ])
+        self.assertEqual(count_entries(), 21)
+        self.assertEqual(table_rows()[-1][1], 'TX001')
+
+    def test_delete_entries(self):
+        response = self.client.post('/bulk/delete_entries', json = [6, {'id': 6}, {'id': '7'}, 'six', 6000])
+        self.assertEqual(self.statuses(response), [
+            ('ok', None),
+            ('error', "That ID appears more than once in this request!"),
+            ('ok', None),
+            ('error', "The ID must be a whole number!"),
+            ('error', "That ID is not contained within the database!"),
+        ])
+        self.assertEqual(response.get_json()['succeeded'], 2)
+        self.assertEqual([row[0] for row in table_rows()], [id for id in range(1, 21) if id not in (6, 7)])
+
+    def test_delete_entries_csv(self):
+        response = self.client.post('/bulk/delete_entries', data = 'id\n3\n3\n', content_type = 'text/csv')
+        self.assertEqual([status for status, error in self.statuses(response)], ['ok', 'error'])
+        self.assertEqual(count_entries(), 19)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+'''
+
+These tests check the conditional responses of the JSON endpoints (an ETag that changes with every write, and '304 Not
+Modified' for a client that has the current page), and the date-range URLs that made those pages cacheable: the dates are
+read from the URL only, and the old links relying on the session are redirected to the URL with the dates.
+
+'''
+import unittest
+
+#This sets the test settings before the app is imported (see 'tests/__init__.py').
+import tests
+from tests.support import make_rows, reset_sales
+
+from functions import settings
+from functions.crud_functions import add_entry
+from app import app
+
+class ConditionalTest(unittest.TestCase):
+
+    def setUp(self):
+        reset_sales(make_rows(50))
+        self.client = app.test_client()
+
+    def test_etag_and_not_modified(self):
+        for url in ('/as_jsondict?page=2&per_page=20', '/as_list_gdp?start_date=2023-01-02&end_date=2023-01-04', '/entry/5',
+                    '/aggregate?by=store'):
+            with self.subTest(url = url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.headers['Cache-Control'], settings.CACHE_CONTROL)
+                self.assertIsNotNone(response.last_modified)
+
+                repeated = self.client.get(url, headers = {'If-None-Match': response.headers['ETag']})
+                self.assertEqual(repeated.status_code, 304)
+                self.assertEqual(repeated.data, b'')
+                self.assertEqual(repeated.headers['ETag'], response.headers['ETag'])
+
+                since = self.client.get(url, headers = {'If-Modified-Since': response.headers['Last-Modified']})
+                self.assertEqual(since.status_code, 304)
+
+    def test_every_url_has_its_own_etag(self):
+        first = self.client.get('/as_jsondict?page=1').headers['ETag']
+        self.assertNotEqual(self.client.get('/as_jsondict?page=2').headers['ETag'], first)
+
+    def test_write_changes_the_etag(self):
+        response = self.client.get('/as_jsondict')
+        add_entry(100, 'TX001', '1.00', '2023-01-02')
+        changed = self.client.get('/as_jsondict', headers = {'If-None-Match': response.headers['ETag']})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers['ETag'], response.headers['ETag'])
+        self.assertEqual(changed.get_json()['total pages'], 2)
+
+    #A compressed copy of the page has its own ETag, which is matched as well.
+    def test_compressed_etag(self):
+        response = self.client.get('/as_jsondict', headers = {'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertTrue(response.headers['ETag'].endswith('-gzip"'))
+        repeated = self.client.get('/as_jsondict', headers = {'Accept-Encoding': 'gzip',
+                                                              'If-None-Match': response.headers['ETag']})
+        self.assertEqual(repeated.status_code, 304)
+
+class DateRangeUrlTest(unittest.TestCase):
+
+    def setUp(self):
+        reset_sales(make_rows(50))
+        self.client = app.test_client()
+
+    def test_form_redirects_to_the_url(self):
+        response = self.client.post('/select_between_dates', data = {'start_date': '2023-01-02', 'end_date': '2023-01-04'})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.headers['Location'], '/select_between_dates?start_date=2023-01-02&end_date=2023-01-04')
+
+        response = self.client.post('/get_data_type_gdp', data = {'data_type': 'json_dict', 'start_date': '2023-01-02',
+                                                                  'end_date': '2023-01-04'})
+        self.assertEqual(response.headers['Location'], '/as_jsondict_gdp?start_date=2023-01-02&end_date=2023-01-04')
+
+    #Another client with the same URL gets the same page, without a session.
+    def test_url_holds_the_dates(self):
+        url = '/as_jsondict_gdp?start_date=2023-01-02&end_date=2023-01-04'
+        first = self.client.get(url)
+        other = app.test_client().get(url)
+        self.assertEqual(first.get_json(), other.get_json())
+        self.assertEqual({row['transaction_date'] for row in first.get_json()['data']},
+                         {'2023-01-02', '2023-01-03', '2023-01-04'})
+        self.assertNotIn('Set-Cookie', other.headers)
+
+    def test_old_links_use_the_session(self):
+        self.assertEqual(self.client.get('/as_list_gdp').status_code, 400)
+        with self.client.session_transaction() as session:
+            session['start_date'] = '2023-01-02'
+            session['end_date'] = '2023-01-04'
+        response = self.client.get('/as_list_gdp?page=2')
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.headers['Location'], '/as_list_gdp?page=2&start_date=2023-01-02&end_date=2023-01-04')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+'''
+
+These tests check the streaming export: every entry (or every entry of the date range) is sent once, in order, as NDJSON or
+CSV, whatever the size of the chunks it is read in.
+
+'''
+import csv
+import io
+import json
+import unittest
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+#This sets the test settings before the app is imported (see 'tests/__init__.py').
+import tests
+from tests.support import make_rows, reset_sales, table_rows
+
+from functions import settings
+from app import app
+
+class ExportTest(unittest.TestCase):
+
+    def setUp(self):
+        reset_sales(make_rows(45))
+        self.client = app.test_client()
+
+        #The chunks are made small, so the export is sent in several of them.
+        patcher = mock.patch.object(settings, 'EXPORT_CHUNK_SIZE', 10)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_ndjson(self):
+        response = self.client.get('/export')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        rows = [json.loads(line) for line in response.get_data(as_text = True).splitlines()]
+        self.assertEqual([(row['id'], row['store_code'], Decimal(str(row['total_sale'])),
+                           date.fromisoformat(row['transaction_date'])) for row in rows], table_rows())
+
+    def test_csv_date_range(self):
+        response = self.client.get('/export?format=csv&start_date=2023-01-02&end_date=2023-01-04')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Disposition'], 'attachment; filename=sales.csv')
+        rows = list(csv.DictReader(io.StringIO(response.get_data(as_text = True))))
+        expected = sorted((row for row in table_rows() if date(2023, 1, 2) <= row[3] <= date(2023, 1, 4)),
+                          key = lambda row: (row[3], row[0]))
+        self.assertEqual([(int(row['id']), row['store_code'], Decimal(row['total_sale']),
+                           date.fromisoformat(row['transaction_date'])) for row in rows], expected)
+
+    def test_bad_parameters(self):
+        for url in ('/export?format=xml', '/export?start_date=2023-01-02', '/export?start_date=2023-01-05&end_date=2023-01-01'):
+            with self.subTest(url = url):
+                self.assertEqual(self.client.get(url).status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+'''
+
+These tests check that amounts which can't be stored in the DECIMAL(12,2) 'total_sale' column are refused when they are
+parsed, so a bulk write reports them as errors of their own rows instead of failing the whole batch. Run them with:
+
+    python -m unittest discover tests
+
+'''
+import unittest
+from decimal import Decimal
+
+#This sets the test settings before the app is imported (see 'tests/__init__.py').
+import tests
+
+from functions.formatting import parse_total_sale
+from functions.crud_functions import check_rows
+
+class ParseTotalSaleTest(unittest.TestCase):
+
+    def test_valid_amounts(self):
+        self.assertEqual(parse_total_sale('$1,117.77'), Decimal('1117.77'))
+        self.assertEqual(parse_total_sale('9999999999.99'), Decimal('9999999999.99'))
+        self.assertEqual(parse_total_sale(-5), Decimal('-5.00'))
+
+    def test_not_finite(self):
+        for value in ('NaN', 'sNaN', 'Infinity', '-Infinity', float('nan'), float('inf')):
+            with self.subTest(value = value):
+                with self.assertRaises(ValueError):
+                    parse_total_sale(value)
+
+    def test_too_large(self):
+        for value in ('1e20', '-1e20', '10000000000', '9999999999.999', 1e20):
+            with self.subTest(value = value):
+                with self.assertRaises(ValueError):
+                    parse_total_sale(value)
+
+class CheckRowsTest(unittest.TestCase):
+
+    def test_bad_amounts_are_row_errors(self):
+        rows = [{'id': 1, 'store_code': 'TX001', 'total_sale': '10.00', 'transaction_date': '2023-02-12'},
+                {'id': 2, 'store_code': 'TX001', 'total_sale': 'NaN', 'transaction_date': '2023-02-12'},
+                {'id': 3, 'store_code': 'TX001', 'total_sale': 'Infinity', 'transaction_date': '2023-02-12'},
+                {'id': 4, 'store_code': 'TX001', 'total_sale': '1e20', 'transaction_date': '2023-02-12'}]
+        results, valid = check_rows(rows)
+        self.assertEqual(list(valid), [0])
+        self.assertIsNone(results[0])
+        for index in (1, 2, 3):
+            self.assertEqual(results[index]['status'], 'error')
+            self.assertEqual(results[index]['id'], index + 1)
+
+if __name__ == "__main__":
+    unittest.main()
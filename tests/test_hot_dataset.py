@@ -0,0 +1,131 @@
+'''
+
+These tests check that the reads served from the hot dataset return exactly what the same reads return from the database,
+and that the dataset follows the writes made by this process and by another worker process sharing the table version.
+
+'''
+import os
+import tempfile
+import traceback
+import unittest
+from datetime import date
+from decimal import Decimal
+
+#This sets the test settings before the app is imported (see 'tests/__init__.py').
+from tests import TEST_DIR
+from tests.support import make_rows, reset_sales
+
+from functions import settings
+from functions import hot_dataset
+from functions.query_cache import sales_version
+from functions.workers import start_worker
+from functions.crud_functions import (all_entries, entries_by_date, entry_by_id, count_entries, count_entries_by_date,
+                                      entries_page, entries_by_date_page, entries_page_tuples,
+                                      entries_by_date_page_tuples, entries_by_date_tuples, add_entries, edit_entry,
+                                      delete_entry)
+
+class HotDatasetTest(unittest.TestCase):
+
+    #The query cache is turned off, so every read goes to the hot dataset (or to the database when it is turned off).
+    def setUp(self):
+        reset_sales(make_rows(500))
+        self.cache_enabled = settings.QUERY_CACHE_ENABLED
+        self.reconcile_seconds = settings.HOT_DATASET_RECONCILE_SECONDS
+        settings.QUERY_CACHE_ENABLED = False
+        settings.HOT_DATASET_RECONCILE_SECONDS = 3600
+        settings.HOT_DATASET_ENABLED = True
+        hot_dataset._dataset = None
+        self.dataset = hot_dataset.load_hot_dataset()
+
+    def tearDown(self):
+        self.dataset.stop()
+        hot_dataset._dataset = None
+        settings.HOT_DATASET_ENABLED = False
+        settings.QUERY_CACHE_ENABLED = self.cache_enabled
+        settings.HOT_DATASET_RECONCILE_SECONDS = self.reconcile_seconds
+
+    #This function returns the result of a read from the database, bypassing the hot dataset.
+    def database(self, function, *args):
+        settings.HOT_DATASET_ENABLED = False
+        try:
+            return function(*args)
+        finally:
+            settings.HOT_DATASET_ENABLED = True
+
+    def assertMatchesDatabase(self):
+        start, end = date(2023, 1, 3), date(2023, 1, 6)
+        reads = [(all_entries,), (entries_by_date, start, end), (entry_by_id, 7), (entry_by_id, 100000), (count_entries,),
+                 (count_entries_by_date, start, end), (entries_page, 3, 25), (entries_page, 1, 25, 40),
+                 (entries_by_date_page, start, end, 2, 25), (entries_by_date_page, start, end, 1, 25, '2023-01-04_24'),
+                 (entries_page_tuples, 2, 50), (entries_by_date_page_tuples, start, end, 1, 50),
+                 (entries_by_date_tuples, start, end)]
+        for function, *args in reads:
+            with self.subTest(read = function.__name__, args = args):
+                self.assertEqual(function(*args), self.database(function, *args))
+
+    def test_reads_match_the_database(self):
+        self.assertIsNotNone(self.dataset.snapshot)
+        self.assertMatchesDatabase()
+
+    def test_writes_are_applied(self):
+        edit_entry(7, 'ZZ999', '4.56', '2023-01-05')
+        delete_entry(24)
+        add_entries([{'id': 1000, 'store_code': 'TX001', 'total_sale': '1.00', 'transaction_date': '2023-01-04'}])
+        self.assertEqual(entry_by_id(7)['store_code'], 'ZZ999')
+        self.assertMatchesDatabase()
+
+class SharedWriteTest(HotDatasetTest):
+
+    #This process shares the table version with the processes it forks, like the workers of the production server do (see 'gunicorn.conf.py').
+    def setUp(self):
+        super().setUp()
+        self.fd, path = tempfile.mkstemp(dir = TEST_DIR)
+        os.unlink(path)
+        sales_version.share(self.fd)
+
+    def tearDown(self):
+        sales_version.shared.close()
+        sales_version.shared = None
+        sales_version.shared_fd = None
+        sales_version.seen = None
+        sales_version.position = 0
+        os.close(self.fd)
+        super().tearDown()
+
+    #This function runs 'write' in a forked process, which is another worker for this one.
+    def in_other_worker(self, write):
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                start_worker(1, 0)
+                write()
+                code = 0
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                os._exit(code)
+        pid, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+
+    def test_write_in_another_worker(self):
+        settings.QUERY_CACHE_ENABLED = True
+        etag = sales_version.etag('/entry/1')
+        self.assertEqual(entry_by_id(1)['store_code'], 'TX002')
+
+        self.in_other_worker(lambda: edit_entry(1, 'ZZ999', '4.56', '2023-01-05'))
+        self.assertNotEqual(sales_version.etag('/entry/1'), etag)
+        self.assertEqual(entry_by_id(1)['store_code'], 'ZZ999')
+        self.assertEqual(all_entries()[0]['total_sale'], Decimal('4.56'))
+        settings.QUERY_CACHE_ENABLED = False
+        self.assertMatchesDatabase()
+
+    #A write with more ids than the change log holds makes this process reconcile the whole dataset instead.
+    def test_big_write_in_another_worker(self):
+        rows = [dict(row, id = row['id'] + 10000) for row in make_rows(5000)]
+        self.in_other_worker(lambda: add_entries(rows))
+        self.assertEqual(count_entries(), 5500)
+        self.assertMatchesDatabase()
+
+if __name__ == "__main__":
+    unittest.main()
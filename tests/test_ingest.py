@@ -0,0 +1,117 @@
+'''
+
+These tests check the ingestion queue ('functions/ingest.py'): the queued entries are written in batches, a batch that hits
+a temporary error is written again, an entry the database refuses is moved to the dead-letter file without holding up the
+others, and the entries left in the log by a crash are written on the next start.
+
+'''
+import os
+import json
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+#This sets the test settings before the app is imported (see 'tests/__init__.py').
+from tests import TEST_DIR
+from tests.support import make_rows, reset_sales, table_rows
+
+from functions import settings
+from functions import ingest
+from functions.ingest import IngestQueue
+
+class IngestQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        reset_sales()
+        self.log_dir = tempfile.mkdtemp(dir = TEST_DIR, prefix = 'ingest-')
+
+    #This function starts a queue with small batches, so a few entries are written in several of them.
+    def start_queue(self):
+        queue = IngestQueue(self.log_dir, max_size = 100, batch_size = 5, max_latency = 0.05, segment_bytes = 4096)
+        queue.start()
+        self.addCleanup(queue.stop)
+        return queue
+
+    def test_entries_are_written(self):
+        queue = self.start_queue()
+        for row in make_rows(12):
+            queue.submit(row)
+        queue.drain(10)
+
+        self.assertEqual([row[0] for row in table_rows()], list(range(1, 13)))
+        stats = queue.stats()
+        self.assertEqual((stats['accepted'], stats['written'], stats['depth']), (12, 12, 0))
+        self.assertEqual(os.path.getsize(queue.segment_path(queue.segment)), 0)
+
+    def test_invalid_entry_is_refused(self):
+        queue = self.start_queue()
+        with self.assertRaises(ValueError):
+            queue.submit({'id': 1, 'store_code': 'TX001', 'total_sale': 'a lot', 'transaction_date': '2023-01-01'})
+        self.assertEqual(queue.stats()['accepted'], 0)
+
+    #The first write fails as if the database were locked. The batch is written again, and every entry is added once.
+    def test_temporary_error_is_retried(self):
+        real_add_entries = ingest.add_entries
+        calls = []
+        def add_entries(rows, raise_errors = False):
+            calls.append(len(rows))
+            if len(calls) == 1:
+                raise sqlite3.OperationalError('database is locked')
+            return real_add_entries(rows, raise_errors)
+
+        queue = self.start_queue()
+        with mock.patch.object(ingest, 'add_entries', add_entries):
+            with self.assertLogs('functions.ingest', 'ERROR'):
+                for row in make_rows(5):
+                    queue.submit(row)
+                queue.drain(10)
+
+        self.assertEqual(calls[:2], [5, 5])
+        self.assertEqual([row[0] for row in table_rows()], [1, 2, 3, 4, 5])
+        self.assertEqual(queue.stats()['dead_letters'], 0)
+
+    #A trigger makes the database refuse one entry. It goes to the dead-letter file, and the rest of its batch is written.
+    def test_refused_entry_is_dead_lettered(self):
+        cxn = sqlite3.connect(settings.SQLITE_PATH)
+        cxn.execute("CREATE TRIGGER refuse_entry BEFORE INSERT ON sales WHEN NEW.id = 3 BEGIN SELECT RAISE(ABORT, 'refused'); END")
+        cxn.commit()
+        def drop_trigger():
+            cxn.execute("DROP TRIGGER refuse_entry")
+            cxn.commit()
+            cxn.close()
+        self.addCleanup(drop_trigger)
+
+        queue = self.start_queue()
+        with self.assertLogs('functions.ingest', 'ERROR'):
+            for row in make_rows(5):
+                queue.submit(row)
+            queue.drain(10)
+
+        self.assertEqual([row[0] for row in table_rows()], [1, 2, 4, 5])
+        self.assertEqual(queue.stats()['dead_letters'], 1)
+        with open(os.path.join(self.log_dir, 'dead_letter.log'), encoding = 'utf-8') as file:
+            letters = [json.loads(line) for line in file]
+        self.assertEqual([letter['row']['id'] for letter in letters], [3])
+        self.assertIn('refused', letters[0]['error'])
+
+    #The segment left by a crash holds an entry that was already written before it (refused as a duplicate) and a line cut
+    #short by the crash (skipped).
+    def test_leftover_segment_is_replayed(self):
+        rows = make_rows(4)
+        reset_sales(rows[:1])
+        with open(os.path.join(self.log_dir, '00000001.log'), 'w', encoding = 'utf-8') as file:
+            for row in rows:
+                file.write(json.dumps(row) + '\n')
+            file.write('{"id": 5, "store_co')
+
+        with self.assertLogs('functions.ingest', 'WARNING'):
+            queue = self.start_queue()
+            queue.drain(10)
+
+        self.assertEqual([row[0] for row in table_rows()], [1, 2, 3, 4])
+        self.assertEqual(queue.stats()['duplicates'], 1)
+        self.assertNotIn('00000001.log', os.listdir(self.log_dir))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+'''
+
+These tests check the paginated JSON endpoints: the pages read with LIMIT/OFFSET and the ones read by following the keyset
+cursor of the 'next' links hold the same entries, in the same order, and a cursor still picks up right after its entry when
+the entries before it change.
+
+'''
+import unittest
+from datetime import date
+
+#This sets the test settings before the app is imported (see 'tests/__init__.py').
+import tests
+from tests.support import make_rows, reset_sales, table_rows
+
+from functions.crud_functions import delete_entry
+from app import app
+
+#This function returns the ids of the entries of a page, given as dictionaries or as lists.
+def row_ids(data):
+    return [row['id'] if isinstance(row, dict) else row[0] for row in data]
+
+class PaginationTest(unittest.TestCase):
+
+    def setUp(self):
+        reset_sales(make_rows(50))
+        self.client = app.test_client()
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    #This function follows the 'next' links from the given page and returns the ids of every page.
+    def follow(self, url):
+        pages = []
+        while url:
+            body = self.get(url)
+            pages.append(row_ids(body['data']))
+            url = body['links'].get('next')
+        return pages
+
+    def test_cursor_and_offset_pages_match(self):
+        for endpoint in ('/as_jsondict', '/as_list'):
+            with self.subTest(endpoint = endpoint):
+                pages = self.follow(endpoint + '?per_page=7')
+                self.assertEqual(len(pages), 8)
+                self.assertEqual(sum(pages, []), list(range(1, 51)))
+                for number, ids in enumerate(pages, 1):
+                    body = self.get('%s?per_page=7&page=%d' % (endpoint, number))
+                    self.assertEqual(body['total pages'], 8)
+                    self.assertEqual(row_ids(body['data']), ids)
+
+    def test_date_range_pages(self):
+        expected = [row[0] for row in sorted(table_rows(), key = lambda row: (row[3], row[0]))
+                    if date(2023, 1, 3) <= row[3] <= date(2023, 1, 7)]
+        for endpoint in ('/as_jsondict_gdp', '/as_list_gdp'):
+            with self.subTest(endpoint = endpoint):
+                url = endpoint + '?start_date=2023-01-03&end_date=2023-01-07&per_page=4'
+                pages = self.follow(url)
+                self.assertEqual(sum(pages, []), expected)
+                self.assertEqual(row_ids(self.get(url + '&page=3')['data']), pages[2])
+
+    #An entry removed from an earlier page shifts the OFFSET pages, but not the page after a cursor.
+    def test_cursor_survives_earlier_changes(self):
+        first = self.get('/as_jsondict?per_page=10')
+        delete_entry(3)
+        second = self.get(first['links']['next'])
+        self.assertEqual(row_ids(second['data']), list(range(11, 21)))
+
+    def test_links(self):
+        body = self.get('/as_jsondict?per_page=10&page=5')
+        self.assertIn('prev', body['links'])
+        self.assertNotIn('next', body['links'])
+        self.assertIn('per_page=10', body['links']['prev'])
+
+        body = self.get('/as_jsondict_gdp?start_date=2023-01-03&end_date=2023-01-04&per_page=3')
+        self.assertIn('start_date=2023-01-03', body['links']['next'])
+        self.assertIn('after=', body['links']['next'])
+
+    def test_bad_date_cursor(self):
+        response = self.client.get('/as_jsondict_gdp?start_date=2023-01-03&end_date=2023-01-07&page=2&after=nonsense')
+        self.assertEqual(response.status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main()
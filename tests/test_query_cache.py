@@ -0,0 +1,90 @@
+'''
+
+These tests check the query cache: a date-range result is reused until a write touches a date inside its range, results for
+the whole table are removed by every write, and the cache keeps within its limits.
+
+'''
+import unittest
+from datetime import date
+
+#This sets the test settings before the app is imported (see 'tests/__init__.py').
+import tests
+from tests.support import make_rows, reset_sales
+
+from functions import settings
+from functions.query_cache import QueryCache, query_cache
+from functions.crud_functions import all_entries, entries_by_date, count_entries_by_date, add_entry, edit_entry, delete_entry
+
+JANUARY_1, JANUARY_3 = date(2023, 1, 1), date(2023, 1, 3)
+
+class InvalidationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.enabled = settings.QUERY_CACHE_ENABLED
+        settings.QUERY_CACHE_ENABLED = True
+        reset_sales(make_rows(50))
+
+    def tearDown(self):
+        settings.QUERY_CACHE_ENABLED = self.enabled
+
+    #This function tells whether 'read()' is answered from the cache.
+    def is_cached(self, read):
+        hits = query_cache.stats()['hits']
+        read()
+        return query_cache.stats()['hits'] > hits
+
+    def test_repeated_reads_are_cached(self):
+        first = entries_by_date(JANUARY_1, JANUARY_3)
+        self.assertIs(entries_by_date('2023-01-01', '2023-01-03'), first)
+
+    def test_write_outside_the_range(self):
+        entries_by_date(JANUARY_1, JANUARY_3)
+        all_entries()
+        add_entry(100, 'TX001', '1.00', '2023-01-08')
+        self.assertTrue(self.is_cached(lambda: entries_by_date(JANUARY_1, JANUARY_3)))
+        self.assertFalse(self.is_cached(all_entries))
+        self.assertEqual(len(all_entries()), 51)
+
+    def test_write_inside_the_range(self):
+        count = count_entries_by_date(JANUARY_1, JANUARY_3)
+        add_entry(100, 'TX001', '1.00', '2023-01-02')
+        self.assertEqual(count_entries_by_date(JANUARY_1, JANUARY_3), count + 1)
+        self.assertIn(100, [entry['id'] for entry in entries_by_date(JANUARY_1, JANUARY_3)])
+
+    #An entry moved out of a range (or deleted) removes the results of the range it was in as well.
+    def test_edit_and_delete_use_the_old_date(self):
+        self.assertIn(1, [entry['id'] for entry in entries_by_date(date(2023, 1, 2), date(2023, 1, 2))])
+        edit_entry(1, 'TX002', '7.25', '2023-01-09')
+        self.assertNotIn(1, [entry['id'] for entry in entries_by_date(date(2023, 1, 2), date(2023, 1, 2))])
+
+        self.assertIn(2, [entry['id'] for entry in entries_by_date(JANUARY_3, JANUARY_3)])
+        delete_entry(2)
+        self.assertNotIn(2, [entry['id'] for entry in entries_by_date(JANUARY_3, JANUARY_3)])
+
+class LimitsTest(unittest.TestCase):
+
+    def test_least_recently_used_is_evicted(self):
+        cache = QueryCache(max_entries = 2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertEqual([cache.get(key) for key in 'abc'], [(True, 1), (False, None), (True, 3)])
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_results_expire(self):
+        cache = QueryCache(ttl = 0)
+        cache.set('a', 1)
+        self.assertEqual(cache.get('a'), (False, None))
+        self.assertEqual(cache.stats()['expirations'], 1)
+
+    #A result read before a write finished may be out of date, so it isn't stored.
+    def test_result_read_before_a_write_is_not_stored(self):
+        cache = QueryCache()
+        generation = cache.generation
+        cache.invalidate([JANUARY_1])
+        cache.set('a', 1, (JANUARY_1, JANUARY_3), generation)
+        self.assertEqual(cache.get('a'), (False, None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+'''
+
+These tests check the routing of reads between the primary database and a read replica, and that the pages stay cacheable:
+a plain read gets no cookie and no 'Vary: Cookie', and only a write sets the cookie that sends the user's next reads to the
+primary for 'READ_YOUR_WRITES_SECONDS' (after which they go back to the replica).
+
+'''
+import os
+import sqlite3
+import time
+import unittest
+
+#This sets the test settings before the app is imported (see 'tests/__init__.py').
+from tests import TEST_DIR
+from tests.support import make_rows, reset_sales
+
+from functions import settings
+from functions import SQL_Connection
+from app import app, primary_until, PRIMARY_UNTIL_COOKIE
+
+REPLICA_PATH = os.path.join(TEST_DIR, 'replica.sqlite3')
+
+class CacheableReadsTest(unittest.TestCase):
+
+    def setUp(self):
+        reset_sales(make_rows(100))
+        self.client = app.test_client()
+
+    def test_plain_reads_have_no_cookie(self):
+        for url in ('/', '/as_jsondict', '/as_list_gdp?start_date=2023-01-01&end_date=2023-01-05',
+                    '/select_between_dates?start_date=2023-01-01&end_date=2023-01-05'):
+            with self.subTest(url = url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn('Cookie', response.headers.get('Vary', ''))
+                self.assertNotIn('Set-Cookie', response.headers)
+
+    def test_write_sets_the_cookie(self):
+        response = self.client.post('/add_entry', data = {'id': '1000', 'store_code': 'TX001', 'total_sale': '1.00',
+                                                          'transaction_date': '2023-01-01'})
+        self.assertEqual(response.status_code, 302)
+        cookies = response.headers.getlist('Set-Cookie')
+        self.assertTrue(any(cookie.startswith(PRIMARY_UNTIL_COOKIE + '=') for cookie in cookies))
+
+    def test_cookie_is_capped(self):
+        with app.test_request_context(headers = {'Cookie': PRIMARY_UNTIL_COOKIE + '=1e20'}):
+            self.assertLessEqual(primary_until(), time.time() + settings.READ_YOUR_WRITES_SECONDS)
+        with app.test_request_context(headers = {'Cookie': PRIMARY_UNTIL_COOKIE + '=soon'}):
+            self.assertIsNone(primary_until())
+
+class ReplicaRoutingTest(unittest.TestCase):
+
+    #The replica is a copy of the primary taken before the test writes, so it is "behind" by that write. The query cache
+    #is turned off, so every read shows where it was routed.
+    def setUp(self):
+        reset_sales(make_rows(100))
+        primary = sqlite3.connect(settings.SQLITE_PATH)
+        replica = sqlite3.connect(REPLICA_PATH)
+        primary.backup(replica)
+        primary.close()
+        replica.close()
+
+        self.replicas = settings.DB_REPLICAS
+        self.cache_enabled = settings.QUERY_CACHE_ENABLED
+        settings.DB_REPLICAS = [REPLICA_PATH]
+        settings.QUERY_CACHE_ENABLED = False
+        SQL_Connection._replica_pools = None
+
+    def tearDown(self):
+        settings.DB_REPLICAS = self.replicas
+        settings.QUERY_CACHE_ENABLED = self.cache_enabled
+        SQL_Connection._replica_pools = None
+
+    def test_reads_go_to_the_replica(self):
+        self.assertEqual(app.test_client().get('/entry/5').status_code, 200)
+        self.assertEqual(SQL_Connection.get_replica_pools()[0].stats()['checkouts'], 1)
+
+    def test_reads_after_a_write_go_to_the_primary(self):
+        writer = app.test_client()
+        writer.post('/add_entry', data = {'id': '1000', 'store_code': 'TX001', 'total_sale': '1.00',
+                                          'transaction_date': '2023-01-01'})
+
+        #The user who wrote sees the new entry, another user reads the replica, which doesn't have it yet.
+        self.assertEqual(writer.get('/entry/1000').status_code, 200)
+        self.assertEqual(app.test_client().get('/entry/1000').status_code, 404)
+
+    #Once the window has passed, the cookie left by the write doesn't keep the reads on the primary.
+    def test_expired_cookie_reads_the_replica(self):
+        headers = {'Cookie': '%s=%.3f' % (PRIMARY_UNTIL_COOKIE, time.time() - 1)}
+        self.assertEqual(app.test_client().get('/entry/5', headers = headers).status_code, 200)
+        self.assertEqual(SQL_Connection.get_replica_pools()[0].stats()['checkouts'], 1)
+
+    #Inside the window of a write, another user still reads the replica, which may be behind, so the page isn't kept.
+    def test_replica_data_after_a_write_is_not_cached(self):
+        app.test_client().post('/add_entry', data = {'id': '1000', 'store_code': 'TX001', 'total_sale': '1.00',
+                                                     'transaction_date': '2023-01-01'})
+        response = app.test_client().get('/entry/5')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Cache-Control'], 'no-store')
+        self.assertNotIn('ETag', response.headers)
+
+    def test_export_reads_the_replica(self):
+        #The replica is made to hold fewer entries than the primary, so the export shows which one it read.
+        replica = sqlite3.connect(REPLICA_PATH)
+        replica.execute('DELETE FROM sales WHERE id > 10')
+        replica.commit()
+        replica.close()
+
+        response = app.test_client().get('/export')
+        self.assertEqual(len(response.get_data(as_text = True).splitlines()), 10)
+        self.assertGreaterEqual(SQL_Connection.get_replica_pools()[0].stats()['checkouts'], 1)
+
+if __name__ == "__main__":
+    unittest.main()
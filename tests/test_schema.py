@@ -0,0 +1,53 @@
+'''
+
+These tests check what the typed 'sales' table gives the app: amounts and dates are read back as 'Decimal' and 'date'
+objects, they are compared as numbers and dates instead of text (so '2023-10-01' comes after '2023-09-30', and 9.25 is less
+than 10.00), and the primary key refuses a second entry with the same id. The online migration from the TEXT layout
+('functions/migrate_sales.py') only runs on MySQL.
+
+'''
+import unittest
+from datetime import date
+from decimal import Decimal
+
+#This sets the test settings before the app is imported (see 'tests/__init__.py').
+import tests
+from tests.support import reset_sales, table_rows
+
+from functions.crud_functions import entry_by_id, entries_by_date, search_entries, count_search
+from app import app
+
+ROWS = [{'id': 1, 'store_code': 'TX001', 'total_sale': '$1,117.77', 'transaction_date': '2023-10-01'},
+        {'id': 2, 'store_code': 'TX001', 'total_sale': '9.25', 'transaction_date': '2023-09-30'},
+        {'id': 3, 'store_code': 'TX002', 'total_sale': '10.00', 'transaction_date': '2023-12-01'},
+        {'id': 4, 'store_code': 'TX002', 'total_sale': '100', 'transaction_date': '2023-02-15'}]
+
+class TypedSchemaTest(unittest.TestCase):
+
+    def setUp(self):
+        reset_sales(ROWS)
+
+    def test_values_are_typed(self):
+        entry = entry_by_id(1)
+        self.assertEqual(entry['total_sale'], Decimal('1117.77'))
+        self.assertEqual(entry['transaction_date'], date(2023, 10, 1))
+        self.assertEqual(table_rows()[3], (4, 'TX002', Decimal('100.00'), date(2023, 2, 15)))
+
+    def test_dates_compare_as_dates(self):
+        entries = entries_by_date(date(2023, 9, 1), date(2023, 12, 31))
+        self.assertEqual([entry['id'] for entry in entries], [2, 1, 3])
+
+    def test_amounts_compare_as_numbers(self):
+        entries = search_entries(min_total = Decimal('9.50'), per_page = 10)
+        self.assertEqual([entry['id'] for entry in entries], [3, 4, 1])
+        self.assertEqual(count_search(max_total = Decimal('10.00')), (2, False))
+
+    def test_duplicate_id_is_refused(self):
+        response = app.test_client().post('/add_entry', data = {'id': '2', 'store_code': 'TX009', 'total_sale': '1.00',
+                                                                'transaction_date': '2023-01-01'})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(len(table_rows()), 4)
+        self.assertEqual(entry_by_id(2)['store_code'], 'TX001')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+'''
+
+These tests check the search: for every order the results can be listed in (by id, store, date or amount), the pages read by
+following the cursor of the 'next' links and the ones read with '?page=' hold the same entries as the table filtered here,
+in the same order, and the count matches them where the search can be counted.
+
+'''
+import unittest
+from datetime import date
+from decimal import Decimal
+from urllib.parse import urlencode
+
+#This sets the test settings before the app is imported (see 'tests/__init__.py').
+import tests
+from tests.support import make_rows, reset_sales, table_rows
+
+from app import app
+
+#Some entries share a store code holding '_' (which LIKE would treat as a wildcard) and amounts with other entries, so the
+#cursors have to split the store codes correctly and to break ties on the 'id'.
+EXTRA_ROWS = [{'id': id, 'store_code': 'TX_1', 'total_sale': '7.25', 'transaction_date': '2023-01-0%d' % (id % 3 + 2)}
+              for id in range(61, 65)]
+
+#These give the sort key of a (id, store_code, total_sale, transaction_date) row for every order.
+ORDERS = {
+    'id': lambda row: row[0],
+    'store': lambda row: (row[1].upper(), row[3], row[0]),
+    'date': lambda row: (row[3], row[0]),
+    'amount': lambda row: (row[2], row[0]),
+}
+
+#This function returns the ids of the rows of the table matching a search, in the given order.
+def expected_ids(order, store_code = None, id = None, min_total = None, max_total = None, start_date = None, end_date = None):
+    rows = [row for row in table_rows()
+            if (store_code is None or row[1].upper().startswith(store_code.upper()))
+            and (id is None or row[0] == id)
+            and (min_total is None or row[2] >= Decimal(min_total))
+            and (max_total is None or row[2] <= Decimal(max_total))
+            and (start_date is None or row[3] >= date.fromisoformat(start_date))
+            and (end_date is None or row[3] <= date.fromisoformat(end_date))]
+    return [row[0] for row in sorted(rows, key = ORDERS[order])]
+
+class SearchTest(unittest.TestCase):
+
+    def setUp(self):
+        reset_sales(make_rows(60) + EXTRA_ROWS)
+        self.client = app.test_client()
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    #This function follows the 'next' links of a search and returns the ids of every page.
+    def follow(self, url):
+        pages = []
+        while url:
+            body = self.get(url)
+            pages.append([row['id'] for row in body['data']])
+            url = body['links'].get('next')
+        return pages
+
+    def assertSearch(self, order, counted = True, **filters):
+        url = '/as_jsondict_search?' + urlencode(dict(filters, per_page = 6))
+        expected = expected_ids(order, **filters)
+        self.assertEqual(self.get(url)['order'], order)
+
+        pages = self.follow(url)
+        self.assertEqual(sum(pages, []), expected)
+        for number, ids in enumerate(pages, 1):
+            self.assertEqual([row['id'] for row in self.get('%s&page=%d' % (url, number))['data']], ids)
+
+        body = self.get(url)
+        self.assertEqual(body['total results'], len(expected) if counted else None)
+        self.assertFalse(body['more results'])
+
+    def test_orders(self):
+        searches = [
+            ('date', True, {}),
+            ('id', True, {'id': 7}),
+            ('store', True, {'store_code': 'tx00'}),
+            ('store', True, {'store_code': 'TX_'}),
+            ('store', True, {'store_code': 'TX', 'start_date': '2023-01-03', 'end_date': '2023-01-06'}),
+            ('date', True, {'start_date': '2023-01-04', 'end_date': '2023-01-08'}),
+            ('date', False, {'start_date': '2023-01-02', 'end_date': '2023-01-05', 'min_total': '100'}),
+            ('amount', True, {'min_total': '7.25', 'max_total': '300'}),
+            ('amount', True, {'max_total': '50'}),
+        ]
+        for order, counted, filters in searches:
+            with self.subTest(**filters):
+                self.assertSearch(order, counted, **filters)
+
+    def test_bad_search(self):
+        for query in ('after=yesterday', 'min_total=500&max_total=100', 'id=seven', 'start_date=2023-01-05&end_date=2023-01-01'):
+            with self.subTest(query = query):
+                self.assertEqual(self.client.get('/as_jsondict_search?' + query).status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main()